@@ -13,6 +13,7 @@ class AuthConfig(BaseSettings):
     secret_key: str = 'SECRET'
     access_jwt_lifetime: int = 60 * 60
     refresh_jwt_lifetime: int = 24 * 60 * 60
+    token_revocation_channel: str = 'auth:revoked-tokens'
     sql_echo: bool = False
 
     @property
@@ -56,6 +57,10 @@ class RedisConfig(BaseSettings):
     host: str = 'localhost'
     port: int = 6379
 
+    command_timeout_in_seconds: float = 0.5
+    retry_max_tries: int = 3
+    retry_max_time_in_seconds: float = 1
+
 
 class CacheConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix='cache_')
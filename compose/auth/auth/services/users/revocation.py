@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from typing import Annotated
+
+import backoff
+import redis.asyncio as async_redis
+import redis.exceptions
+from fastapi import Depends
+
+from ...core import settings
+from ...db import RedisClientDep
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationNotifier:
+    _redis_client: async_redis.Redis
+
+    def __init__(self, *, redis_client: async_redis.Redis) -> None:
+        self._redis_client = redis_client
+
+    async def notify(self, *, token: str) -> None:
+        # Only a hash of the token is published, services caching user lookups key them the same way
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+
+        try:
+            await self._publish(token_hash)
+
+        # A logout must not hang on Redis, cached lookups of the token still expire on their own
+        except (
+                redis.exceptions.ConnectionError,
+                redis.exceptions.TimeoutError,
+                TimeoutError,
+        ) as e:
+            logger.warning('Token revocation was not published: %s', e)
+
+    @backoff.on_exception(
+        backoff.expo,
+        (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+            TimeoutError,
+        ),
+        max_tries=lambda: settings.redis.retry_max_tries,
+        max_time=lambda: settings.redis.retry_max_time_in_seconds,
+    )
+    async def _publish(self, token_hash: str) -> None:
+        async with asyncio.timeout(settings.redis.command_timeout_in_seconds):
+            await self._redis_client.publish(settings.auth.token_revocation_channel, token_hash)
+
+
+async def get_token_revocation_notifier(redis_client: RedisClientDep) -> TokenRevocationNotifier:
+    return TokenRevocationNotifier(redis_client=redis_client)
+
+
+TokenRevocationNotifierDep = Annotated[TokenRevocationNotifier, Depends(get_token_revocation_notifier)]
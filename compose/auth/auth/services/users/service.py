@@ -38,6 +38,10 @@ from .oauth import (
     InvalidOAuthProvider,
     InvalidStateToken,
 )
+from .revocation import (
+    TokenRevocationNotifier,
+    TokenRevocationNotifierDep,
+)
 from ..extended_users import (
     AbstractExtendedUserService,
     ExtendedUserServiceDep,
@@ -98,17 +102,20 @@ class UserService(AbstractUserService):
     _user_manager: UserManager
     _oauth_service: AbstractOAuthService
     _ext_user_service: AbstractExtendedUserService
+    _token_revocation_notifier: TokenRevocationNotifier
 
     def __init__(self,
                  *,
                  user_manager: UserManager,
                  oauth_service: AbstractOAuthService,
                  auth_backend: AuthenticationBackend,
-                 ext_user_service: AbstractExtendedUserService) -> None:
+                 ext_user_service: AbstractExtendedUserService,
+                 token_revocation_notifier: TokenRevocationNotifier) -> None:
         self._user_manager = user_manager
         self._oauth_service = oauth_service
         self._auth_backend = auth_backend
         self._ext_user_service = ext_user_service
+        self._token_revocation_notifier = token_revocation_notifier
 
     async def login(self, *, request: Request, credentials: OAuth2PasswordRequestForm) -> Response:
         user = await self._user_manager.authenticate(
@@ -118,7 +125,10 @@ class UserService(AbstractUserService):
         return await self._auth_backend.login(user)
 
     async def logout(self, *, user: User, token: str) -> Response:
-        return await self._auth_backend.logout(user=user, token=token)
+        response = await self._auth_backend.logout(user=user, token=token)
+        await self._token_revocation_notifier.notify(token=token)
+
+        return response
 
     async def refresh(self, *, refresh_token: str) -> Response:
         user = await self._auth_backend.authenticate_refresh(
@@ -213,12 +223,14 @@ class UserService(AbstractUserService):
 async def get_user_service(user_manager: UserManagerDep,
                            auth_backend: AuthenticationBackendDep,
                            oauth_service: OAuthServiceDep,
-                           ext_user_service: ExtendedUserServiceDep) -> AbstractUserService:
+                           ext_user_service: ExtendedUserServiceDep,
+                           token_revocation_notifier: TokenRevocationNotifierDep) -> AbstractUserService:
     return UserService(
         user_manager=user_manager,
         auth_backend=auth_backend,
         oauth_service=oauth_service,
         ext_user_service=ext_user_service,
+        token_revocation_notifier=token_revocation_notifier,
     )
 
 
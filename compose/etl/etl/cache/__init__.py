@@ -0,0 +1 @@
+from .invalidators import MoviesCacheInvalidator
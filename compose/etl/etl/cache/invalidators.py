@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+
+import backoff
+import redis
+import redis.commands.core
+import redis.exceptions
+
+# A copy of the script the movies service runs in src/movies/services/cache/backends/redis/cache.py, keep them identical
+INVALIDATE_TAG_SCRIPT = '''
+local keys = redis.call('SMEMBERS', KEYS[1])
+
+for i = 1, #keys, 1000 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 999, #keys)))
+end
+
+redis.call('DEL', KEYS[1])
+
+return #keys
+'''
+
+
+class MoviesCacheInvalidator:
+    _client: redis.Redis
+    _key_prefix: str
+    _key_version: str
+    _channel: str
+    _invalidate_tag_script: redis.commands.core.Script
+
+    def __init__(self,
+                 *,
+                 client: redis.Redis,
+                 key_prefix: str = 'search',
+                 key_version: str = '5.0',
+                 channel: str = 'search:invalidated-indices') -> None:
+        self._client = client
+        self._key_prefix = key_prefix
+        self._key_version = key_version
+        self._channel = channel
+        self._invalidate_tag_script = client.register_script(INVALIDATE_TAG_SCRIPT)
+
+    @backoff.on_exception(backoff.expo, (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+    ))
+    def invalidate_documents(self, *, index_name: str, document_ids: Iterable[uuid.UUID]) -> None:
+        tag_keys = [
+            self._create_document_tag_key(index_name=index_name, document_id=document_id)
+            for document_id in document_ids
+        ]
+
+        if not tag_keys:
+            return
+
+        # New documents can join any search or list page of the index, not only those that contained them
+        tag_keys.append(self._create_index_tag_key(index_name=index_name))
+
+        with self._client.pipeline(transaction=False) as pipeline:
+            for tag_key in tag_keys:
+                self._invalidate_tag_script(keys=[tag_key], client=pipeline)
+
+            # Lets the movies service refresh the data it keeps in memory
+            pipeline.publish(self._channel, index_name)
+            pipeline.execute()
+
+    # Tag keys mirror the tags the movies service registers for cached Elasticsearch queries, see
+    # src/movies/services/search/backends/elasticsearch/query/query.py, so both have to be changed together
+    def _create_document_tag_key(self, *, index_name: str, document_id: uuid.UUID) -> str:
+        # Evicts both the get entries of a document and the search entries containing it
+        return f'{self._key_prefix}:{self._key_version}:tag:document-{index_name}-{document_id}'
+
+    def _create_index_tag_key(self, *, index_name: str) -> str:
+        return f'{self._key_prefix}:{self._key_version}:tag:index-{index_name}'
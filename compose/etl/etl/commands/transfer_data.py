@@ -5,10 +5,12 @@ import time
 from pathlib import Path
 
 import elasticsearch
+import redis
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(BASE_DIR))
 
+from etl.cache import MoviesCacheInvalidator  # noqa: E402
 from etl.extract import (  # noqa: E402
     FilmWorksExtractor,
     GenresExtractor,
@@ -45,7 +47,10 @@ def main() -> None:
 
     with (
         elasticsearch.Elasticsearch(settings.elasticsearch.url) as elasticsearch_client,
+        redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client,
     ):
+        cache_invalidator = MoviesCacheInvalidator(client=redis_client)
+
         etl_pipelines: list[ETLPipeline[Document]] = [
             ETLPipeline[Film](
                 extractor=FilmWorksExtractor(connection_params=postgresql_connection_params),
@@ -55,6 +60,7 @@ def main() -> None:
                     client=elasticsearch_client,
                     index_name='films',
                     index_data=load_index_file(schema_dir / 'films.json'),
+                    cache_invalidator=cache_invalidator,
                 ),
             ),
 
@@ -66,6 +72,7 @@ def main() -> None:
                     client=elasticsearch_client,
                     index_name='genres',
                     index_data=load_index_file(schema_dir / 'genres.json'),
+                    cache_invalidator=cache_invalidator,
                 ),
             ),
 
@@ -77,6 +84,7 @@ def main() -> None:
                     client=elasticsearch_client,
                     index_name='persons',
                     index_data=load_index_file(schema_dir / 'persons.json'),
+                    cache_invalidator=cache_invalidator,
                 ),
             )
         ]
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable
+from collections.abc import Sequence
 
 import backoff
 import elasticsearch
 import elasticsearch.helpers
 
+from ..cache import MoviesCacheInvalidator
 from ..transform import Document
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,7 @@ class ElasticsearchLoader[TDocument: Document]:
     _client: elasticsearch.Elasticsearch
     _index_name: str
     _index_data: dict | None
+    _cache_invalidator: MoviesCacheInvalidator | None
 
     _index_created: bool
 
@@ -23,10 +25,12 @@ class ElasticsearchLoader[TDocument: Document]:
                  *,
                  client: elasticsearch.Elasticsearch,
                  index_name: str,
-                 index_data: dict | None = None) -> None:
+                 index_data: dict | None = None,
+                 cache_invalidator: MoviesCacheInvalidator | None = None) -> None:
         self._client = client
         self._index_name = index_name
         self._index_data = index_data
+        self._cache_invalidator = cache_invalidator
 
         self._index_created = False
 
@@ -34,7 +38,7 @@ class ElasticsearchLoader[TDocument: Document]:
             elasticsearch.ConnectionError,
             elasticsearch.ConnectionTimeout,
     ))
-    def load(self, *, documents: Iterable[TDocument]) -> None:
+    def load(self, *, documents: Sequence[TDocument]) -> None:
         if self._index_data and not self._index_created:
             # noinspection PyArgumentList
             self._create_index()
@@ -51,6 +55,12 @@ class ElasticsearchLoader[TDocument: Document]:
             logger.debug(e.errors)
             raise
 
+        if self._cache_invalidator is not None:
+            self._cache_invalidator.invalidate_documents(
+                index_name=self._index_name,
+                document_ids=(document.id for document in documents),
+            )
+
     @backoff.on_exception(backoff.expo, (
             elasticsearch.ConnectionError,
             elasticsearch.ConnectionTimeout,
@@ -41,10 +41,18 @@ class ElasticsearchSettings(BaseSettings):
         return f'{self.scheme}://{self.host}:{self.port}'
 
 
+class RedisSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='redis_')
+
+    host: str = 'localhost'
+    port: int = 6379
+
+
 # noinspection PyArgumentList
 class Settings(BaseSettings):
     postgresql: PostgreSQLSettings = PostgreSQLSettings()
     elasticsearch: ElasticsearchSettings = ElasticsearchSettings()
+    redis: RedisSettings = RedisSettings()
 
 
 settings = Settings()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import uuid
+
+from fastapi import (
+    APIRouter,
+)
+
+from ....services.auth import (
+    CurrentUserDep,
+)
+from ....services.films import (
+    FilmServiceDep,
+    FilmSummaryResponse,
+)
+from ....services.pagination import (
+    PageParamsDep,
+)
+
+router = APIRouter()
+
+
+@router.get(
+    '/{film_id}/summary',
+    response_model=FilmSummaryResponse,
+    summary='Get an aggregate user rating and user reviews for a film',
+)
+async def get_film_summary(film_id: uuid.UUID,
+                           page_params: PageParamsDep,
+                           film_service: FilmServiceDep,
+                           _current_user: CurrentUserDep) -> FilmSummaryResponse:
+    return await film_service.get_film_summary(film_id=film_id, page_params=page_params)
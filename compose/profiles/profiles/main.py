@@ -7,23 +7,13 @@ from contextlib import asynccontextmanager
 import httpx
 from fastapi import FastAPI, Request, Response, status
 from fastapi.responses import JSONResponse
-from opentelemetry import trace
-from opentelemetry.baggage.propagation import W3CBaggagePropagator
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.propagate import set_global_textmap
-from opentelemetry.propagators.composite import CompositePropagator
-from opentelemetry.propagators.jaeger import JaegerPropagator
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from .api.v1.endpoints import (
     profiles,
     favorites,
     ratings,
     reviews,
+    films,
 )
 from .core import settings, LOGGING
 
@@ -34,6 +24,18 @@ def configure_otel() -> None:
     if not settings.otel.enabled:
         return
 
+    # The telemetry stack is only imported when it is enabled, it is a noticeable share of the start up time
+    from opentelemetry import trace
+    from opentelemetry.baggage.propagation import W3CBaggagePropagator
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.propagate import set_global_textmap
+    from opentelemetry.propagators.composite import CompositePropagator
+    from opentelemetry.propagators.jaeger import JaegerPropagator
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
     resource = Resource(attributes={
         SERVICE_NAME: settings.otel.service_name,
     })
@@ -51,6 +53,19 @@ def configure_otel() -> None:
     ]))
 
 
+def instrument_otel(app: FastAPI, *, excluded_urls: str) -> None:
+    if not settings.otel.enabled:
+        return
+
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+    FastAPIInstrumentor.instrument_app(
+        app,
+        excluded_urls=excluded_urls,
+        http_capture_headers_server_request=['X-Request-Id'],
+    )
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[dict]:
     configure_otel()
@@ -71,11 +86,7 @@ app = FastAPI(
     openapi_url=f'{base_api_prefix}/openapi.json',
     lifespan=lifespan,
 )
-FastAPIInstrumentor.instrument_app(
-    app,
-    excluded_urls=f'{base_api_prefix}/_health',
-    http_capture_headers_server_request=['X-Request-Id'],
-)
+instrument_otel(app, excluded_urls=f'{base_api_prefix}/_health')
 
 
 @app.middleware('http')
@@ -118,3 +129,8 @@ app.include_router(
     prefix=f'{profiles_api_prefix}/reviews',
     tags=['reviews']
 )
+app.include_router(
+    films.router,
+    prefix=f'{profiles_api_prefix}/films',
+    tags=['films']
+)
@@ -0,0 +1,7 @@
+from .models import (
+    FilmSummaryResponse,
+)
+from .service import (
+    AbstractFilmService,
+    FilmServiceDep,
+)
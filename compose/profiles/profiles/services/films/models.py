@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from ..ratings import FilmRatingResponse
+from ..reviews import FilmReviewsResponse
+
+
+class FilmSummaryResponse(BaseModel):
+    rating: FilmRatingResponse
+    reviews: FilmReviewsResponse
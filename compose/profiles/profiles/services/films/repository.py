@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import dataclasses
+import decimal
+import uuid
+from collections.abc import Sequence
+from typing import Annotated, Any
+
+from fastapi import Depends
+from sqlalchemy import (
+    select,
+    func,
+    true,
+    SQLColumnExpression,
+)
+from sqlalchemy.orm import aliased
+
+from ..pagination import (
+    AbstractPaginationService,
+    PaginationServiceDep,
+    PageParams,
+    SortOrder,
+)
+from ...db.sqlalchemy import (
+    AsyncSession,
+    AsyncSessionDep,
+)
+from ...models.sqlalchemy import (
+    Rating,
+    Review,
+)
+
+
+@dataclasses.dataclass(kw_only=True)
+class FilmSummaryResult:
+    rating: decimal.Decimal | None
+    reviews: Sequence[Review]
+    reviews_rating: decimal.Decimal | None
+
+    def __post_init__(self) -> None:
+        if self.rating is not None:
+            self.rating = self.rating.quantize(decimal.Decimal('0.1'), rounding=decimal.ROUND_DOWN)
+
+        if self.reviews_rating is not None:
+            self.reviews_rating = self.reviews_rating.quantize(decimal.Decimal('0.1'), rounding=decimal.ROUND_DOWN)
+
+
+class FilmRepository:
+    _session: AsyncSession
+    _pagination_service: AbstractPaginationService
+
+    def __init__(self,
+                 *,
+                 session: AsyncSession,
+                 pagination_service: AbstractPaginationService) -> None:
+        self._session = session
+        self._pagination_service = pagination_service
+
+    async def get_film_summary(self,
+                               *,
+                               film_id: uuid.UUID,
+                               page_params: PageParams) -> FilmSummaryResult:
+        aggregates_statement = select(
+            select(
+                func.avg(Rating.rating),
+            ).where(
+                Rating.film_id == film_id,
+            ).scalar_subquery().label('rating_avg'),
+            select(
+                func.avg(Review.rating),
+            ).where(
+                Review.film_id == film_id,
+            ).scalar_subquery().label('reviews_rating_avg'),
+        ).subquery()
+
+        reviews_statement = select(Review).where(
+            Review.film_id == film_id,
+        )
+
+        paginator = self._pagination_service.get_paginator(
+            statement=reviews_statement,
+            id_column=Review.id,
+            timestamp_column=Review.modified,
+        )
+        reviews_page_statement = paginator.get_page(page_params=page_params).subquery()
+        page_review = aliased(Review, reviews_page_statement)
+
+        page_order_by_clauses: list[SQLColumnExpression[Any]] = [
+            page_review.modified,
+            page_review.id,
+        ]
+
+        if page_params.sort_order == SortOrder.DESC:
+            page_order_by_clauses = [order_by_clause.desc() for order_by_clause in page_order_by_clauses]
+
+        # The aggregates are joined with the page of reviews, so that a film without reviews
+        # still yields a single row and everything is fetched in one round trip
+        statement = select(
+            aggregates_statement.c.rating_avg,
+            aggregates_statement.c.reviews_rating_avg,
+            page_review,
+        ).select_from(
+            aggregates_statement,
+        ).outerjoin(
+            reviews_page_statement,
+            true(),
+        ).order_by(
+            *page_order_by_clauses,
+        )
+
+        result = await self._session.execute(statement)
+        rows = result.all()
+
+        return FilmSummaryResult(
+            rating=rows[0].rating_avg,
+            reviews=[row[2] for row in rows if row[2] is not None],
+            reviews_rating=rows[0].reviews_rating_avg,
+        )
+
+
+async def get_film_repository(session: AsyncSessionDep,
+                              pagination_service: PaginationServiceDep) -> FilmRepository:
+    return FilmRepository(session=session, pagination_service=pagination_service)
+
+
+FilmRepositoryDep = Annotated[FilmRepository, Depends(get_film_repository)]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import abc
+import uuid
+from typing import Annotated
+
+from fastapi import Depends
+
+from .models import FilmSummaryResponse
+from .repository import (
+    FilmRepository,
+    FilmRepositoryDep,
+)
+from ..auth import (
+    AbstractPermissionService,
+    PermissionServiceDep,
+    AbstractPermissionChecker,
+)
+from ..pagination import (
+    PageParams,
+)
+from ..ratings import FilmRatingResponse
+from ..reviews import (
+    ReadReviewResponse,
+    FilmReviewsResponse,
+)
+from ...models.schemas import (
+    ReviewSchema,
+)
+from ...models.sqlalchemy import (
+    Review,
+)
+
+
+class AbstractFilmService(abc.ABC):
+    @abc.abstractmethod
+    async def get_film_summary(self,
+                               *,
+                               film_id: uuid.UUID,
+                               page_params: PageParams) -> FilmSummaryResponse: ...
+
+
+class FilmService(AbstractFilmService):
+    _repository: FilmRepository
+    _permission_checker: AbstractPermissionChecker
+
+    def __init__(self,
+                 *,
+                 repository: FilmRepository,
+                 permission_service: AbstractPermissionService) -> None:
+        self._repository = repository
+        self._permission_checker = permission_service.get_permission_checker()
+
+    async def get_film_summary(self,
+                               *,
+                               film_id: uuid.UUID,
+                               page_params: PageParams) -> FilmSummaryResponse:
+        await self._permission_checker.check_read_permission()
+
+        film_summary_result = await self._repository.get_film_summary(
+            film_id=film_id,
+            page_params=page_params,
+        )
+
+        return FilmSummaryResponse(
+            rating=FilmRatingResponse(
+                rating=film_summary_result.rating,
+            ),
+            reviews=FilmReviewsResponse(
+                reviews=[
+                    self._get_read_review_response(review=review)
+                    for review in film_summary_result.reviews
+                ],
+                rating=film_summary_result.reviews_rating,
+            ),
+        )
+
+    def _get_read_review_response(self, *, review: Review) -> ReadReviewResponse:
+        review_schema = ReviewSchema.model_validate(review, from_attributes=True)
+        read_review_response_dict = review_schema.model_dump()
+
+        return ReadReviewResponse.model_validate(read_review_response_dict)
+
+
+async def get_film_service(repository: FilmRepositoryDep,
+                           permission_service: PermissionServiceDep) -> AbstractFilmService:
+    return FilmService(repository=repository, permission_service=permission_service)
+
+
+FilmServiceDep = Annotated[AbstractFilmService, Depends(get_film_service)]
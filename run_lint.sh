@@ -33,6 +33,14 @@ run_command() {
     local commands=(
         [mypy]=/opt/app/commands/mypy.sh
         [ruff]=/opt/app/commands/ruff.sh
+        [import_time]=/opt/app/commands/import_time.sh
+        [pytest]=/opt/app/commands/pytest.sh
+    )
+
+    declare -A command_services
+    local command_services=(
+        [import_time]="movies auth profiles"
+        [pytest]="movies"
     )
 
     local services=(
@@ -65,6 +73,15 @@ run_command() {
         exit 1
     fi
 
+    if [[ "${command_services[$command]}" ]]; then
+        read -ra services <<<"${command_services[$command]}"
+        services_set=()
+
+        for _service in "${services[@]}"; do
+            services_set[$_service]=1
+        done
+    fi
+
     local exec_services=()
 
     if [[ "$service" ]]; then
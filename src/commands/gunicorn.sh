@@ -2,8 +2,14 @@
 
 set -e
 
+# Workers write their metrics to a shared directory, files of a previous run would be reported as well
+export PROMETHEUS_MULTIPROC_DIR=${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus-multiproc}
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
 gunicorn \
     movies.main:app \
+    --config python:movies.gunicorn_config \
     --bind 0.0.0.0:8000 \
     --workers "${GUNICORN_WORKERS:-4}" \
     --worker-class uvicorn_worker.UvicornWorker
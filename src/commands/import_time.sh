@@ -0,0 +1,51 @@
+#!/usr/bin/env bash
+
+set -e
+
+BASE_DIR=/opt/app
+APP_MODULE=movies.main
+
+IMPORT_TIME_BUDGET_MS=${IMPORT_TIME_BUDGET_MS:-2000}
+IMPORT_TIME_RUNS=${IMPORT_TIME_RUNS:-5}
+
+LAZY_MODULES_PATTERN='opentelemetry\.(exporter|instrumentation|propagators\.jaeger)'
+
+measure_import_time() {
+    # Top level entries of the report add up to the import time of the whole process, in microseconds
+    awk -F '|' '$3 ~ /^ [^ ]/ { total += $2 } END { print int(total / 1000) }' <<<"$1"
+}
+
+main() {
+    cd "$BASE_DIR"
+    export OTEL_ENABLED=False
+
+    # The first import writes the bytecode cache, which a service container already has
+    python -c "import $APP_MODULE"
+
+    local import_time_report
+    local import_time_ms
+    local min_import_time_ms
+
+    for ((run = 0; run < IMPORT_TIME_RUNS; run++)); do
+        import_time_report=$(python -X importtime -c "import $APP_MODULE" 2>&1 >/dev/null)
+        import_time_ms=$(measure_import_time "$import_time_report")
+
+        if [[ ! "$min_import_time_ms" ]] || ((import_time_ms < min_import_time_ms)); then
+            min_import_time_ms=$import_time_ms
+        fi
+    done
+
+    if grep -qE "$LAZY_MODULES_PATTERN" <<<"$import_time_report"; then
+        echo "Telemetry modules are imported while OpenTelemetry is disabled:"
+        grep -oE "$LAZY_MODULES_PATTERN[a-z_.]*" <<<"$import_time_report" | sort -u
+        exit 1
+    fi
+
+    echo "Import time of $APP_MODULE is $min_import_time_ms ms, the budget is $IMPORT_TIME_BUDGET_MS ms."
+
+    if ((min_import_time_ms > IMPORT_TIME_BUDGET_MS)); then
+        exit 1
+    fi
+}
+
+main "$@"
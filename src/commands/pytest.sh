@@ -0,0 +1,12 @@
+#!/usr/bin/env bash
+
+set -e
+
+BASE_DIR=/opt/app
+
+main() {
+    cd "$BASE_DIR"
+    pytest "$BASE_DIR/tests"
+}
+
+main "$@"
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+from collections.abc import AsyncIterator, Mapping
+
+from starlette.routing import BaseRoute, Match
+from starlette.types import Scope
+
+from ..core.config import AdmissionConfig
+
+
+class AdmissionRejectedError(Exception):
+    pass
+
+
+class AdmissionLimiter:
+    _max_concurrency: int
+    _max_queue_size: int
+    _queue_timeout_in_seconds: float
+
+    _active_count: int
+    _waiters: collections.deque[asyncio.Future[None]]
+
+    def __init__(self, *, max_concurrency: int, max_queue_size: int, queue_timeout_in_seconds: float) -> None:
+        self._max_concurrency = max_concurrency
+        self._max_queue_size = max_queue_size
+        self._queue_timeout_in_seconds = queue_timeout_in_seconds
+
+        self._active_count = 0
+        self._waiters = collections.deque()
+
+    @property
+    def active_count(self) -> int:
+        return self._active_count
+
+    @property
+    def waiting_count(self) -> int:
+        return len(self._waiters)
+
+    @contextlib.asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        await self._acquire()
+
+        try:
+            yield
+
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        if self._active_count < self._max_concurrency and not self._waiters:
+            self._active_count += 1
+            return
+
+        if len(self._waiters) >= self._max_queue_size:
+            raise AdmissionRejectedError
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            async with asyncio.timeout(self._queue_timeout_in_seconds):
+                await waiter
+
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over at the moment the wait ended, so it is passed on
+                self._release()
+            else:
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+
+            if isinstance(e, TimeoutError):
+                raise AdmissionRejectedError
+
+            raise
+
+    def _release(self) -> None:
+        # A finished request hands its slot straight to the oldest waiting one
+        while self._waiters:
+            waiter = self._waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._active_count -= 1
+
+
+class AdmissionController:
+    _config: AdmissionConfig
+    _limiters: dict[str, AdmissionLimiter]
+
+    def __init__(self, *, config: AdmissionConfig) -> None:
+        self._config = config
+        self._limiters = {}
+
+    def get_limiter(self, route_path: str) -> AdmissionLimiter:
+        limiter = self._limiters.get(route_path)
+
+        if limiter is None:
+            limiter = AdmissionLimiter(
+                max_concurrency=self._config.route_max_concurrency.get(route_path, self._config.max_concurrency),
+                max_queue_size=self._config.route_max_queue_size.get(route_path, self._config.max_queue_size),
+                queue_timeout_in_seconds=self._config.queue_timeout_in_seconds,
+            )
+            self._limiters[route_path] = limiter
+
+        return limiter
+
+    def get_limiters(self) -> Mapping[str, AdmissionLimiter]:
+        return dict(self._limiters)
+
+
+def get_route_path(routes: list[BaseRoute], scope: Scope) -> str | None:
+    for route in routes:
+        match, _ = route.matches(scope)
+
+        if match == Match.FULL:
+            return getattr(route, 'path', None)
+
+    return None
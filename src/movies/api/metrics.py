@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import asyncio
+
+from .admission import AdmissionController
+from ..core import settings
+from ..core.metrics import (
+    ADMISSION_ACTIVE_REQUESTS,
+    ADMISSION_WAITING_REQUESTS,
+    UPSTREAM_POOL_ACTIVE_REQUESTS,
+    UPSTREAM_POOL_REQUESTS_PER_CONNECTION,
+    UPSTREAM_POOL_WAITING_REQUESTS,
+)
+from ..services.http import HttpClientRegistry
+
+
+class RuntimeStateSampler:
+    _http_client_registry: HttpClientRegistry
+    _admission_controller: AdmissionController
+
+    def __init__(self,
+                 *,
+                 http_client_registry: HttpClientRegistry,
+                 admission_controller: AdmissionController) -> None:
+        self._http_client_registry = http_client_registry
+        self._admission_controller = admission_controller
+
+    def sample(self) -> None:
+        for target, metrics in self._http_client_registry.get_metrics().items():
+            UPSTREAM_POOL_ACTIVE_REQUESTS.labels(target).set(metrics.active_requests_count)
+            UPSTREAM_POOL_WAITING_REQUESTS.labels(target).set(metrics.waiting_requests_count)
+            UPSTREAM_POOL_REQUESTS_PER_CONNECTION.labels(target).set(metrics.requests_per_connection)
+
+        for route, limiter in self._admission_controller.get_limiters().items():
+            ADMISSION_ACTIVE_REQUESTS.labels(route).set(limiter.active_count)
+            ADMISSION_WAITING_REQUESTS.labels(route).set(limiter.waiting_count)
+
+    async def run(self) -> None:
+        # Sampled off the request path, a scrape may be served by any worker, so each of them reports its own state
+        while True:
+            self.sample()
+            await asyncio.sleep(settings.metrics.runtime_state_interval_in_seconds)
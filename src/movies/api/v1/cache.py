@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections.abc import Callable, Collection, Coroutine
+from http import HTTPStatus
+from typing import Annotated, Any
+
+from fastapi import Request, Response, Depends
+from fastapi.routing import APIRoute
+
+from ...core import settings
+from ...services.auth import CurrentUserDep
+from ...services.cache import (
+    AbstractCacheService,
+    CacheServiceDep,
+    CacheUnavailableError,
+    DEFAULT_TIMEOUT,
+    Parameterizable,
+    ParameterizedCache,
+    get_cache_codec,
+)
+from ...services.search import (
+    SEARCH_CACHE_KEY_PREFIX,
+    SEARCH_CACHE_KEY_VERSION,
+    collect_search_cache_tags,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHED_RESPONSE_HEADERS = ('content-type', 'x-next-page-cursor')
+
+
+class ResponseCacheParams(Parameterizable):
+    _path: str
+    _query_items: list[tuple[str, str]]
+    _permission_class: str
+
+    def __init__(self, *, path: str, query_items: list[tuple[str, str]], permission_class: str) -> None:
+        self._path = path
+        self._query_items = sorted(query_items)
+        self._permission_class = permission_class
+
+    def get_cache_prefix(self) -> str:
+        return 'response'
+
+    def get_cache_params(self) -> dict:
+        return {
+            'path': self._path,
+            'query': self._query_items,
+            'permission_class': self._permission_class,
+        }
+
+
+class ResponseCache:
+    _request: Request
+    _cache: ParameterizedCache[ResponseCacheParams, dict]
+    _params: ResponseCacheParams
+    _timeout: int | None
+    _is_skipped: bool
+
+    def __init__(self, *, request: Request, cache_service: AbstractCacheService, permission_class: str) -> None:
+        self._request = request
+        # Responses share the search cache namespace, so invalidating a document also evicts the responses
+        # that were rendered from it
+        self._cache = ParameterizedCache(
+            cache=cache_service.get_cache(
+                key_prefix=SEARCH_CACHE_KEY_PREFIX,
+                key_version=SEARCH_CACHE_KEY_VERSION,
+            ),
+            codec=get_cache_codec(),
+        )
+        self._params = ResponseCacheParams(
+            path=request.url.path,
+            query_items=request.query_params.multi_items(),
+            permission_class=permission_class,
+        )
+        self._timeout = DEFAULT_TIMEOUT
+        self._is_skipped = False
+
+    def expire_in(self, timeout: int) -> None:
+        self._timeout = timeout
+
+    def skip(self) -> None:
+        self._is_skipped = True
+
+    async def get(self) -> Response | None:
+        try:
+            cache_entry = await self._cache.get(params=self._params)
+
+        except CacheUnavailableError as e:
+            logger.warning('Response cache is unavailable: %r', e.__cause__)
+            return None
+
+        if cache_entry is None or cache_entry.value is None:
+            return None
+
+        return self._create_response(cache_entry.value)
+
+    async def set(self, response: Response, *, tags: Collection[str]) -> Response:
+        if self._is_skipped or response.status_code != HTTPStatus.OK:
+            return response
+
+        body = bytes(response.body)
+        entry = {
+            'etag': create_etag(body),
+            'body': body.decode(),
+            'headers': {
+                name: response.headers[name]
+                for name in CACHED_RESPONSE_HEADERS
+                if name in response.headers
+            },
+        }
+
+        try:
+            await self._cache.set(params=self._params, value=entry, timeout=self._timeout, tags=tags)
+
+        except CacheUnavailableError as e:
+            logger.warning('Response cache is unavailable: %r', e.__cause__)
+
+        return self._create_response(entry)
+
+    def _create_response(self, entry: dict) -> Response:
+        etag = entry['etag']
+
+        if self._is_not_modified(etag):
+            return Response(status_code=HTTPStatus.NOT_MODIFIED, headers={'ETag': etag})
+
+        return Response(
+            content=entry['body'].encode(),
+            headers={
+                **entry['headers'],
+                'ETag': etag,
+            },
+        )
+
+    def _is_not_modified(self, etag: str) -> bool:
+        if_none_match = self._request.headers.get('If-None-Match')
+
+        if if_none_match is None:
+            return False
+
+        # If-None-Match uses the weak comparison, so a W/ prefix sent by a proxy still matches
+        request_etags = [request_etag.strip().removeprefix('W/') for request_etag in if_none_match.split(',')]
+
+        return '*' in request_etags or etag in request_etags
+
+
+class ResponseCacheHit(Exception):
+    response: Response
+
+    def __init__(self, response: Response) -> None:
+        super().__init__()
+        self.response = response
+
+
+class ResponseCacheRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def response_cache_route_handler(request: Request) -> Response:
+            try:
+                with collect_search_cache_tags() as cache_tags:
+                    response = await route_handler(request)
+
+            except ResponseCacheHit as e:
+                return e.response
+
+            response_cache: ResponseCache | None = getattr(request.state, 'response_cache', None)
+
+            if response_cache is None:
+                return response
+
+            return await response_cache.set(response, tags=cache_tags)
+
+        return response_cache_route_handler
+
+
+def create_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+async def get_response_cache(request: Request,
+                             cache_service: CacheServiceDep,
+                             current_user: CurrentUserDep) -> ResponseCache:
+    response_cache = ResponseCache(
+        request=request,
+        cache_service=cache_service,
+        permission_class='superuser' if current_user.is_superuser else 'user',
+    )
+
+    if not settings.redis.response_cache_enabled:
+        response_cache.skip()
+        return response_cache
+
+    response = await response_cache.get()
+
+    # A cached response is returned before the endpoint runs, so neither Elasticsearch nor the search cache is queried
+    if response is not None:
+        raise ResponseCacheHit(response)
+
+    request.state.response_cache = response_cache
+
+    return response_cache
+
+
+ResponseCacheDep = Annotated[ResponseCache, Depends(get_response_cache)]
@@ -1,77 +1,105 @@
 from __future__ import annotations
 
-import enum
+import asyncio
 import uuid
+from collections.abc import AsyncIterator
 from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import (
     Path,
     APIRouter,
+    Depends,
     HTTPException,
 )
 
+from ..cache import (
+    ResponseCacheDep,
+    ResponseCacheRoute,
+    get_response_cache,
+)
 from ..dependencies import PageParamsDep
 from ..models import (
     FilmResponse,
+    FilmResponseListAdapter,
     ExtendedFilmResponse,
-    FilmRatingResponse,
-    FilmReviewsResponse,
+    FilmUsersResponse,
+)
+from ..responses import TypeAdapterResponse
+from ....core import settings
+from ....services import (
+    FilmAccessCounterDep,
+    FilmServiceDep,
+    FilmsPage,
+    create_films_sort,
+)
+from ....services.auth import (
+    CurrentUserDep,
+    TokenDep,
 )
-from ....services import FilmServiceDep
-from ....services.auth import CurrentUserDep
 from ....services.profiles import ProfilesServiceDep
+from ....services.search import InvalidPageCursorError
+
+router = APIRouter(route_class=ResponseCacheRoute)
 
-router = APIRouter()
 
+async def record_film_access(film_id: Annotated[uuid.UUID, Path(alias='uuid')],
+                             film_access_counter: FilmAccessCounterDep,
+                             _current_user: CurrentUserDep) -> AsyncIterator[None]:
+    yield
 
-class SortOrder(enum.StrEnum):
-    ASC = 'asc'
-    DESC = 'desc'
+    # Only served films are counted, a film that is not found raises into the dependency before this point
+    if settings.redis.film_access_counter_enabled:
+        await film_access_counter.record(film_id=film_id)
 
 
 @router.get(
     '/',
     response_model=list[FilmResponse],
+    dependencies=[Depends(get_response_cache)],
     summary='Get a list of films',
-    description='Get a list of films with sorting, pagination and filtering by concrete genre.',
+    description=(
+        'Get a list of films with sorting, pagination and filtering by concrete genre. '
+        'Deep pages can be walked with the page_cursor returned in the X-Next-Page-Cursor header.'
+    ),
 )
 async def get_films_list(*,
                          sort: str = '',
                          genre: uuid.UUID | None = None,
                          page_params: PageParamsDep,
+                         page_cursor: str | None = None,
                          film_service: FilmServiceDep,
-                         _current_user: CurrentUserDep) -> list[FilmResponse]:
-    sort_by = {}
-
-    if sort:
-        is_first_dash = (sort[0] == '-')
-
-        field = sort[1:] if is_first_dash else sort
-        sort = SortOrder.DESC if is_first_dash else SortOrder.ASC
-
-        if field == 'imdb_rating':
-            sort_by = {'field': 'rating', 'order': sort}
-
-    if not sort_by:
-        sort_by = {'field': 'id', 'order': SortOrder.ASC}
+                         response_cache: ResponseCacheDep,
+                         _current_user: CurrentUserDep) -> TypeAdapterResponse:
+    sort_by = create_films_sort(sort)
+
+    # Cursor pages are read from a point in time of a single client
+    if page_cursor is not None:
+        response_cache.skip()
+
+    try:
+        films_page = await film_service.get_list(
+            sort=sort_by,
+            genre_uuid=genre,
+            page_number=page_params.number,
+            page_size=page_params.size,
+            page_cursor=page_cursor,
+        )
 
-    films_list = await film_service.get_list(
-        sort=sort_by,
-        genre_uuid=genre,
-        page_number=page_params.number,
-        page_size=page_params.size,
-    )
+    except InvalidPageCursorError:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Invalid page cursor',
+        )
 
-    return [
-        FilmResponse.model_validate(film, from_attributes=True)
-        for film in films_list
-    ]
+    return create_films_page_response(films_page)
 
 
 @router.get(
     '/{uuid}',
     response_model=ExtendedFilmResponse,
+    # Accesses are counted once the response is served, so that cached responses are counted as well
+    dependencies=[Depends(record_film_access), Depends(get_response_cache)],
     summary='Get a film by UUID',
     description='Get a concrete film by UUID.',
 )
@@ -79,8 +107,19 @@ async def get_film_by_id(*,
                          film_id: Annotated[uuid.UUID, Path(alias='uuid')],
                          film_service: FilmServiceDep,
                          profiles_service: ProfilesServiceDep,
+                         response_cache: ResponseCacheDep,
+                         token: TokenDep,
                          _current_user: CurrentUserDep) -> ExtendedFilmResponse:
-    film = await film_service.get_by_id(film_id)
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            film_users_task = task_group.create_task(profiles_service.get_film_users(film_id=film_id, token=token))
+            film = await film_service.get_by_id(film_id)
+
+            if film is None:
+                film_users_task.cancel()
+
+    except* Exception as e:
+        raise e.exceptions[0]
 
     if film is None:
         raise HTTPException(
@@ -89,23 +128,15 @@ async def get_film_by_id(*,
         )
 
     extended_film_response = ExtendedFilmResponse.model_validate(film, from_attributes=True)
-    film_users_response = extended_film_response.users
-
-    film_rating = await profiles_service.get_film_rating(film_id=film_id)
+    film_users = film_users_task.result()
 
-    if film_rating is not None:
-        film_users_response.rating = FilmRatingResponse.model_validate(
-            film_rating,
-            from_attributes=True,
-        )
-
-    film_reviews = await profiles_service.get_film_reviews(film_id=film_id)
-
-    if film_reviews is not None:
-        film_users_response.reviews = FilmReviewsResponse.model_validate(
-            film_reviews,
-            from_attributes=True,
-        )
+    if film_users is None:
+        # A film without user data is served while profiles is unavailable, but it is not cached
+        response_cache.skip()
+        extended_film_response.users = None
+    else:
+        response_cache.expire_in(settings.profiles.film_users_cache_expire_in_seconds)
+        extended_film_response.users = FilmUsersResponse.model_validate(film_users, from_attributes=True)
 
     return extended_film_response
 
@@ -113,24 +144,47 @@ async def get_film_by_id(*,
 @router.get(
     '/search/',
     response_model=list[FilmResponse],
+    dependencies=[Depends(get_response_cache)],
     summary='Search a film by query',
-    description='Search a film by title with pagination.',
+    description=(
+        'Search a film by title with pagination. '
+        'Deep pages can be walked with the page_cursor returned in the X-Next-Page-Cursor header.'
+    ),
 )
 async def search_films(*,
                        query: str = '',
                        page_params: PageParamsDep,
+                       page_cursor: str | None = None,
                        film_service: FilmServiceDep,
-                       _current_user: CurrentUserDep) -> list[FilmResponse]:
+                       response_cache: ResponseCacheDep,
+                       _current_user: CurrentUserDep) -> TypeAdapterResponse:
     if not query:
-        return []
-
-    films_list = await film_service.search(
-        query=query,
-        page_number=page_params.number,
-        page_size=page_params.size,
-    )
-
-    return [
-        FilmResponse.model_validate(film, from_attributes=True)
-        for film in films_list
-    ]
+        return TypeAdapterResponse([], type_adapter=FilmResponseListAdapter)
+
+    if page_cursor is not None:
+        response_cache.skip()
+
+    try:
+        films_page = await film_service.search(
+            query=query,
+            page_number=page_params.number,
+            page_size=page_params.size,
+            page_cursor=page_cursor,
+        )
+
+    except InvalidPageCursorError:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail='Invalid page cursor',
+        )
+
+    return create_films_page_response(films_page)
+
+
+def create_films_page_response(films_page: FilmsPage) -> TypeAdapterResponse:
+    headers = {}
+
+    if films_page.next_page_cursor is not None:
+        headers['X-Next-Page-Cursor'] = films_page.next_page_cursor
+
+    return TypeAdapterResponse(films_page.films, type_adapter=FilmResponseListAdapter, headers=headers)
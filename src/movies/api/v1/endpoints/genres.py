@@ -15,6 +15,7 @@ from ..models import GenreResponse
 from ....services import GenreServiceDep
 from ....services.auth import CurrentUserDep
 
+# Genres are served from the in-memory snapshot, which is cheaper than a response cache lookup in Redis
 router = APIRouter()
 
 
@@ -7,21 +7,31 @@ from typing import Annotated
 from fastapi import (
     Path,
     APIRouter,
+    Depends,
     HTTPException,
 )
 
+from ..cache import (
+    ResponseCacheRoute,
+    get_response_cache,
+)
 from ..dependencies import PageParamsDep
 from ..models import (
     PersonResponse,
     FilmResponse,
+    FilmResponseListAdapter,
 )
+from ..responses import TypeAdapterResponse
 from ....services import (
     PersonServiceDep,
     FilmServiceDep,
 )
 from ....services.auth import CurrentUserDep
 
-router = APIRouter()
+router = APIRouter(
+    route_class=ResponseCacheRoute,
+    dependencies=[Depends(get_response_cache)],
+)
 
 
 @router.get(
@@ -54,13 +64,10 @@ async def get_person_by_id(*,
 async def get_person_films(*,
                            person_id: Annotated[uuid.UUID, Path(alias='uuid')],
                            film_service: FilmServiceDep,
-                           _current_user: CurrentUserDep) -> list[FilmResponse]:
+                           _current_user: CurrentUserDep) -> TypeAdapterResponse:
     films_list = await film_service.get_list_by_person(person_id)
 
-    return [
-        FilmResponse.model_validate(film, from_attributes=True)
-        for film in films_list
-    ]
+    return TypeAdapterResponse(films_list, type_adapter=FilmResponseListAdapter)
 
 
 @router.get(
@@ -1,5 +1,6 @@
 from .films import (
     FilmResponse,
+    FilmResponseListAdapter,
     ExtendedFilmResponse,
     FilmUsersResponse,
     FilmRatingResponse,
@@ -6,6 +6,7 @@ import uuid
 from pydantic import (
     BaseModel,
     Field,
+    TypeAdapter,
 )
 
 from .base import (
@@ -25,7 +26,7 @@ class ExtendedFilmResponse(FilmResponse):
     directors: list[FilmDirectorResponse]
     actors: list[FilmActorResponse]
     writers: list[FilmWriterResponse]
-    users: FilmUsersResponse = Field(default_factory=lambda: FilmUsersResponse())
+    users: FilmUsersResponse | None = Field(default_factory=lambda: FilmUsersResponse())
 
 
 class FilmGenreResponse(DocumentRelationResponse):
@@ -67,3 +68,6 @@ class ReviewResponse(BaseModel):
     summary: str
     content: str
     rating: decimal.Decimal | None
+
+
+FilmResponseListAdapter = TypeAdapter(list[FilmResponse])
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+
+class TypeAdapterResponse(Response):
+    media_type = 'application/json'
+
+    _type_adapter: TypeAdapter
+
+    def __init__(self,
+                 content: Any,
+                 *,
+                 type_adapter: TypeAdapter,
+                 status_code: int = 200,
+                 headers: Mapping[str, str] | None = None,
+                 background: BackgroundTask | None = None) -> None:
+        self._type_adapter = type_adapter
+        super().__init__(content, status_code=status_code, headers=headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        # Raw documents are validated straight into the response models and dumped in one pass
+        return self._type_adapter.dump_json(self._type_adapter.validate_python(content), by_alias=True)
@@ -0,0 +1,539 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import collections
+import dataclasses
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Annotated, Any, cast
+
+import elasticsearch
+import fakeredis
+import httpx
+import typer
+from elastic_transport import (
+    ApiResponseMeta,
+    HttpHeaders,
+    NodeConfig,
+    ObjectApiResponse,
+)
+from rich.console import Console
+from rich.table import Table
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from movies.api.admission import AdmissionController  # noqa: E402
+from movies.commands.benchmark_cache_codecs import (  # noqa: E402
+    create_film,
+    create_genre,
+)
+from movies.core import settings  # noqa: E402
+from movies.main import (  # noqa: E402
+    app,
+    create_services,
+)
+from movies.services import (  # noqa: E402
+    GenreSnapshot,
+    GenreSnapshotLoader,
+)
+from movies.services.auth import CurrentUserLocalCache  # noqa: E402
+from movies.services.http import (  # noqa: E402
+    HttpClientRegistry,
+    HttpPoolMetrics,
+)
+from movies.services.search.backends.elasticsearch import (  # noqa: E402
+    ElasticsearchBatcher,
+    ElasticsearchSearchBackend,
+)
+
+GENRES_COUNT = 30
+DEFAULT_SEARCH_SIZE = 10
+
+stdout = Console()
+
+
+class CannedElasticsearchClient:
+    _documents: dict[str, list[dict]]
+    _documents_by_id: dict[str, dict[str, dict]]
+    _latency_in_seconds: float
+    _points_in_time: dict[str, str]
+
+    def __init__(self, *, documents: Mapping[str, list[dict]], latency_in_seconds: float) -> None:
+        self._documents = dict(documents)
+        self._documents_by_id = {
+            index: {document['id']: document for document in index_documents}
+            for index, index_documents in documents.items()
+        }
+        self._latency_in_seconds = latency_in_seconds
+        self._points_in_time = {}
+
+    async def get(self, *, index: str, id: str, source: list[str] | None = None) -> ObjectApiResponse:
+        await self._wait()
+        document = self._get(index=index, id=id, source_fields=source)
+
+        if not document['found']:
+            raise elasticsearch.NotFoundError('Not Found', meta=create_response_meta(404), body=document)
+
+        return create_response(document)
+
+    async def mget(self, *, docs: list[dict]) -> ObjectApiResponse:
+        await self._wait()
+
+        return create_response({
+            'docs': [self._get(index=doc['_index'], id=doc['_id'], source_fields=doc.get('_source')) for doc in docs],
+        })
+
+    async def search(self, *, index: str | None = None, body: dict) -> ObjectApiResponse:
+        await self._wait()
+
+        if index is None:
+            # A search over a point in time takes its index from the point in time
+            pit_id = body['pit']['id']
+            response = self._search(index=self._points_in_time[pit_id], body=body)
+            response['pit_id'] = pit_id
+        else:
+            response = self._search(index=index, body=body)
+
+        return create_response(response)
+
+    async def msearch(self, *, searches: list[dict]) -> ObjectApiResponse:
+        await self._wait()
+
+        return create_response({
+            'responses': [
+                self._search(index=header['index'], body=body)
+                for header, body in zip(searches[::2], searches[1::2])
+            ],
+        })
+
+    async def open_point_in_time(self, *, index: str, keep_alive: str) -> ObjectApiResponse:
+        await self._wait()
+        pit_id = f'pit-{len(self._points_in_time)}'
+        self._points_in_time[pit_id] = index
+
+        return create_response({'id': pit_id})
+
+    async def close_point_in_time(self, *, id: str) -> ObjectApiResponse:
+        await self._wait()
+
+        return create_response({'succeeded': True, 'num_freed': 1})
+
+    def _get(self, *, index: str, id: str, source_fields: list[str] | None) -> dict:
+        document = self._documents_by_id[index].get(id)
+
+        if document is None:
+            return {
+                '_index': index,
+                '_id': id,
+                'found': False,
+            }
+
+        return {
+            '_index': index,
+            '_id': id,
+            'found': True,
+            '_source': create_source(document, source_fields=source_fields),
+        }
+
+    def _search(self, *, index: str, body: dict) -> dict:
+        # Canned results ignore the query itself, only the page shape matters for the benchmark
+        search_after = body.get('search_after')
+        offset = body.get('from', 0) if search_after is None else search_after[0] + 1
+        documents = self._documents[index][offset:offset + body.get('size', DEFAULT_SEARCH_SIZE)]
+        source_fields = body.get('_source')
+
+        return {
+            'hits': {
+                'hits': [
+                    {
+                        '_source': create_source(document, source_fields=source_fields),
+                        'sort': [offset + position],
+                    }
+                    for position, document in enumerate(documents)
+                ],
+            },
+        }
+
+    async def _wait(self) -> None:
+        if self._latency_in_seconds:
+            await asyncio.sleep(self._latency_in_seconds)
+
+
+class StubHttpClientRegistry:
+    _clients: dict[str, httpx.AsyncClient]
+
+    def __init__(self, *, handlers: Mapping[str, Callable[[httpx.Request], httpx.Response]]) -> None:
+        self._clients = {
+            name: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            for name, handler in handlers.items()
+        }
+
+    def get_client(self, name: str) -> httpx.AsyncClient:
+        return self._clients[name]
+
+    def get_metrics(self) -> dict[str, HttpPoolMetrics]:
+        return {}
+
+    async def aclose(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+
+
+@dataclasses.dataclass(kw_only=True)
+class BenchmarkEndpoint:
+    name: str
+    weight: float
+    create_url: Callable[[random.Random], str]
+    # Only the page behind the X-Next-Page-Cursor of the created url is measured
+    follow_page_cursor: bool = False
+
+
+@dataclasses.dataclass(kw_only=True)
+class BenchmarkResult:
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    errors_count: int = 0
+
+
+def main(requests_count: Annotated[int, typer.Option('--requests')] = 5000,
+         warmup_requests_count: Annotated[int, typer.Option('--warmup-requests')] = 1000,
+         concurrency: Annotated[int, typer.Option()] = 16,
+         films_count: Annotated[int, typer.Option()] = 1000,
+         backend_latency_in_ms: Annotated[float, typer.Option('--backend-latency-ms')] = 1,
+         response_cache: Annotated[bool, typer.Option()] = settings.redis.response_cache_enabled,
+         seed: Annotated[int, typer.Option()] = 0) -> None:
+    random.seed(seed)
+    settings.redis.response_cache_enabled = response_cache
+    # Every request of the benchmark would be logged otherwise
+    logging.getLogger('httpx').setLevel(logging.WARNING)
+
+    results, duration = asyncio.run(run_benchmark(
+        requests_count=requests_count,
+        warmup_requests_count=warmup_requests_count,
+        concurrency=concurrency,
+        films_count=films_count,
+        backend_latency_in_seconds=backend_latency_in_ms / 1000,
+        seed=seed,
+    ))
+
+    table = Table(title=(
+        f'Movies API, {requests_count} requests, concurrency {concurrency}, '
+        f'backend latency {backend_latency_in_ms} ms, response cache {"on" if response_cache else "off"}'
+    ))
+    table.add_column('Endpoint')
+    table.add_column('Requests', justify='right')
+    table.add_column('Errors', justify='right')
+    table.add_column('Throughput, rps', justify='right')
+    table.add_column('p50, ms', justify='right')
+    table.add_column('p95, ms', justify='right')
+    table.add_column('p99, ms', justify='right')
+
+    total_result = BenchmarkResult()
+
+    for name, result in results.items():
+        add_result_row(table, name=name, result=result, duration=duration)
+        total_result.latencies.extend(result.latencies)
+        total_result.errors_count += result.errors_count
+
+    add_result_row(table, name='total', result=total_result, duration=duration)
+
+    stdout.print(table)
+
+
+async def run_benchmark(*,
+                        requests_count: int,
+                        warmup_requests_count: int,
+                        concurrency: int,
+                        films_count: int,
+                        backend_latency_in_seconds: float,
+                        seed: int) -> tuple[dict[str, BenchmarkResult], float]:
+    genres = [create_genre() for _ in range(GENRES_COUNT)]
+    films = [create_film() for _ in range(films_count)]
+
+    for film in films:
+        film['genres'] = random.sample(genres, k=3)
+        film['genres_names'] = [genre['name'] for genre in film['genres']]
+
+    persons = create_persons(films)
+
+    elasticsearch_client = cast(elasticsearch.AsyncElasticsearch, CannedElasticsearchClient(
+        documents={
+            settings.elasticsearch.index_name_films: films,
+            settings.elasticsearch.index_name_genres: genres,
+            settings.elasticsearch.index_name_persons: persons,
+        },
+        latency_in_seconds=backend_latency_in_seconds,
+    ))
+    redis_client = fakeredis.FakeAsyncRedis()
+    http_client_registry = StubHttpClientRegistry(handlers={
+        'auth': handle_auth_request,
+        'profiles': handle_profiles_request,
+    })
+
+    if settings.elasticsearch.batch_enabled:
+        elasticsearch_batcher = ElasticsearchBatcher(
+            elasticsearch_client=elasticsearch_client,
+            window_in_seconds=settings.elasticsearch.batch_window_in_seconds,
+            max_size=settings.elasticsearch.batch_max_size,
+        )
+    else:
+        elasticsearch_batcher = None
+
+    search_backend = ElasticsearchSearchBackend(
+        elasticsearch_client=elasticsearch_client,
+        batcher=elasticsearch_batcher,
+    )
+    genre_snapshot = GenreSnapshot()
+
+    if settings.elasticsearch.genres_snapshot_enabled:
+        await GenreSnapshotLoader(
+            backend=search_backend,
+            redis_client=redis_client,
+            snapshot=genre_snapshot,
+        ).load()
+
+    # Mirrors the state that the application lifespan provides, with the external services replaced
+    state = {
+        'http_client_registry': http_client_registry,
+        'redis_client': redis_client,
+        'elasticsearch_client': elasticsearch_client,
+        'admission_controller': AdmissionController(config=settings.admission),
+        **create_services(
+            http_client_registry=cast(HttpClientRegistry, http_client_registry),
+            redis_client=redis_client,
+            search_backend=search_backend,
+            current_user_local_cache=CurrentUserLocalCache(max_size=settings.auth.user_local_cache_max_size),
+            genre_snapshot=genre_snapshot,
+        ),
+    }
+    endpoints = create_endpoints(films=films, genres=genres, persons=persons)
+    rng = random.Random(seed)
+
+    try:
+        async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=StatefulApp(app=app, state=state)),
+                base_url='http://movies',
+                headers={
+                    'Authorization': f'Bearer {create_token()}',
+                    'X-Request-Id': 'benchmark',
+                },
+        ) as client:
+            await send_requests(client, endpoints=endpoints, rng=rng, requests_count=warmup_requests_count,
+                                concurrency=concurrency)
+
+            started_at = time.perf_counter()
+            results = await send_requests(client, endpoints=endpoints, rng=rng, requests_count=requests_count,
+                                          concurrency=concurrency)
+            duration = time.perf_counter() - started_at
+
+    finally:
+        await http_client_registry.aclose()
+
+    return results, duration
+
+
+async def send_requests(client: httpx.AsyncClient,
+                        *,
+                        endpoints: list[BenchmarkEndpoint],
+                        rng: random.Random,
+                        requests_count: int,
+                        concurrency: int) -> dict[str, BenchmarkResult]:
+    planned_endpoints = rng.choices(endpoints, weights=[endpoint.weight for endpoint in endpoints], k=requests_count)
+    planned_requests = iter([(endpoint, endpoint.create_url(rng)) for endpoint in planned_endpoints])
+    results: dict[str, BenchmarkResult] = collections.defaultdict(BenchmarkResult)
+
+    async def send() -> None:
+        for endpoint, url in planned_requests:
+            result = results[endpoint.name]
+
+            if endpoint.follow_page_cursor:
+                response = await client.get(url)
+                page_cursor = response.headers.get('X-Next-Page-Cursor')
+
+                if page_cursor is None:
+                    result.errors_count += 1
+                    continue
+
+                url = str(httpx.URL(url).copy_merge_params({'page_cursor': page_cursor}))
+
+            started_at = time.perf_counter()
+            response = await client.get(url)
+            result.latencies.append(time.perf_counter() - started_at)
+
+            if response.status_code != httpx.codes.OK:
+                result.errors_count += 1
+
+    async with asyncio.TaskGroup() as task_group:
+        for _ in range(concurrency):
+            task_group.create_task(send())
+
+    return dict(sorted(results.items()))
+
+
+class StatefulApp:
+    _app: ASGIApp
+    _state: dict[str, Any]
+
+    def __init__(self, *, app: ASGIApp, state: dict[str, Any]) -> None:
+        self._app = app
+        self._state = state
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # ASGI servers hand a shallow copy of the lifespan state to every request
+        scope['state'] = dict(self._state)
+        await self._app(scope, receive, send)
+
+
+def create_endpoints(*, films: list[dict], genres: list[dict], persons: list[dict]) -> list[BenchmarkEndpoint]:
+    # A few films get most of the traffic, as they do in production
+    film_weights = [1 / (rank + 1) for rank in range(len(films))]
+    search_words = [film['title'].split()[0] for film in films[:100]]
+
+    return [
+        BenchmarkEndpoint(
+            name='films list',
+            weight=30,
+            create_url=lambda rng: (
+                f'/api/v1/films/?sort={rng.choice(['', 'imdb_rating', '-imdb_rating'])}'
+                f'&page_number={rng.randint(1, 5)}'
+                + (f'&genre={rng.choice(genres)['id']}' if rng.random() < 0.5 else '')
+            ),
+        ),
+        BenchmarkEndpoint(
+            name='films cursor page',
+            weight=5,
+            create_url=lambda rng: f'/api/v1/films/?sort={rng.choice(['', 'imdb_rating', '-imdb_rating'])}',
+            follow_page_cursor=True,
+        ),
+        BenchmarkEndpoint(
+            name='film detail',
+            weight=40,
+            create_url=lambda rng: f'/api/v1/films/{rng.choices(films, weights=film_weights)[0]['id']}',
+        ),
+        BenchmarkEndpoint(
+            name='film search',
+            weight=15,
+            create_url=lambda rng: f'/api/v1/films/search/?query={rng.choice(search_words)}',
+        ),
+        BenchmarkEndpoint(
+            name='genres list',
+            weight=5,
+            create_url=lambda rng: '/api/v1/genres/',
+        ),
+        BenchmarkEndpoint(
+            name='person detail',
+            weight=5,
+            create_url=lambda rng: f'/api/v1/persons/{rng.choice(persons)['id']}',
+        ),
+        BenchmarkEndpoint(
+            name='person films',
+            weight=5,
+            create_url=lambda rng: f'/api/v1/persons/{rng.choice(persons)['id']}/film/',
+        ),
+    ]
+
+
+def create_response(body: dict) -> ObjectApiResponse:
+    return ObjectApiResponse(body=body, meta=create_response_meta(200))
+
+
+def create_response_meta(status: int) -> ApiResponseMeta:
+    return ApiResponseMeta(
+        status=status,
+        http_version='1.1',
+        headers=HttpHeaders(),
+        duration=0,
+        node=NodeConfig('http', 'elasticsearch', 9200),
+    )
+
+
+def create_source(document: dict, *, source_fields: list[str] | None) -> dict:
+    if source_fields is None:
+        return document
+
+    return {field: document[field] for field in source_fields}
+
+
+def create_persons(films: list[dict]) -> list[dict]:
+    persons: dict[str, dict] = {}
+
+    for film in films:
+        for role in ('directors', 'actors', 'writers'):
+            for film_person in film[role]:
+                person = persons.setdefault(film_person['id'], {
+                    'id': film_person['id'],
+                    'full_name': film_person['full_name'],
+                    'films': [],
+                })
+                person['films'].append({
+                    'id': film['id'],
+                    'roles': [role.removesuffix('s')],
+                })
+
+    return list(persons.values())
+
+
+def create_token() -> str:
+    # Only the expiration time is read by the movies service, the signature is checked by auth
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b'=').decode()
+
+    return '.'.join((
+        encode({'alg': 'HS256', 'typ': 'JWT'}),
+        encode({'sub': 'benchmark', 'exp': int(time.time()) + 60 * 60}),
+        'signature',
+    ))
+
+
+def handle_auth_request(_request: httpx.Request) -> httpx.Response:
+    return httpx.Response(httpx.codes.OK, json={
+        'id': '00000000-0000-0000-0000-000000000001',
+        'login': 'benchmark',
+        'email': None,
+        'is_superuser': False,
+        'permissions': [],
+    })
+
+
+def handle_profiles_request(_request: httpx.Request) -> httpx.Response:
+    return httpx.Response(httpx.codes.OK, json={
+        'rating': {
+            'rating': '7.5',
+        },
+        'reviews': {
+            'reviews': [],
+            'rating': None,
+        },
+    })
+
+
+def add_result_row(table: Table, *, name: str, result: BenchmarkResult, duration: float) -> None:
+    latencies = result.latencies
+
+    if len(latencies) > 1:
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+        p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0
+
+    table.add_row(
+        name,
+        str(len(latencies)),
+        str(result.errors_count),
+        f'{len(latencies) / duration:.0f}',
+        f'{p50 * 1000:.2f}',
+        f'{p95 * 1000:.2f}',
+        f'{p99 * 1000:.2f}',
+    )
+
+
+if __name__ == '__main__':
+    typer.run(main)
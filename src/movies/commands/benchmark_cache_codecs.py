@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Annotated, Any
+
+import redis.asyncio as redis
+import typer
+from rich.console import Console
+from rich.table import Table
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from movies.core.config import settings  # noqa: E402
+from movies.services.cache.codecs import (  # noqa: E402
+    CACHE_SERIALIZERS,
+    CacheCodec,
+)
+
+stdout = Console()
+
+
+def main(films_count: Annotated[int, typer.Option()] = 50,
+         iterations: Annotated[int, typer.Option()] = 200,
+         compression_threshold: Annotated[int, typer.Option()] = settings.redis.cache_compression_threshold or 2048,
+         compression_level: Annotated[int, typer.Option()] = settings.redis.cache_compression_level,
+         redis_usage: Annotated[bool, typer.Option()] = False) -> None:
+    entries = [
+        {
+            'value': [create_film() for _ in range(films_count)],
+            'soft_expires_at': time.time(),
+        },
+        {
+            'value': create_film(),
+            'soft_expires_at': time.time(),
+        },
+    ]
+
+    table = Table(title='Cache codecs')
+    table.add_column('Serializer')
+    table.add_column('Compression threshold')
+    table.add_column('Entry')
+    table.add_column('Size, bytes', justify='right')
+    table.add_column('Encode, µs', justify='right')
+    table.add_column('Decode, µs', justify='right')
+
+    for serializer in CACHE_SERIALIZERS:
+        for threshold in (None, compression_threshold):
+            codec = CacheCodec(
+                serializer=serializer,
+                compression_threshold=threshold,
+                compression_level=compression_level,
+            )
+
+            for entry_name, entry in zip(('search', 'get'), entries):
+                size, encode_time, decode_time = measure_codec(codec=codec, entry=entry, iterations=iterations)
+                table.add_row(
+                    serializer.name,
+                    str(threshold) if threshold is not None else '-',
+                    entry_name,
+                    str(size),
+                    f'{encode_time * 1_000_000:.1f}',
+                    f'{decode_time * 1_000_000:.1f}',
+                )
+
+    stdout.print(table)
+
+    if redis_usage:
+        asyncio.run(print_redis_usage())
+
+
+def measure_codec(*, codec: CacheCodec, entry: Any, iterations: int) -> tuple[int, float, float]:
+    data = codec.encode(entry)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        codec.encode(entry)
+    encode_time = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        codec.decode(data)
+    decode_time = (time.perf_counter() - start) / iterations
+
+    return len(data), encode_time, decode_time
+
+
+async def print_redis_usage() -> None:
+    async with redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client:
+        keys_count = 0
+        memory_usage = 0
+
+        async for key in redis_client.scan_iter(match='search:*', count=1000):
+            keys_count += 1
+            memory_usage += await redis_client.memory_usage(key) or 0
+
+        info = await redis_client.info('memory')
+
+    stdout.print(f'Cache keys: {keys_count}')
+    stdout.print(f'Cache memory usage, bytes: {memory_usage}')
+    stdout.print(f'Redis used memory, bytes: {info["used_memory"]}')
+
+
+def create_film() -> dict:
+    genres = [create_genre() for _ in range(3)]
+    directors = [create_person() for _ in range(2)]
+    actors = [create_person() for _ in range(15)]
+    writers = [create_person() for _ in range(4)]
+
+    return {
+        'id': str(uuid.uuid4()),
+        'title': random_text(words_count=3),
+        'description': random_text(words_count=60),
+        'rating': round(random.uniform(1, 10), 1),
+        'genres_names': [genre['name'] for genre in genres],
+        'directors_names': [person['full_name'] for person in directors],
+        'actors_names': [person['full_name'] for person in actors],
+        'writers_names': [person['full_name'] for person in writers],
+        'genres': genres,
+        'directors': directors,
+        'actors': actors,
+        'writers': writers,
+    }
+
+
+def create_genre() -> dict:
+    return {
+        'id': str(uuid.uuid4()),
+        'name': random_text(words_count=1),
+    }
+
+
+def create_person() -> dict:
+    return {
+        'id': str(uuid.uuid4()),
+        'full_name': random_text(words_count=2),
+    }
+
+
+def random_text(*, words_count: int) -> str:
+    return ' '.join(
+        ''.join(random.choices('abcdefghijklmnopqrstuvwxyz', k=random.randint(3, 10)))
+        for _ in range(words_count)
+    )
+
+
+if __name__ == '__main__':
+    typer.run(main)
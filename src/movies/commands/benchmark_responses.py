@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from rich.console import Console
+from rich.table import Table
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from movies.api.v1.models import (  # noqa: E402
+    FilmResponse,
+    FilmResponseListAdapter,
+)
+from movies.api.v1.responses import TypeAdapterResponse  # noqa: E402
+from movies.commands.benchmark_cache_codecs import create_film  # noqa: E402
+from movies.models import Film  # noqa: E402
+from movies.services.cache import get_cache_codec  # noqa: E402
+
+stdout = Console()
+
+film_response_list_validator = TypeAdapter(list[FilmResponse])
+
+
+def main(films_count: Annotated[int, typer.Option()] = 50,
+         iterations: Annotated[int, typer.Option()] = 500) -> None:
+    codec = get_cache_codec()
+    full_films = [create_film() for _ in range(films_count)]
+    short_films = [
+        {
+            'id': film['id'],
+            'title': film['title'],
+            'rating': film['rating'],
+        }
+        for film in full_films
+    ]
+
+    table = Table(title=f'Film list responses, {films_count} films')
+    table.add_column('Cached documents')
+    table.add_column('Path')
+    table.add_column('Size, bytes', justify='right')
+    table.add_column('CPU per request, µs', justify='right')
+
+    for documents_name, films, is_full in (('full', full_films, True), ('projected', short_films, False)):
+        data = codec.encode(films)
+
+        for path_name, render in (
+                ('models', lambda: render_with_models(codec.decode(data), is_full=is_full)),
+                ('type adapter', lambda: render_with_type_adapter(codec.decode(data))),
+        ):
+            size, cpu_time = measure_render(render=render, iterations=iterations)
+            table.add_row(documents_name, path_name, str(size), f'{cpu_time * 1_000_000:.1f}')
+
+    stdout.print(table)
+
+
+def render_with_models(films: list[dict], *, is_full: bool) -> bytes:
+    # Mirrors the previous endpoint code followed by the response model handling of FastAPI
+    documents: list[dict] | list[Film] = films
+
+    if is_full:
+        documents = [Film(**film) for film in films]
+
+    film_responses = [
+        FilmResponse.model_validate(document, from_attributes=True)
+        for document in documents
+    ]
+    film_responses = film_response_list_validator.validate_python(film_responses, from_attributes=True)
+    content = film_response_list_validator.dump_python(film_responses, mode='json', by_alias=True)
+
+    return bytes(JSONResponse(content).body)
+
+
+def render_with_type_adapter(films: list[dict]) -> bytes:
+    return bytes(TypeAdapterResponse(films, type_adapter=FilmResponseListAdapter).body)
+
+
+def measure_render(*, render: Callable[[], Any], iterations: int) -> tuple[int, float]:
+    size = len(render())
+
+    start = time.process_time()
+    for _ in range(iterations):
+        render()
+    cpu_time = (time.process_time() - start) / iterations
+
+    return size, cpu_time
+
+
+if __name__ == '__main__':
+    typer.run(main)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import functools
+import logging
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Annotated
+
+import elasticsearch
+import redis.asyncio as redis
+import typer
+from rich.console import Console
+from rich.table import Table
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+from movies.core import settings  # noqa: E402
+from movies.services import (  # noqa: E402
+    FilmAccessCounter,
+    create_films_sort,
+)
+from movies.services.cache import SingleFlight  # noqa: E402
+from movies.services.cache.backends.redis import RedisCacheService  # noqa: E402
+from movies.services.search.backends.elasticsearch import ElasticsearchSearchBackend  # noqa: E402
+from movies.services.search.service import SearchService  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+stdout = Console()
+
+
+@dataclasses.dataclass(kw_only=True)
+class WarmingStats:
+    queries_count: int = 0
+    failures_count: int = 0
+    duration_in_seconds: float = 0
+
+
+class CacheWarmer:
+    _search_service: SearchService
+    _semaphore: asyncio.Semaphore
+    _stats: dict[str, WarmingStats]
+
+    def __init__(self, *, search_service: SearchService, concurrency: int) -> None:
+        self._search_service = search_service
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._stats = {}
+
+    @property
+    def stats(self) -> dict[str, WarmingStats]:
+        return self._stats
+
+    async def warm_genres_list(self, *, page_size: int) -> list[dict]:
+        query = self._search_service.create_query().genres_list(page_number=1, page_size=page_size)
+        genres = await self._run('genres list', lambda: self._search_service.search(query=query))
+
+        return genres or []
+
+    async def warm_films_lists(self, *, genres: list[dict], sorts: list[str], page_size: int) -> None:
+        genre_ids = [None, *(uuid.UUID(genre['id']) for genre in genres)]
+
+        async with asyncio.TaskGroup() as task_group:
+            for genre_id in genre_ids:
+                for sort in sorts:
+                    query = self._search_service.create_query().films_list(
+                        sort=create_films_sort(sort),
+                        page_number=1,
+                        page_size=page_size,
+                        genre_id=genre_id,
+                    )
+                    task_group.create_task(self._run(
+                        'films lists',
+                        functools.partial(self._search_service.search_page, query=query),
+                    ))
+
+    async def warm_films(self, *, film_ids: list[uuid.UUID]) -> None:
+        async with asyncio.TaskGroup() as task_group:
+            for film_id in film_ids:
+                query = self._search_service.create_query().get_film(film_id=film_id)
+                task_group.create_task(self._run(
+                    'most accessed films',
+                    functools.partial(self._search_service.get, query=query),
+                ))
+
+    async def _run[TResult](self, name: str, load: Callable[[], Awaitable[TResult]]) -> TResult | None:
+        stats = self._stats.setdefault(name, WarmingStats())
+
+        async with self._semaphore:
+            started_at = time.monotonic()
+            stats.queries_count += 1
+
+            try:
+                return await load()
+
+            # A single failed query must not stop the rest of the cache from being warmed
+            except Exception as e:
+                stats.failures_count += 1
+                logger.exception(e)
+                return None
+
+            finally:
+                stats.duration_in_seconds += time.monotonic() - started_at
+
+
+async def warm_cache(*,
+                     sorts: list[str],
+                     page_size: int,
+                     most_accessed_films: int,
+                     concurrency: int) -> dict[str, WarmingStats]:
+    async with (
+        redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client,
+        elasticsearch.AsyncElasticsearch(settings.elasticsearch.url) as elasticsearch_client,
+    ):
+        search_service = SearchService(
+            backend=ElasticsearchSearchBackend(elasticsearch_client=elasticsearch_client),
+            cache_service=RedisCacheService(redis_client=redis_client),
+            single_flight=SingleFlight(),
+        )
+        cache_warmer = CacheWarmer(search_service=search_service, concurrency=concurrency)
+        film_access_counter = FilmAccessCounter(redis_client=redis_client)
+
+        genres = await cache_warmer.warm_genres_list(page_size=page_size)
+        film_ids = await film_access_counter.get_most_accessed(limit=most_accessed_films)
+
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(cache_warmer.warm_films_lists(genres=genres, sorts=sorts, page_size=page_size))
+            task_group.create_task(cache_warmer.warm_films(film_ids=film_ids))
+
+        return cache_warmer.stats
+
+
+def main(sorts: Annotated[list[str], typer.Option('--sort')] = ['id', '-imdb_rating', 'imdb_rating'],
+         page_size: Annotated[int, typer.Option()] = 50,
+         most_accessed_films: Annotated[int, typer.Option()] = settings.redis.cache_warming_most_accessed_films,
+         concurrency: Annotated[int, typer.Option()] = settings.redis.cache_warming_concurrency) -> None:
+    started_at = time.monotonic()
+    stats = asyncio.run(warm_cache(
+        sorts=sorts,
+        page_size=page_size,
+        most_accessed_films=most_accessed_films,
+        concurrency=concurrency,
+    ))
+
+    table = Table(title=f'Cache warming, {time.monotonic() - started_at:.2f} s')
+    table.add_column('Queries')
+    table.add_column('Count', justify='right')
+    table.add_column('Failed', justify='right')
+    table.add_column('Total time, s', justify='right')
+
+    for name, query_stats in stats.items():
+        table.add_row(
+            name,
+            str(query_stats.queries_count),
+            str(query_stats.failures_count),
+            f'{query_stats.duration_in_seconds:.2f}',
+        )
+
+    stdout.print(table)
+
+
+if __name__ == '__main__':
+    typer.run(main)
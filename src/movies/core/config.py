@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from typing import Literal
 from urllib.parse import urljoin
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -10,6 +11,7 @@ class ProjectConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix='project_')
 
     name: str = 'movies'
+    request_timeout_in_seconds: float | None = 5
 
 
 class OpenTelemetryConfig(BaseSettings):
@@ -26,7 +28,32 @@ class RedisConfig(BaseSettings):
 
     host: str = 'localhost'
     port: int = 6379
+    command_timeout_in_seconds: float = 0.25
+    retry_max_tries: int = 3
+    retry_max_time_in_seconds: float = 0.25
+    retry_base_wait_in_seconds: float = 0.02
+    retry_max_wait_in_seconds: float = 0.1
+    circuit_breaker_window_in_seconds: float = 10
+    circuit_breaker_min_calls: int = 20
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_slow_call_in_seconds: float = 0.1
+    circuit_breaker_slow_call_rate: float = 0.8
+    circuit_breaker_open_in_seconds: float = 5
     cache_expire_in_seconds: int = 60 * 5
+    cache_soft_expire_in_seconds: int | None = 60
+    cache_negative_expire_in_seconds: int | None = 10
+    cache_serializer: Literal['json', 'orjson', 'msgpack'] = 'orjson'
+    cache_compression_threshold: int | None = 2048
+    cache_compression_level: int = 3
+    cache_lock_enabled: bool = False
+    cache_lock_timeout_in_seconds: float = 10
+    cache_lock_wait_in_seconds: float = 0.5
+    response_cache_enabled: bool = True
+    invalidation_channel: str = 'search:invalidated-indices'
+    film_access_counter_enabled: bool = True
+    film_access_window_in_hours: int = 24
+    cache_warming_concurrency: int = 8
+    cache_warming_most_accessed_films: int = 100
 
 
 class ElasticConfig(BaseSettings):
@@ -36,22 +63,58 @@ class ElasticConfig(BaseSettings):
     host: str = 'localhost'
     port: int = 9200
 
+    retry_max_tries: int = 3
+    retry_max_time_in_seconds: float = 2
+    retry_base_wait_in_seconds: float = 0.05
+    retry_max_wait_in_seconds: float = 0.5
+
     index_name_films: str = 'films'
     index_name_genres: str = 'genres'
     index_name_persons: str = 'persons'
 
+    point_in_time_keep_alive: str = '1m'
+
+    batch_enabled: bool = True
+    batch_window_in_seconds: float = 0.002
+    batch_max_size: int = 64
+
+    person_films_concurrency: int = 16
+
+    genres_snapshot_enabled: bool = True
+    genres_snapshot_refresh_in_seconds: float = 60
+    genres_snapshot_max_size: int = 1000
+
     @property
     def url(self) -> str:
         return f'{self.scheme}://{self.host}:{self.port}'
 
 
-class AuthConfig(BaseSettings):
+class HttpClientConfig(BaseSettings):
+    http2: bool = True
+    timeout_in_seconds: float = 5
+    connect_timeout_in_seconds: float = 1
+    pool_timeout_in_seconds: float = 1
+    pool_max_connections: int = 100
+    pool_max_keepalive_connections: int = 20
+    pool_keepalive_expiry_in_seconds: float = 30
+
+
+class AuthConfig(HttpClientConfig):
     model_config = SettingsConfigDict(env_prefix='auth_')
 
     scheme: str = 'http'
     host: str = 'localhost'
     port: int = 8000
 
+    redis_host: str = 'localhost'
+    redis_port: int = 6379
+    token_revocation_channel: str = 'auth:revoked-tokens'
+
+    user_cache_enabled: bool = True
+    user_cache_expire_in_seconds: int = 60
+    user_local_cache_expire_in_seconds: float = 5
+    user_local_cache_max_size: int = 10000
+
     @property
     def oauth2_token_url(self) -> str:
         return '/auth/api/v1/jwt/login'
@@ -72,13 +135,28 @@ class AuthConfig(BaseSettings):
         return f'users/profile'
 
 
-class ProfilesConfig(BaseSettings):
+class ProfilesConfig(HttpClientConfig):
     model_config = SettingsConfigDict(env_prefix='profiles_')
 
     scheme: str = 'http'
     host: str = 'localhost'
     port: int = 8000
 
+    film_users_budget_in_seconds: float | None = 0.5
+    film_users_cache_enabled: bool = True
+    film_users_cache_expire_in_seconds: int = 30
+
+    timeout_in_seconds: float = 0.3
+    connect_timeout_in_seconds: float = 0.1
+    pool_timeout_in_seconds: float = 0.1
+
+    circuit_breaker_window_in_seconds: float = 30
+    circuit_breaker_min_calls: int = 20
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_slow_call_in_seconds: float = 0.25
+    circuit_breaker_slow_call_rate: float = 0.8
+    circuit_breaker_open_in_seconds: float = 10
+
     @property
     def service_url(self) -> str:
         return f'{self.scheme}://{self.host}:{self.port}'
@@ -91,11 +169,26 @@ class ProfilesConfig(BaseSettings):
     def api_v1_url(self) -> str:
         return urljoin(self.api_url, 'v1/')
 
-    def get_film_rating_url(self, *, film_id: uuid.UUID) -> str:
-        return f'ratings/film/{film_id}'
+    def get_film_summary_url(self, *, film_id: uuid.UUID) -> str:
+        return f'films/{film_id}/summary'
+
+
+class AdmissionConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='admission_')
+
+    enabled: bool = True
+    max_concurrency: int = 64
+    max_queue_size: int = 128
+    queue_timeout_in_seconds: float = 0.5
+    retry_after_in_seconds: int = 1
+    route_max_concurrency: dict[str, int] = {}
+    route_max_queue_size: dict[str, int] = {}
+
+
+class MetricsConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix='metrics_')
 
-    def get_film_reviews_url(self, *, film_id: uuid.UUID) -> str:
-        return f'reviews/film/{film_id}'
+    runtime_state_interval_in_seconds: float = 1
 
 
 class Settings(BaseSettings):
@@ -105,6 +198,8 @@ class Settings(BaseSettings):
     elasticsearch: ElasticConfig = ElasticConfig()
     auth: AuthConfig = AuthConfig()
     profiles: ProfilesConfig = ProfilesConfig()
+    admission: AdmissionConfig = AdmissionConfig()
+    metrics: MetricsConfig = MetricsConfig()
 
 
 settings = Settings()
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import time
+from collections.abc import Iterator
+from typing import overload
+
+request_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar('request_deadline', default=None)
+
+
+class DeadlineExceededError(Exception):
+    pass
+
+
+@contextlib.contextmanager
+def deadline(timeout_in_seconds: float | None) -> Iterator[None]:
+    expires_at = None if timeout_in_seconds is None else time.monotonic() + timeout_in_seconds
+    parent_expires_at = request_deadline.get()
+
+    # A nested deadline can only shorten the one it is nested in
+    if parent_expires_at is not None and (expires_at is None or parent_expires_at < expires_at):
+        expires_at = parent_expires_at
+
+    token = request_deadline.set(expires_at)
+
+    try:
+        yield
+
+    finally:
+        request_deadline.reset(token)
+
+
+def detach_deadline() -> None:
+    # Background tasks inherit the context of the request that started them, but must outlive its deadline
+    request_deadline.set(None)
+
+
+@overload
+def get_remaining_time(max_time_in_seconds: float) -> float: ...
+
+
+@overload
+def get_remaining_time(max_time_in_seconds: None = None) -> float | None: ...
+
+
+def get_remaining_time(max_time_in_seconds: float | None = None) -> float | None:
+    expires_at = request_deadline.get()
+
+    if expires_at is None:
+        return max_time_in_seconds
+
+    remaining_time = max(expires_at - time.monotonic(), 0)
+
+    if max_time_in_seconds is None:
+        return remaining_time
+
+    return min(remaining_time, max_time_in_seconds)
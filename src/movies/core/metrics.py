@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+HTTP_REQUEST_DURATION = Histogram(
+    'movies_http_request_duration_seconds',
+    'Latency of movies API requests by route',
+    ['method', 'route', 'status'],
+    buckets=LATENCY_BUCKETS,
+)
+SEARCH_CACHE_REQUESTS = Counter(
+    'movies_search_cache_requests',
+    'Search cache lookups by cache prefix and result',
+    ['prefix', 'result'],
+)
+ELASTICSEARCH_QUERY_DURATION = Histogram(
+    'movies_elasticsearch_query_duration_seconds',
+    'Latency of Elasticsearch queries by query class',
+    ['query'],
+    buckets=LATENCY_BUCKETS,
+)
+REDIS_COMMAND_DURATION = Histogram(
+    'movies_redis_command_duration_seconds',
+    'Latency of Redis cache commands',
+    ['command'],
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_REQUEST_DURATION = Histogram(
+    'movies_upstream_request_duration_seconds',
+    'Latency of HTTP requests to upstream services by target',
+    ['target', 'status'],
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_POOL_WAIT_DURATION = Histogram(
+    'movies_upstream_pool_wait_duration_seconds',
+    'Time HTTP requests to upstream services wait for a pool connection by target',
+    ['target'],
+    buckets=LATENCY_BUCKETS,
+)
+UPSTREAM_POOL_TIMEOUTS = Counter(
+    'movies_upstream_pool_timeouts',
+    'Requests that timed out waiting for an upstream connection',
+    ['target'],
+)
+
+# Gauges are sampled by every worker, the live ones are combined from the workers that are still running
+UPSTREAM_POOL_ACTIVE_REQUESTS = Gauge(
+    'movies_upstream_pool_active_requests',
+    'Requests holding or waiting for an upstream connection',
+    ['target'],
+    multiprocess_mode='livesum',
+)
+UPSTREAM_POOL_WAITING_REQUESTS = Gauge(
+    'movies_upstream_pool_waiting_requests',
+    'Requests waiting for an upstream connection',
+    ['target'],
+    multiprocess_mode='livesum',
+)
+UPSTREAM_POOL_REQUESTS_PER_CONNECTION = Gauge(
+    'movies_upstream_pool_requests_per_connection',
+    'Upstream requests in flight per pool connection of the busiest worker, above 1 when HTTP/2 multiplexes them',
+    ['target'],
+    multiprocess_mode='livemax',
+)
+ADMISSION_ACTIVE_REQUESTS = Gauge(
+    'movies_admission_active_requests',
+    'Requests admitted by the admission control',
+    ['route'],
+    multiprocess_mode='livesum',
+)
+ADMISSION_WAITING_REQUESTS = Gauge(
+    'movies_admission_waiting_requests',
+    'Requests queued by the admission control',
+    ['route'],
+    multiprocess_mode='livesum',
+)
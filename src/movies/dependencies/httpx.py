@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from typing import Annotated
 
-import httpx
 from fastapi import Request, Depends
 
+from ..services.http import HttpClientRegistry
 
-async def get_httpx_client(request: Request) -> httpx.AsyncClient:
-    return request.state.httpx_client
 
+async def get_http_client_registry(request: Request) -> HttpClientRegistry:
+    return request.state.http_client_registry
 
-HTTPXClientDep = Annotated[httpx.AsyncClient, Depends(get_httpx_client)]
+
+HttpClientRegistryDep = Annotated[HttpClientRegistry, Depends(get_http_client_registry)]
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from typing import Any
+
+from prometheus_client import multiprocess
+
+
+def child_exit(_server: Any, worker: Any) -> None:
+    # Live gauges of a worker that has exited must not be reported anymore
+    multiprocess.mark_process_dead(worker.pid)
@@ -1,28 +1,58 @@
 from __future__ import annotations
 
+import asyncio
 import logging.config
+import os
+import time
 from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from typing import Any
 
 import elasticsearch
-import httpx
 import redis.asyncio as redis
 from fastapi import FastAPI, Request, Response, status
 from fastapi.responses import JSONResponse
-from opentelemetry import trace
-from opentelemetry.baggage.propagation import W3CBaggagePropagator
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.propagate import set_global_textmap
-from opentelemetry.propagators.composite import CompositePropagator
-from opentelemetry.propagators.jaeger import JaegerPropagator
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
 
+from .api.admission import (
+    AdmissionController,
+    AdmissionRejectedError,
+    get_route_path,
+)
+from .api.metrics import RuntimeStateSampler
 from .api.v1.endpoints import films, genres, persons
 from .core import LOGGING, settings
+from .core.deadline import DeadlineExceededError, deadline
+from .core.metrics import HTTP_REQUEST_DURATION
+from .services import (
+    FilmAccessCounter,
+    FilmService,
+    GenreService,
+    GenreSnapshot,
+    GenreSnapshotLoader,
+    PersonService,
+)
+from .services.auth import (
+    CurrentUserCache,
+    CurrentUserClient,
+    CurrentUserLocalCache,
+    CurrentUserService,
+    TokenRevocationListener,
+)
+from .services.cache import SingleFlight
+from .services.cache.backends.redis import RedisCacheService
+from .services.http import HttpClientRegistry
+from .services.profiles import (
+    ProfilesService,
+    ProfilesServiceClient,
+    create_profiles_circuit_breaker,
+)
+from .services.search import SearchService
+from .services.search.backends import AbstractSearchBackend
+from .services.search.backends.elasticsearch import (
+    ElasticsearchBatcher,
+    ElasticsearchSearchBackend,
+)
 
 logging.config.dictConfig(LOGGING)
 
@@ -31,6 +61,18 @@ def configure_otel() -> None:
     if not settings.otel.enabled:
         return
 
+    # The telemetry stack is only imported when it is enabled, it is a noticeable share of the start up time
+    from opentelemetry import trace
+    from opentelemetry.baggage.propagation import W3CBaggagePropagator
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.propagate import set_global_textmap
+    from opentelemetry.propagators.composite import CompositePropagator
+    from opentelemetry.propagators.jaeger import JaegerPropagator
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
     resource = Resource(attributes={
         SERVICE_NAME: settings.otel.service_name,
     })
@@ -48,21 +90,136 @@ def configure_otel() -> None:
     ]))
 
 
+def instrument_otel(app: FastAPI, *, excluded_urls: str) -> None:
+    if not settings.otel.enabled:
+        return
+
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+    FastAPIInstrumentor.instrument_app(
+        app,
+        excluded_urls=excluded_urls,
+        http_capture_headers_server_request=['X-Request-Id'],
+    )
+
+
+def create_services(*,
+                    http_client_registry: HttpClientRegistry,
+                    redis_client: redis.Redis,
+                    search_backend: AbstractSearchBackend,
+                    current_user_local_cache: CurrentUserLocalCache,
+                    genre_snapshot: GenreSnapshot) -> dict[str, Any]:
+    # Services are stateless and shared by all requests, only the token and the current user are request scoped
+    single_flight = SingleFlight()
+    cache_service = RedisCacheService(redis_client=redis_client)
+    search_service = SearchService(backend=search_backend, cache_service=cache_service, single_flight=single_flight)
+
+    return {
+        'cache_service': cache_service,
+        'search_service': search_service,
+        'film_service': FilmService(search_service=search_service),
+        'genre_service': GenreService(search_service=search_service, genre_snapshot=genre_snapshot),
+        'person_service': PersonService(search_service=search_service),
+        'film_access_counter': FilmAccessCounter(redis_client=redis_client),
+        'current_user_service': CurrentUserService(
+            current_user_client=CurrentUserClient(httpx_client=http_client_registry.get_client('auth')),
+            current_user_cache=CurrentUserCache(cache_service=cache_service, local_cache=current_user_local_cache),
+        ),
+        'profiles_service': ProfilesService(
+            profiles_service_client=ProfilesServiceClient(
+                httpx_client=http_client_registry.get_client('profiles'),
+                circuit_breaker=create_profiles_circuit_breaker(),
+            ),
+            cache_service=cache_service,
+            single_flight=single_flight,
+        ),
+    }
+
+
 @asynccontextmanager
 async def lifespan(_app) -> AsyncGenerator[dict]:
     configure_otel()
 
     async with (
-        httpx.AsyncClient() as httpx_client,
+        HttpClientRegistry(pools={
+            'auth': settings.auth,
+            'profiles': settings.profiles,
+        }) as http_client_registry,
         redis.Redis(host=settings.redis.host, port=settings.redis.port) as redis_client,
         elasticsearch.AsyncElasticsearch(settings.elasticsearch.url) as elasticsearch_client,
+        redis.Redis(host=settings.auth.redis_host, port=settings.auth.redis_port) as auth_redis_client,
     ):
+        current_user_local_cache = CurrentUserLocalCache(max_size=settings.auth.user_local_cache_max_size)
+
+        if settings.auth.user_cache_enabled:
+            token_revocation_listener = TokenRevocationListener(
+                redis_client=auth_redis_client,
+                current_user_cache=CurrentUserCache(
+                    cache_service=RedisCacheService(redis_client=redis_client),
+                    local_cache=current_user_local_cache,
+                ),
+            )
+            token_revocation_task = asyncio.create_task(token_revocation_listener.listen())
+        else:
+            token_revocation_task = None
+
+        if settings.elasticsearch.batch_enabled:
+            elasticsearch_batcher = ElasticsearchBatcher(
+                elasticsearch_client=elasticsearch_client,
+                window_in_seconds=settings.elasticsearch.batch_window_in_seconds,
+                max_size=settings.elasticsearch.batch_max_size,
+            )
+        else:
+            elasticsearch_batcher = None
+
+        search_backend = ElasticsearchSearchBackend(
+            elasticsearch_client=elasticsearch_client,
+            batcher=elasticsearch_batcher,
+        )
+        genre_snapshot = GenreSnapshot()
+
+        if settings.elasticsearch.genres_snapshot_enabled:
+            genre_snapshot_loader = GenreSnapshotLoader(
+                backend=search_backend,
+                redis_client=redis_client,
+                snapshot=genre_snapshot,
+            )
+            genre_snapshot_tasks = [
+                asyncio.create_task(genre_snapshot_loader.refresh()),
+                asyncio.create_task(genre_snapshot_loader.listen()),
+            ]
+        else:
+            genre_snapshot_tasks = []
+
+        admission_controller = AdmissionController(config=settings.admission)
+        runtime_state_sampler = RuntimeStateSampler(
+            http_client_registry=http_client_registry,
+            admission_controller=admission_controller,
+        )
+        runtime_state_task = asyncio.create_task(runtime_state_sampler.run())
+
         yield {
-            'httpx_client': httpx_client,
+            'http_client_registry': http_client_registry,
             'redis_client': redis_client,
             'elasticsearch_client': elasticsearch_client,
+            'admission_controller': admission_controller,
+            **create_services(
+                http_client_registry=http_client_registry,
+                redis_client=redis_client,
+                search_backend=search_backend,
+                current_user_local_cache=current_user_local_cache,
+                genre_snapshot=genre_snapshot,
+            ),
         }
 
+        runtime_state_task.cancel()
+
+        for genre_snapshot_task in genre_snapshot_tasks:
+            genre_snapshot_task.cancel()
+
+        if token_revocation_task is not None:
+            token_revocation_task.cancel()
+
 
 base_api_prefix = '/api'
 app = FastAPI(
@@ -76,15 +233,57 @@ app = FastAPI(
     default_response_class=JSONResponse,
     lifespan=lifespan,
 )
-FastAPIInstrumentor.instrument_app(
-    app,
-    excluded_urls=f'{base_api_prefix}/_health',
-    http_capture_headers_server_request=['X-Request-Id'],
-)
+instrument_otel(app, excluded_urls=f'{base_api_prefix}/_health,{base_api_prefix}/_metrics')
+
+
+@app.middleware('http')
+async def control_admission(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    if not settings.admission.enabled:
+        return await call_next(request)
+
+    route_path = get_route_path(app.router.routes, request.scope)
+
+    # Only the movies API is limited, health checks and docs always get through
+    if route_path is None or not route_path.startswith(movies_api_prefix):
+        return await call_next(request)
+
+    admission_controller: AdmissionController = request.state.admission_controller
+    admission_limiter = admission_controller.get_limiter(route_path)
+
+    try:
+        async with admission_limiter.admit():
+            return await call_next(request)
+
+    except AdmissionRejectedError:
+        return JSONResponse({
+            'detail': 'Service is overloaded, retry later',
+        }, status_code=status.HTTP_503_SERVICE_UNAVAILABLE, headers={
+            'Retry-After': str(settings.admission.retry_after_in_seconds),
+        })
+
+
+@app.middleware('http')
+async def limit_request_time(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    if not request.url.path.startswith(movies_api_prefix):
+        return await call_next(request)
+
+    # The deadline is shared by everything the request waits for, retries included
+    try:
+        with deadline(settings.project.request_timeout_in_seconds):
+            return await call_next(request)
+
+    except DeadlineExceededError:
+        return JSONResponse({
+            'detail': 'Request timed out',
+        }, status_code=status.HTTP_504_GATEWAY_TIMEOUT)
 
 
 @app.middleware('http')
 async def check_request_id(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    # Metrics scrapers do not take part in request tracing
+    if request.url.path == f'{base_api_prefix}/_metrics':
+        return await call_next(request)
+
     if settings.otel.enabled and settings.otel.request_id_required:
         request_id = request.headers.get('X-Request-Id')
 
@@ -96,11 +295,41 @@ async def check_request_id(request: Request, call_next: Callable[[Request], Awai
     return await call_next(request)
 
 
+@app.middleware('http')
+async def record_request_metrics(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    started_at = time.perf_counter()
+    response = await call_next(request)
+
+    # Unmatched paths share a single label value, so that scanners cannot blow up the label cardinality
+    route_path = get_route_path(app.router.routes, request.scope) or 'unmatched'
+    HTTP_REQUEST_DURATION.labels(request.method, route_path, str(response.status_code)).observe(
+        time.perf_counter() - started_at,
+    )
+
+    return response
+
+
 @app.get(f'{base_api_prefix}/_health')
 async def healthcheck():
     return {}
 
 
+@app.get(f'{base_api_prefix}/_metrics', include_in_schema=False)
+async def metrics() -> Response:
+    return Response(generate_latest(create_metrics_registry()), media_type=CONTENT_TYPE_LATEST)
+
+
+def create_metrics_registry() -> CollectorRegistry:
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+
+    # Every worker writes its metrics to the shared directory, so a scrape served by any of them sees all workers
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+
+    return registry
+
+
 movies_api_prefix = f'{base_api_prefix}/v1'
 
 app.include_router(films.router, prefix=f'{movies_api_prefix}/films', tags=['films'])
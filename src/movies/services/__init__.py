@@ -1,11 +1,22 @@
 from .film import (
     FilmService,
     FilmServiceDep,
+    FilmsPage,
+    SortOrder,
+    create_films_sort,
+)
+from .film_access import (
+    FilmAccessCounter,
+    FilmAccessCounterDep,
 )
 from .genre import (
     GenreService,
     GenreServiceDep,
 )
+from .genre_snapshot import (
+    GenreSnapshot,
+    GenreSnapshotLoader,
+)
 from .person import (
     PersonService,
     PersonServiceDep,
@@ -1,6 +1,12 @@
 from .current import (
+    AbstractCurrentUserService,
     CurrentUser,
+    CurrentUserCache,
+    CurrentUserClient,
     CurrentUserDep,
+    CurrentUserLocalCache,
+    CurrentUserService,
+    TokenRevocationListener,
     TokenDep,
-    TokenHttpClient,
+    create_token_headers,
 )
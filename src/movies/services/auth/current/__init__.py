@@ -1,9 +1,19 @@
+from .cache import (
+    CurrentUserCache,
+    CurrentUserLocalCache,
+)
+from .client import CurrentUserClient
 from .models import (
     CurrentUser,
 )
+from .revocation import TokenRevocationListener
+from .service import (
+    AbstractCurrentUserService,
+    CurrentUserService,
+)
 from .token import (
     TokenDep,
-    TokenHttpClient,
+    create_token_headers,
 )
 from .user import (
     CurrentUserDep,
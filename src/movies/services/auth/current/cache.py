@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import base64
+import collections
+import dataclasses
+import hashlib
+import json
+import logging
+import time
+
+from .models import CurrentUser
+from ...cache import (
+    AbstractCache,
+    AbstractCacheService,
+    CacheUnavailableError,
+)
+from ....core import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(kw_only=True)
+class CurrentUserLocalCacheEntry:
+    current_user: CurrentUser
+    expires_at: float
+
+
+class CurrentUserLocalCache:
+    _entries: collections.OrderedDict[str, CurrentUserLocalCacheEntry]
+    _max_size: int
+
+    def __init__(self, *, max_size: int) -> None:
+        self._entries = collections.OrderedDict()
+        self._max_size = max_size
+
+    def get(self, token_hash: str) -> CurrentUser | None:
+        entry = self._entries.get(token_hash)
+
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.time():
+            del self._entries[token_hash]
+            return None
+
+        self._entries.move_to_end(token_hash)
+
+        return entry.current_user
+
+    def set(self, token_hash: str, current_user: CurrentUser, *, expires_at: float) -> None:
+        self._entries[token_hash] = CurrentUserLocalCacheEntry(
+            current_user=current_user,
+            expires_at=expires_at,
+        )
+        self._entries.move_to_end(token_hash)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, token_hash: str) -> None:
+        self._entries.pop(token_hash, None)
+
+
+class CurrentUserCache:
+    _cache: AbstractCache
+    _local_cache: CurrentUserLocalCache
+
+    def __init__(self, *, cache_service: AbstractCacheService, local_cache: CurrentUserLocalCache) -> None:
+        self._cache = cache_service.get_cache(key_prefix='current-user', key_version='1.0')
+        self._local_cache = local_cache
+
+    async def get(self, *, token: str) -> CurrentUser | None:
+        if not settings.auth.user_cache_enabled:
+            return None
+
+        token_hash = get_token_hash(token)
+        current_user = self._local_cache.get(token_hash)
+
+        if current_user is not None:
+            return current_user
+
+        try:
+            current_user_data = await self._cache.get(token_hash)
+
+        except CacheUnavailableError as e:
+            # The auth service is asked instead, the same as on a cache miss
+            logger.warning('Current user cache is unavailable: %r', e.__cause__)
+            return None
+
+        if current_user_data is None:
+            return None
+
+        current_user = CurrentUser.model_validate_json(current_user_data)
+        self._set_local(token=token, token_hash=token_hash, current_user=current_user)
+
+        return current_user
+
+    async def set(self, *, token: str, current_user: CurrentUser) -> None:
+        if not settings.auth.user_cache_enabled:
+            return
+
+        token_expires_at = get_token_expires_at(token)
+
+        # Tokens without a readable expiration time are never cached
+        if token_expires_at is None:
+            return
+
+        timeout = min(settings.auth.user_cache_expire_in_seconds, int(token_expires_at - time.time()))
+
+        if timeout <= 0:
+            return
+
+        token_hash = get_token_hash(token)
+
+        try:
+            await self._cache.set(token_hash, current_user.model_dump_json().encode(), timeout=timeout)
+
+        except CacheUnavailableError as e:
+            logger.warning('Current user cache is unavailable: %r', e.__cause__)
+
+        self._set_local(token=token, token_hash=token_hash, current_user=current_user)
+
+    async def invalidate(self, *, token_hash: str) -> None:
+        self._local_cache.delete(token_hash)
+        await self._cache.delete(token_hash)
+
+    def _set_local(self, *, token: str, token_hash: str, current_user: CurrentUser) -> None:
+        token_expires_at = get_token_expires_at(token)
+
+        if token_expires_at is None:
+            return
+
+        expires_at = min(time.time() + settings.auth.user_local_cache_expire_in_seconds, token_expires_at)
+        self._local_cache.set(token_hash, current_user, expires_at=expires_at)
+
+
+def get_token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_token_expires_at(token: str) -> float | None:
+    # The signature is verified by the auth service, the payload is only read to cap the cache lifetime
+    try:
+        payload_segment = token.split('.')[1]
+        payload_data = base64.urlsafe_b64decode(payload_segment + '=' * (-len(payload_segment) % 4))
+        return float(json.loads(payload_data)['exp'])
+
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import backoff
+import redis.asyncio as async_redis
+import redis.exceptions
+
+from .cache import CurrentUserCache
+from ...cache import CacheUnavailableError
+from ....core import settings
+
+
+class TokenRevocationListener:
+    _redis_client: async_redis.Redis
+    _current_user_cache: CurrentUserCache
+
+    def __init__(self, *, redis_client: async_redis.Redis, current_user_cache: CurrentUserCache) -> None:
+        self._redis_client = redis_client
+        self._current_user_cache = current_user_cache
+
+    @backoff.on_exception(backoff.expo, (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+            CacheUnavailableError,
+    ))
+    async def listen(self) -> None:
+        async with self._redis_client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(settings.auth.token_revocation_channel)
+
+            async for message in pubsub.listen():
+                token_hash = message['data'].decode()
+                await self._current_user_cache.invalidate(token_hash=token_hash)
@@ -4,37 +4,54 @@ import abc
 from typing import Annotated
 
 import httpx
-from fastapi import HTTPException, Depends, status
+from fastapi import HTTPException, Request, Depends, status
 
-from .client import (
-    CurrentUserClient,
-    CurrentUserClientDep,
-)
+from .cache import CurrentUserCache
+from .client import CurrentUserClient
 from .models import CurrentUser
 
 
 class AbstractCurrentUserService(abc.ABC):
     @abc.abstractmethod
-    async def get_user_profile(self) -> CurrentUser: ...
+    async def get_user_profile(self, *, token: str | None) -> CurrentUser: ...
 
 
 class CurrentUserService(AbstractCurrentUserService):
     _current_user_client: CurrentUserClient
+    _current_user_cache: CurrentUserCache
 
-    def __init__(self, *, current_user_client: CurrentUserClient) -> None:
+    def __init__(self,
+                 *,
+                 current_user_client: CurrentUserClient,
+                 current_user_cache: CurrentUserCache) -> None:
         self._current_user_client = current_user_client
+        self._current_user_cache = current_user_cache
 
-    async def get_user_profile(self) -> CurrentUser:
-        return await GetUserProfileRequest(
+    async def get_user_profile(self, *, token: str | None) -> CurrentUser:
+        if token is not None:
+            current_user = await self._current_user_cache.get(token=token)
+
+            if current_user is not None:
+                return current_user
+
+        current_user = await GetUserProfileRequest(
             current_user_client=self._current_user_client,
+            token=token,
         ).send_request()
 
+        if token is not None:
+            await self._current_user_cache.set(token=token, current_user=current_user)
+
+        return current_user
+
 
 class CurrentUserServiceRequest[TResponse](abc.ABC):
     _current_user_client: CurrentUserClient
+    _token: str | None
 
-    def __init__(self, *, current_user_client: CurrentUserClient) -> None:
+    def __init__(self, *, current_user_client: CurrentUserClient, token: str | None) -> None:
         self._current_user_client = current_user_client
+        self._token = token
 
     async def send_request(self) -> TResponse:
         try:
@@ -56,11 +73,11 @@ class CurrentUserServiceRequest[TResponse](abc.ABC):
 
 class GetUserProfileRequest(CurrentUserServiceRequest[CurrentUser]):
     async def _send_request(self) -> CurrentUser:
-        return await self._current_user_client.get_user_profile()
+        return await self._current_user_client.get_user_profile(token=self._token)
 
 
-async def get_current_user_service(current_user_client: CurrentUserClientDep) -> AbstractCurrentUserService:
-    return CurrentUserService(current_user_client=current_user_client)
+async def get_current_user_service(request: Request) -> AbstractCurrentUserService:
+    return request.state.current_user_service
 
 
 CurrentUserServiceDep = Annotated[AbstractCurrentUserService, Depends(get_current_user_service)]
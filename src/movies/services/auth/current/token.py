@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from typing import Annotated, Any
+from typing import Annotated
 
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
 
-from ...http import HttpClient
 from ....core import settings
 
 oauth2_scheme = OAuth2PasswordBearer(
@@ -22,15 +21,10 @@ async def get_token(token: OAuth2TokenDep) -> str:
 TokenDep = Annotated[str, Depends(get_token)]
 
 
-class TokenHttpClient(HttpClient):
-    _token: str
+def create_token_headers(token: str | None) -> dict:
+    if token is None:
+        return {}
 
-    def __init__(self, *, token: str, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
-        self._token = token
-
-    def get_default_headers(self) -> dict:
-        return {
-            **super().get_default_headers(),
-            'Authorization': f'Bearer {self._token}',
-        }
+    return {
+        'Authorization': f'Bearer {token}',
+    }
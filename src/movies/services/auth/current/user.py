@@ -6,10 +6,11 @@ from fastapi import Depends
 
 from .models import CurrentUser
 from .service import CurrentUserServiceDep
+from .token import TokenDep
 
 
-async def get_current_user(current_user_service: CurrentUserServiceDep) -> CurrentUser:
-    return await current_user_service.get_user_profile()
+async def get_current_user(current_user_service: CurrentUserServiceDep, token: TokenDep) -> CurrentUser:
+    return await current_user_service.get_user_profile(token=token)
 
 
 CurrentUserDep = Annotated[CurrentUser, Depends(get_current_user)]
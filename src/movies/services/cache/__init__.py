@@ -1,9 +1,20 @@
 from .backends import (
     AbstractCache,
+    AbstractCacheLock,
     AbstractCacheService,
     CacheServiceDep,
+    CacheUnavailableError,
+    DEFAULT_TIMEOUT,
+)
+from .codecs import (
+    AbstractCacheCodec,
+    CacheCodec,
+    CacheSerializer,
+    get_cache_codec,
 )
 from .parameterized import (
     Parameterizable,
     ParameterizedCache,
+    ParameterizedCacheEntry,
 )
+from .single_flight import SingleFlight
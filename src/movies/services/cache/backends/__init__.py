@@ -1,5 +1,8 @@
 from .base import (
     AbstractCache,
+    AbstractCacheLock,
     AbstractCacheService,
+    CacheUnavailableError,
+    DEFAULT_TIMEOUT,
 )
 from .dependencies import CacheServiceDep
@@ -1,5 +1,8 @@
 from .cache import (
     AbstractCache,
+    AbstractCacheLock,
     BaseCache,
+    CacheUnavailableError,
+    DEFAULT_TIMEOUT,
 )
 from .service import AbstractCacheService
@@ -1,14 +1,38 @@
 from __future__ import annotations
 
 import abc
+from collections.abc import Collection
+from types import TracebackType
+
+from .....core.config import settings
+
+DEFAULT_TIMEOUT = -1
+
+
+class CacheUnavailableError(Exception):
+    pass
 
 
 class AbstractCache(abc.ABC):
     @abc.abstractmethod
-    async def get(self, key: str) -> str | None: ...
+    async def get(self, key: str) -> bytes | None: ...
+
+    @abc.abstractmethod
+    async def set(self,
+                  key: str,
+                  value: bytes,
+                  *,
+                  timeout: int | None = DEFAULT_TIMEOUT,
+                  tags: Collection[str] = ()) -> None: ...
+
+    @abc.abstractmethod
+    async def delete(self, key: str) -> None: ...
 
     @abc.abstractmethod
-    async def set(self, key: str, value: str) -> None: ...
+    async def invalidate(self, tag: str) -> None: ...
+
+    @abc.abstractmethod
+    def lock(self, key: str, *, wait: bool = True) -> AbstractCacheLock: ...
 
 
 class BaseCache(AbstractCache):
@@ -22,19 +46,70 @@ class BaseCache(AbstractCache):
         self._key_prefix = key_prefix or 'cache'
         self._key_version = key_version or '1.0'
 
-    async def get(self, key: str) -> str | None:
+    async def get(self, key: str) -> bytes | None:
         cache_key = self._create_cache_key(key)
         return await self._get_value(cache_key)
 
     @abc.abstractmethod
-    async def _get_value(self, key: str) -> str | None: ...
+    async def _get_value(self, key: str) -> bytes | None: ...
+
+    async def set(self,
+                  key: str,
+                  value: bytes,
+                  *,
+                  timeout: int | None = DEFAULT_TIMEOUT,
+                  tags: Collection[str] = ()) -> None:
+        cache_key = self._create_cache_key(key)
+        tag_keys = [self._create_tag_key(tag) for tag in tags]
+
+        if timeout == DEFAULT_TIMEOUT:
+            timeout = settings.redis.cache_expire_in_seconds
+
+        await self._set_value(cache_key, value, timeout=timeout, tag_keys=tag_keys)
+
+    @abc.abstractmethod
+    async def _set_value(self, key: str, value: bytes, *, timeout: int | None, tag_keys: list[str]) -> None: ...
 
-    async def set(self, key: str, value: str) -> None:
+    async def delete(self, key: str) -> None:
         cache_key = self._create_cache_key(key)
-        await self._set_value(cache_key, value)
+        await self._delete_value(cache_key)
 
     @abc.abstractmethod
-    async def _set_value(self, key: str, value: str) -> None: ...
+    async def _delete_value(self, key: str) -> None: ...
+
+    async def invalidate(self, tag: str) -> None:
+        tag_key = self._create_tag_key(tag)
+        await self._invalidate_tag(tag_key)
+
+    @abc.abstractmethod
+    async def _invalidate_tag(self, tag_key: str) -> None: ...
+
+    def lock(self, key: str, *, wait: bool = True) -> AbstractCacheLock:
+        cache_key = self._create_cache_key(key)
+        return self._create_lock(f'{cache_key}:lock', wait=wait)
+
+    @abc.abstractmethod
+    def _create_lock(self, key: str, *, wait: bool) -> AbstractCacheLock: ...
 
     def _create_cache_key(self, key: str) -> str:
         return f'{self._key_prefix}:{self._key_version}:{key}'
+
+    def _create_tag_key(self, tag: str) -> str:
+        return f'{self._key_prefix}:{self._key_version}:tag:{tag}'
+
+
+class AbstractCacheLock(abc.ABC):
+    @abc.abstractmethod
+    async def acquire(self) -> bool: ...
+
+    @abc.abstractmethod
+    async def release(self) -> None: ...
+
+    async def __aenter__(self) -> bool:
+        return await self.acquire()
+
+    async def __aexit__(self,
+                        exc_type: type[BaseException] | None,
+                        exc_value: BaseException | None,
+                        traceback: TracebackType | None) -> None:
+        await self.release()
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Request, Depends
 
 from .base import AbstractCacheService
-from .redis import RedisCacheServiceDep
 
 
-async def get_cache_service(cache_service: RedisCacheServiceDep) -> AbstractCacheService:
-    return cache_service
+async def get_cache_service(request: Request) -> AbstractCacheService:
+    return request.state.cache_service
 
 
 CacheServiceDep = Annotated[AbstractCacheService, Depends(get_cache_service)]
@@ -1,5 +1,6 @@
-from .cache import RedisCache
-from .service import (
-    RedisCacheService,
-    RedisCacheServiceDep,
+from .cache import (
+    RedisCache,
+    RedisCacheLock,
 )
+from .breaker import create_redis_circuit_breaker
+from .service import RedisCacheService
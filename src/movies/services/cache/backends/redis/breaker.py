@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from .cache import REDIS_ERRORS
+from ....http import CircuitBreaker
+from .....core import settings
+
+
+def create_redis_circuit_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        window_in_seconds=settings.redis.circuit_breaker_window_in_seconds,
+        min_calls=settings.redis.circuit_breaker_min_calls,
+        failure_rate_threshold=settings.redis.circuit_breaker_failure_rate,
+        slow_call_duration_in_seconds=settings.redis.circuit_breaker_slow_call_in_seconds,
+        slow_call_rate_threshold=settings.redis.circuit_breaker_slow_call_rate,
+        open_in_seconds=settings.redis.circuit_breaker_open_in_seconds,
+        is_failure=is_redis_failure,
+    )
+
+
+def is_redis_failure(e: Exception) -> bool:
+    # Only an unreachable Redis opens the breaker, lock waits do not pass through it at all
+    return isinstance(e, REDIS_ERRORS)
@@ -1,32 +1,195 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import uuid
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import backoff
 import redis.asyncio as async_redis
+import redis.asyncio.lock
+import redis.commands.core
 import redis.exceptions
 
-from ..base import BaseCache
+from ..base import (
+    BaseCache,
+    AbstractCacheLock,
+    CacheUnavailableError,
+)
+from ....http import (
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+)
 from .....core.config import settings
+from .....core.deadline import get_remaining_time
+from .....core.metrics import REDIS_COMMAND_DURATION
+
+# The ETL service runs a copy of this script in compose/etl/etl/cache/invalidators.py, keep them identical
+INVALIDATE_TAG_SCRIPT = '''
+local keys = redis.call('SMEMBERS', KEYS[1])
+
+for i = 1, #keys, 1000 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 999, #keys)))
+end
+
+redis.call('DEL', KEYS[1])
+
+return #keys
+'''
+
+REDIS_ERRORS = (
+    redis.exceptions.ConnectionError,
+    redis.exceptions.TimeoutError,
+    TimeoutError,
+)
+
+
+async def execute_redis_command[TResult](func: Callable[[], Awaitable[TResult]],
+                                        *,
+                                        circuit_breaker: CircuitBreaker) -> TResult:
+    try:
+        # An open breaker sends callers past the cache at once, instead of each of them waiting for a timeout
+        return await circuit_breaker.call(lambda: retry_redis_command(func))
+
+    except (*REDIS_ERRORS, CircuitBreakerOpenError) as e:
+        # Callers bypass an unavailable cache, so they do not depend on the Redis client exceptions
+        raise CacheUnavailableError from e
+
+
+@backoff.on_exception(
+    backoff.expo,
+    REDIS_ERRORS,
+    max_tries=lambda: settings.redis.retry_max_tries,
+    max_time=lambda: get_remaining_time(settings.redis.retry_max_time_in_seconds),
+    jitter=backoff.full_jitter,
+    factor=lambda: settings.redis.retry_base_wait_in_seconds,
+    max_value=lambda: settings.redis.retry_max_wait_in_seconds,
+)
+async def retry_redis_command[TResult](func: Callable[[], Awaitable[TResult]]) -> TResult:
+    # A hung connection is retried like a refused one instead of holding the request
+    async with asyncio.timeout(settings.redis.command_timeout_in_seconds):
+        return await func()
 
 
 class RedisCache(BaseCache):
     _redis_client: async_redis.Redis
+    _circuit_breaker: CircuitBreaker
+    _invalidate_tag_script: redis.commands.core.AsyncScript
 
-    def __init__(self, *, redis_client: async_redis.Redis, **kwargs: Any) -> None:
+    def __init__(self, *, redis_client: async_redis.Redis, circuit_breaker: CircuitBreaker, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._redis_client = redis_client
+        self._circuit_breaker = circuit_breaker
+        self._invalidate_tag_script = redis_client.register_script(INVALIDATE_TAG_SCRIPT)
+
+    async def _get_value(self, key: str) -> bytes | None:
+        return await execute_redis_command(
+            lambda: self._get_redis_value(key),
+            circuit_breaker=self._circuit_breaker,
+        )
+
+    async def _get_redis_value(self, key: str) -> bytes | None:
+        with REDIS_COMMAND_DURATION.labels('get').time():
+            return await self._redis_client.get(key)
+
+    async def _set_value(self, key: str, value: bytes, *, timeout: int | None, tag_keys: list[str]) -> None:
+        await execute_redis_command(
+            lambda: self._set_redis_value(key, value, timeout=timeout, tag_keys=tag_keys),
+            circuit_breaker=self._circuit_breaker,
+        )
+
+    async def _set_redis_value(self, key: str, value: bytes, *, timeout: int | None, tag_keys: list[str]) -> None:
+        with REDIS_COMMAND_DURATION.labels('set').time():
+            if not tag_keys:
+                await self._redis_client.set(key, value, ex=timeout)
+                return
+
+            async with self._redis_client.pipeline(transaction=False) as pipeline:
+                pipeline.set(key, value, ex=timeout)
+
+                for tag_key in tag_keys:
+                    pipeline.sadd(tag_key, key)
+
+                    # A tag set has to live as long as the longest-living entry registered in it
+                    if timeout is not None:
+                        pipeline.expire(tag_key, timeout, nx=True)
+                        pipeline.expire(tag_key, timeout, gt=True)
+                    else:
+                        pipeline.persist(tag_key)
+
+                await pipeline.execute()
+
+    async def _delete_value(self, key: str) -> None:
+        await execute_redis_command(
+            lambda: self._redis_client.delete(key),
+            circuit_breaker=self._circuit_breaker,
+        )
+
+    async def _invalidate_tag(self, tag_key: str) -> None:
+        await execute_redis_command(
+            lambda: self._invalidate_tag_script(keys=[tag_key]),
+            circuit_breaker=self._circuit_breaker,
+        )
+
+    def _create_lock(self, key: str, *, wait: bool) -> RedisCacheLock:
+        return RedisCacheLock(
+            lock=self._redis_client.lock(
+                key,
+                timeout=settings.redis.cache_lock_timeout_in_seconds,
+                blocking=wait,
+                blocking_timeout=settings.redis.cache_lock_wait_in_seconds,
+            ),
+        )
+
+
+class RedisCacheLock(AbstractCacheLock):
+    _lock: redis.asyncio.lock.Lock
+    _is_acquired: bool
+
+    def __init__(self, *, lock: redis.asyncio.lock.Lock) -> None:
+        self._lock = lock
+        self._is_acquired = False
+
+    async def acquire(self) -> bool:
+        # Waiting for a lock held by another replica is not a Redis failure, so it bypasses the retry and the breaker,
+        # and the timeout only stops a hung connection once the lock wait is over
+        timeout = settings.redis.cache_lock_wait_in_seconds + settings.redis.command_timeout_in_seconds
+        # The token is known up front, so a lock taken by an interrupted acquire can still be released
+        token = uuid.uuid4().hex
+
+        try:
+            async with asyncio.timeout(timeout):
+                self._is_acquired = await self._lock.acquire(token=token)
+
+        except BaseException as e:
+            await self._release_token(token)
+
+            if isinstance(e, REDIS_ERRORS):
+                raise CacheUnavailableError from e
+
+            raise
+
+        return self._is_acquired
+
+    async def release(self) -> None:
+        if not self._is_acquired:
+            return
+
+        self._is_acquired = False
+
+        try:
+            await self._lock.release()
+
+        except (
+                redis.exceptions.LockError,
+                redis.exceptions.ConnectionError,
+                redis.exceptions.TimeoutError,
+        ):
+            # The lock will be freed by its own timeout
+            pass
 
-    @backoff.on_exception(backoff.expo, (
-            redis.exceptions.ConnectionError,
-            redis.exceptions.TimeoutError,
-    ))
-    async def _get_value(self, key: str) -> str | None:
-        return await self._redis_client.get(key)
-
-    @backoff.on_exception(backoff.expo, (
-            redis.exceptions.ConnectionError,
-            redis.exceptions.TimeoutError,
-    ))
-    async def _set_value(self, key: str, value: str) -> None:
-        await self._redis_client.set(key, value, ex=settings.redis.cache_expire_in_seconds)
+    async def _release_token(self, token: str) -> None:
+        with contextlib.suppress(*REDIS_ERRORS, redis.exceptions.LockError):
+            async with asyncio.timeout(settings.redis.command_timeout_in_seconds):
+                await self._lock.do_release(token.encode())
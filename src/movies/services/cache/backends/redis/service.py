@@ -1,20 +1,21 @@
 from __future__ import annotations
 
-from typing import Annotated
-
 import redis.asyncio as redis
-from fastapi import Depends
 
+from .breaker import create_redis_circuit_breaker
 from .cache import RedisCache
 from ..base import AbstractCacheService
-from .....db import RedisClientDep
+from ....http import CircuitBreaker
 
 
 class RedisCacheService(AbstractCacheService):
     _redis_client: redis.Redis
+    _circuit_breaker: CircuitBreaker
 
     def __init__(self, *, redis_client: redis.Redis) -> None:
         self._redis_client = redis_client
+        # Caches of one service share the connection pool, so they also share the view of its health
+        self._circuit_breaker = create_redis_circuit_breaker()
 
     def get_cache(self,
                   *,
@@ -22,13 +23,7 @@ class RedisCacheService(AbstractCacheService):
                   key_version: str | None = None) -> RedisCache:
         return RedisCache(
             redis_client=self._redis_client,
+            circuit_breaker=self._circuit_breaker,
             key_prefix=key_prefix,
             key_version=key_version,
         )
-
-
-async def get_cache_service(redis_client: RedisClientDep) -> RedisCacheService:
-    return RedisCacheService(redis_client=redis_client)
-
-
-RedisCacheServiceDep = Annotated[RedisCacheService, Depends(get_cache_service)]
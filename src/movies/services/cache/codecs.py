@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import abc
+import functools
+import json
+from typing import Any, ClassVar
+
+import msgpack
+import orjson
+import zstandard
+
+from ...core import settings
+
+
+class AbstractCacheCodec(abc.ABC):
+    @abc.abstractmethod
+    def encode(self, value: Any) -> bytes: ...
+
+    @abc.abstractmethod
+    def decode(self, data: bytes) -> Any: ...
+
+
+class CacheSerializer(abc.ABC):
+    name: ClassVar[str]
+    format_id: ClassVar[int]
+
+    @abc.abstractmethod
+    def dumps(self, value: Any) -> bytes: ...
+
+    @abc.abstractmethod
+    def loads(self, data: bytes) -> Any: ...
+
+
+class JsonCacheSerializer(CacheSerializer):
+    name = 'json'
+    format_id = 1
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':')).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCacheSerializer(CacheSerializer):
+    name = 'orjson'
+    format_id = 2
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCacheSerializer(CacheSerializer):
+    name = 'msgpack'
+    format_id = 3
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data)
+
+
+CACHE_SERIALIZERS: list[CacheSerializer] = [
+    JsonCacheSerializer(),
+    OrjsonCacheSerializer(),
+    MsgpackCacheSerializer(),
+]
+
+
+class CacheCodec(AbstractCacheCodec):
+    compressed_flag: ClassVar[int] = 0x80
+
+    _serializer: CacheSerializer
+    _compression_threshold: int | None
+    _compressor: zstandard.ZstdCompressor
+    _decompressor: zstandard.ZstdDecompressor
+    _serializers_by_format_id: dict[int, CacheSerializer]
+
+    def __init__(self,
+                 *,
+                 serializer: CacheSerializer,
+                 compression_threshold: int | None = None,
+                 compression_level: int = 3) -> None:
+        self._serializer = serializer
+        self._compression_threshold = compression_threshold
+        self._compressor = zstandard.ZstdCompressor(level=compression_level)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._serializers_by_format_id = {
+            cache_serializer.format_id: cache_serializer
+            for cache_serializer in CACHE_SERIALIZERS
+        }
+
+    def encode(self, value: Any) -> bytes:
+        header = self._serializer.format_id
+        payload = self._serializer.dumps(value)
+
+        if self._compression_threshold is not None and len(payload) >= self._compression_threshold:
+            header |= self.compressed_flag
+            payload = self._compressor.compress(payload)
+
+        return bytes((header,)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        # Every entry starts with its own header byte, so values written with another serializer
+        # or compression setting by a previous deploy remain readable
+        header = data[0]
+        payload = data[1:]
+
+        if header & self.compressed_flag:
+            payload = self._decompressor.decompress(payload)
+
+        serializer = self._serializers_by_format_id.get(header & ~self.compressed_flag)
+
+        if serializer is None:
+            raise ValueError(f'Unknown cache entry format: {header}')
+
+        return serializer.loads(payload)
+
+
+def get_cache_serializer(name: str) -> CacheSerializer:
+    for cache_serializer in CACHE_SERIALIZERS:
+        if cache_serializer.name == name:
+            return cache_serializer
+
+    raise ValueError(f'Unknown cache serializer: {name}')
+
+
+@functools.cache
+def get_cache_codec() -> CacheCodec:
+    return CacheCodec(
+        serializer=get_cache_serializer(settings.redis.cache_serializer),
+        compression_threshold=settings.redis.cache_compression_threshold,
+        compression_level=settings.redis.cache_compression_level,
+    )
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import abc
+import dataclasses
 import hashlib
 import json
+import time
+from collections.abc import Collection
 
-from .backends import AbstractCache
+from .backends import (
+    AbstractCache,
+    AbstractCacheLock,
+    DEFAULT_TIMEOUT,
+)
+from .codecs import AbstractCacheCodec
 
 
 class Parameterizable(abc.ABC):
@@ -15,26 +23,87 @@ class Parameterizable(abc.ABC):
     def get_cache_params(self) -> dict: ...
 
 
+@dataclasses.dataclass(kw_only=True)
+class ParameterizedCacheEntry[TValue]:
+    value: TValue | None
+    soft_expires_at: float | None = None
+    is_negative: bool = False
+
+    @property
+    def is_stale(self) -> bool:
+        return self.soft_expires_at is not None and self.soft_expires_at <= time.time()
+
+
 class ParameterizedCache[TParams: Parameterizable, TValue]:
     _cache: AbstractCache
-
-    def __init__(self, *, cache: AbstractCache) -> None:
+    _codec: AbstractCacheCodec
+    _soft_expire_in_seconds: float | None
+    _negative_expire_in_seconds: int | None
+
+    def __init__(self,
+                 *,
+                 cache: AbstractCache,
+                 codec: AbstractCacheCodec,
+                 soft_expire_in_seconds: float | None = None,
+                 negative_expire_in_seconds: int | None = None) -> None:
         self._cache = cache
+        self._codec = codec
+        self._soft_expire_in_seconds = soft_expire_in_seconds
+        self._negative_expire_in_seconds = negative_expire_in_seconds
 
-    async def get(self, *, params: TParams) -> TValue | None:
+    async def get(self, *, params: TParams) -> ParameterizedCacheEntry[TValue] | None:
         cache_key = self._create_cache_key(params=params)
-        value_json: str | None = await self._cache.get(cache_key)
+        entry_data = await self._cache.get(cache_key)
 
-        if value_json is None:
+        if entry_data is None:
             return None
 
-        return json.loads(value_json)
+        entry_dict = self._codec.decode(entry_data)
+
+        if entry_dict.get('negative'):
+            return ParameterizedCacheEntry(value=None, is_negative=True)
+
+        return ParameterizedCacheEntry(
+            value=entry_dict['value'],
+            soft_expires_at=entry_dict['soft_expires_at'],
+        )
+
+    async def set(self,
+                  *,
+                  params: TParams,
+                  value: TValue,
+                  timeout: int | None = DEFAULT_TIMEOUT,
+                  tags: Collection[str] = ()) -> None:
+        cache_key = self._create_cache_key(params=params)
+        soft_expires_at: float | None = None
+
+        if self._soft_expire_in_seconds is not None:
+            soft_expires_at = time.time() + self._soft_expire_in_seconds
+
+        entry_data = self._codec.encode({
+            'value': value,
+            'soft_expires_at': soft_expires_at,
+        })
+
+        await self._cache.set(cache_key, entry_data, timeout=timeout, tags=tags)
+
+    async def set_negative(self, *, params: TParams, tags: Collection[str] = ()) -> None:
+        if self._negative_expire_in_seconds is None:
+            return
+
+        cache_key = self._create_cache_key(params=params)
+        entry_data = self._codec.encode({
+            'negative': True,
+        })
+
+        await self._cache.set(cache_key, entry_data, timeout=self._negative_expire_in_seconds, tags=tags)
 
-    async def set(self, *, params: TParams, value: TValue) -> None:
+    def lock(self, *, params: TParams, wait: bool = True) -> AbstractCacheLock:
         cache_key = self._create_cache_key(params=params)
-        value_json = json.dumps(value)
+        return self._cache.lock(cache_key, wait=wait)
 
-        await self._cache.set(cache_key, value_json)
+    def get_key(self, *, params: TParams) -> str:
+        return self._create_cache_key(params=params)
 
     def _create_cache_key(self, *, params: TParams) -> str:
         cache_prefix = params.get_cache_prefix()
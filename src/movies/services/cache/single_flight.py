@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+
+
+class SingleFlight:
+    _tasks: dict[str, asyncio.Task]
+
+    def __init__(self) -> None:
+        self._tasks = {}
+
+    async def do[TResult](self, key: str, func: Callable[[], Awaitable[TResult]]) -> TResult:
+        task = self._get_task(key, func)
+
+        # A cancelled caller must not cancel the task other callers are waiting for
+        return await asyncio.shield(task)
+
+    def schedule[TResult](self, key: str, func: Callable[[], Awaitable[TResult]]) -> None:
+        self._get_task(key, func)
+
+    def _get_task[TResult](self, key: str, func: Callable[[], Awaitable[TResult]]) -> asyncio.Task[TResult]:
+        task = self._tasks.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(func())
+            task.add_done_callback(functools.partial(self._on_task_done, key))
+            self._tasks[key] = task
+
+        return task
+
+    def _on_task_done(self, key: str, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+        if not task.cancelled():
+            task.exception()
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import enum
 import uuid
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Request, Depends
 
-from .search import (
-    AbstractSearchService,
-    SearchServiceDep,
+from .search import AbstractSearchService
+from ..core import settings
+from ..models import (
+    Film,
+    Person,
 )
-from ..models import Film
+
+
+class SortOrder(enum.StrEnum):
+    ASC = 'asc'
+    DESC = 'desc'
+
+
+@dataclasses.dataclass(kw_only=True)
+class FilmsPage:
+    films: list[dict]
+    next_page_cursor: str | None = None
 
 
 class FilmService:
@@ -18,52 +33,62 @@ class FilmService:
     def __init__(self, *, search_service: AbstractSearchService) -> None:
         self._search_service = search_service
 
-    async def get_list_by_person(self, person_uuid: uuid.UUID) -> list[Film]:
-        search_query = self._search_service.create_query().films_by_person(person_id=person_uuid)
-        result = await self._search_service.search(query=search_query)
+    async def get_list_by_person(self, person_uuid: uuid.UUID) -> list[dict]:
+        query_factory = self._search_service.create_query()
+        # The person document already lists its films, so they are read by id instead of being searched for
+        person_data = await self._search_service.get(query=query_factory.get_person(person_id=person_uuid))
 
-        if result is None:
+        if not person_data:
             return []
 
-        return [Film(**data) for data in result]
+        person = Person(**person_data)
+        # Films are cached one by one, and the batcher fetches the missing ones with a single mget,
+        # the lookups of a person with many films are bounded so that they do not take over the Redis pool
+        semaphore = asyncio.Semaphore(settings.elasticsearch.person_films_concurrency)
+
+        async def get_film_short(film_id: uuid.UUID) -> dict | None:
+            async with semaphore:
+                return await self._search_service.get(query=query_factory.get_film_short(film_id=film_id))
+
+        films = await asyncio.gather(*[get_film_short(person_film.id) for person_film in person.films])
+
+        return [film for film in films if film is not None]
 
     async def get_list(
             self,
             sort: dict[str, str],
             page_number: int,
             page_size: int,
+            page_cursor: str | None = None,
             genre_uuid: uuid.UUID | None = None,
-    ) -> list[Film]:
-        search_query = self._search_service.create_query().films_list(
+    ) -> FilmsPage:
+        page_query = self._search_service.create_query().films_list(
             sort=sort,
             page_number=page_number,
             page_size=page_size,
+            page_cursor=page_cursor,
             genre_id=genre_uuid,
         )
-        result = await self._search_service.search(query=search_query)
-
-        if result is None:
-            return []
+        result = await self._search_service.search_page(query=page_query)
 
-        return [Film(**data) for data in result]
+        return self._create_films_page(result)
 
     async def search(
             self,
             query: str,
             page_number: int,
             page_size: int,
-    ) -> list[Film]:
-        search_query = self._search_service.create_query().search_films(
+            page_cursor: str | None = None,
+    ) -> FilmsPage:
+        page_query = self._search_service.create_query().search_films(
             query=query,
             page_number=page_number,
             page_size=page_size,
+            page_cursor=page_cursor,
         )
-        result = await self._search_service.search(query=search_query)
+        result = await self._search_service.search_page(query=page_query)
 
-        if result is None:
-            return []
-
-        return [Film(**data) for data in result]
+        return self._create_films_page(result)
 
     async def get_by_id(
             self,
@@ -77,9 +102,31 @@ class FilmService:
 
         return Film(**data)
 
+    def _create_films_page(self, result: dict | None) -> FilmsPage:
+        if result is None:
+            return FilmsPage(films=[])
+
+        return FilmsPage(
+            films=result['results'],
+            next_page_cursor=result['next_page_cursor'],
+        )
+
+
+def create_films_sort(sort: str) -> dict[str, str]:
+    if sort:
+        is_first_dash = (sort[0] == '-')
+
+        field = sort[1:] if is_first_dash else sort
+        order = SortOrder.DESC if is_first_dash else SortOrder.ASC
+
+        if field == 'imdb_rating':
+            return {'field': 'rating', 'order': order}
+
+    return {'field': 'id', 'order': SortOrder.ASC}
+
 
-async def get_film_service(search_service: SearchServiceDep) -> FilmService:
-    return FilmService(search_service=search_service)
+async def get_film_service(request: Request) -> FilmService:
+    return request.state.film_service
 
 
 FilmServiceDep = Annotated[FilmService, Depends(get_film_service)]
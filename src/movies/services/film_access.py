@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from typing import Annotated, cast
+
+import redis.asyncio as async_redis
+import redis.exceptions
+from fastapi import Request, Depends
+
+from ..core import settings
+
+logger = logging.getLogger(__name__)
+
+FILM_ACCESS_KEY_PREFIX = 'film-access'
+FILM_ACCESS_BUCKET_IN_SECONDS = 60 * 60
+
+
+class FilmAccessCounter:
+    _redis_client: async_redis.Redis
+
+    def __init__(self, *, redis_client: async_redis.Redis) -> None:
+        self._redis_client = redis_client
+
+    async def record(self, *, film_id: uuid.UUID) -> None:
+        bucket = self._get_current_bucket()
+        key = self._get_key(bucket)
+        # A bucket is kept until it slides out of the access window
+        expire_in = (settings.redis.film_access_window_in_hours + 1) * FILM_ACCESS_BUCKET_IN_SECONDS
+
+        try:
+            async with (
+                asyncio.timeout(settings.redis.command_timeout_in_seconds),
+                self._redis_client.pipeline(transaction=False) as pipeline,
+            ):
+                pipeline.zincrby(key, 1, str(film_id))
+                pipeline.expire(key, expire_in)
+                await pipeline.execute()
+
+        # Access counting must never fail or hold the request that is being counted
+        except (redis.exceptions.RedisError, TimeoutError) as e:
+            logger.warning('Film access was not recorded: %s', e)
+
+    async def get_most_accessed(self, *, limit: int) -> list[uuid.UUID]:
+        current_bucket = self._get_current_bucket()
+        keys = [
+            self._get_key(current_bucket - bucket_offset)
+            for bucket_offset in range(settings.redis.film_access_window_in_hours)
+        ]
+        # The client is created without decode_responses, so members are bytes paired with their scores
+        film_scores = cast(list[tuple[bytes, float]], await self._redis_client.zunion(keys, withscores=True))
+        most_accessed_film_scores = sorted(film_scores, key=lambda film_score: film_score[1], reverse=True)[:limit]
+
+        return [uuid.UUID(film_id.decode()) for film_id, _ in most_accessed_film_scores]
+
+    def _get_current_bucket(self) -> int:
+        return int(time.time()) // FILM_ACCESS_BUCKET_IN_SECONDS
+
+    def _get_key(self, bucket: int) -> str:
+        return f'{FILM_ACCESS_KEY_PREFIX}:{bucket}'
+
+
+async def get_film_access_counter(request: Request) -> FilmAccessCounter:
+    return request.state.film_access_counter
+
+
+FilmAccessCounterDep = Annotated[FilmAccessCounter, Depends(get_film_access_counter)]
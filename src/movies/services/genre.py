@@ -3,26 +3,29 @@ from __future__ import annotations
 import uuid
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Request, Depends
 
-from .search import (
-    AbstractSearchService,
-    SearchServiceDep,
-)
+from .genre_snapshot import GenreSnapshot
+from .search import AbstractSearchService
 from ..models import Genre
 
 
 class GenreService:
     _search_service: AbstractSearchService
+    _genre_snapshot: GenreSnapshot
 
-    def __init__(self, *, search_service: AbstractSearchService) -> None:
+    def __init__(self, *, search_service: AbstractSearchService, genre_snapshot: GenreSnapshot) -> None:
         self._search_service = search_service
+        self._genre_snapshot = genre_snapshot
 
     async def get_list(
             self,
             page_number: int,
             page_size: int,
     ) -> list[Genre]:
+        if self._genre_snapshot.is_loaded:
+            return self._genre_snapshot.get_list(page_number=page_number, page_size=page_size)
+
         search_query = self._search_service.create_query().genres_list(
             page_number=page_number,
             page_size=page_size,
@@ -38,6 +41,9 @@ class GenreService:
             self,
             id: uuid.UUID,
     ) -> Genre | None:
+        if self._genre_snapshot.is_loaded:
+            return self._genre_snapshot.get(id)
+
         get_query = self._search_service.create_query().get_genre(genre_id=id)
         data = await self._search_service.get(query=get_query)
 
@@ -47,8 +53,8 @@ class GenreService:
         return Genre(**data)
 
 
-async def get_genre_service(search_service: SearchServiceDep) -> GenreService:
-    return GenreService(search_service=search_service)
+async def get_genre_service(request: Request) -> GenreService:
+    return request.state.genre_service
 
 
 GenreServiceDep = Annotated[GenreService, Depends(get_genre_service)]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+
+import backoff
+import redis.asyncio as async_redis
+import redis.exceptions
+
+from .search.backends import AbstractSearchBackend
+from ..core import settings
+from ..models import Genre
+
+logger = logging.getLogger(__name__)
+
+
+class GenreSnapshot:
+    _genres: list[Genre] | None
+    _genres_by_id: dict[uuid.UUID, Genre]
+
+    def __init__(self) -> None:
+        self._genres = None
+        self._genres_by_id = {}
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._genres is not None
+
+    def get_list(self, *, page_number: int, page_size: int) -> list[Genre]:
+        offset = (page_number - 1) * page_size
+
+        return (self._genres or [])[offset:offset + page_size]
+
+    def get(self, genre_id: uuid.UUID) -> Genre | None:
+        return self._genres_by_id.get(genre_id)
+
+    def replace(self, genres: list[Genre] | None) -> None:
+        self._genres = genres
+        self._genres_by_id = {genre.id: genre for genre in genres or []}
+
+
+class GenreSnapshotLoader:
+    _backend: AbstractSearchBackend
+    _redis_client: async_redis.Redis
+    _snapshot: GenreSnapshot
+
+    def __init__(self,
+                 *,
+                 backend: AbstractSearchBackend,
+                 redis_client: async_redis.Redis,
+                 snapshot: GenreSnapshot) -> None:
+        self._backend = backend
+        self._redis_client = redis_client
+        self._snapshot = snapshot
+
+    async def load(self) -> None:
+        max_size = settings.elasticsearch.genres_snapshot_max_size
+        search_query = self._backend.create_query().genres_list(page_number=1, page_size=max_size)
+
+        try:
+            result = await search_query.compile().execute()
+
+        # Genres are read from Elasticsearch while there is no snapshot
+        except Exception as e:
+            logger.exception(e)
+            return
+
+        # A missing or empty index leaves the snapshot unloaded, so genres keep being read from Elasticsearch
+        if result is None:
+            self._snapshot.replace(None)
+            return
+
+        if len(result) >= max_size:
+            logger.warning('Genres do not fit into a snapshot of %s genres', max_size)
+            self._snapshot.replace(None)
+            return
+
+        self._snapshot.replace([Genre(**data) for data in result])
+
+    async def refresh(self) -> None:
+        while True:
+            await self.load()
+            await asyncio.sleep(settings.elasticsearch.genres_snapshot_refresh_in_seconds)
+
+    @backoff.on_exception(backoff.expo, (
+            redis.exceptions.ConnectionError,
+            redis.exceptions.TimeoutError,
+    ))
+    async def listen(self) -> None:
+        async with self._redis_client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(settings.redis.invalidation_channel)
+
+            async for message in pubsub.listen():
+                if message['data'].decode() == settings.elasticsearch.index_name_genres:
+                    await self.load()
@@ -1,4 +1,13 @@
+from .breaker import (
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    CircuitBreakerState,
+)
 from .client import (
     HttpClient,
     HttpResponse,
 )
+from .pools import (
+    HttpClientRegistry,
+    HttpPoolMetrics,
+)
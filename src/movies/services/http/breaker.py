@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import enum
+import time
+from collections.abc import Awaitable, Callable
+
+
+class CircuitBreakerState(enum.StrEnum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreakerOpenError(Exception):
+    pass
+
+
+@dataclasses.dataclass(kw_only=True)
+class CircuitBreakerCall:
+    finished_at: float
+    is_failure: bool
+    is_slow: bool
+
+
+class CircuitBreaker:
+    _window_in_seconds: float
+    _min_calls: int
+    _failure_rate_threshold: float
+    _slow_call_duration_in_seconds: float
+    _slow_call_rate_threshold: float
+    _open_in_seconds: float
+    _is_failure: Callable[[Exception], bool]
+
+    _calls: collections.deque[CircuitBreakerCall]
+    _state: CircuitBreakerState
+    _opened_at: float
+    _is_probing: bool
+
+    def __init__(self,
+                 *,
+                 window_in_seconds: float,
+                 min_calls: int,
+                 failure_rate_threshold: float,
+                 slow_call_duration_in_seconds: float,
+                 slow_call_rate_threshold: float,
+                 open_in_seconds: float,
+                 is_failure: Callable[[Exception], bool] | None = None) -> None:
+        self._window_in_seconds = window_in_seconds
+        self._min_calls = min_calls
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_duration_in_seconds = slow_call_duration_in_seconds
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._open_in_seconds = open_in_seconds
+        self._is_failure = is_failure or (lambda e: True)
+
+        self._calls = collections.deque()
+        self._state = CircuitBreakerState.CLOSED
+        self._opened_at = 0
+        self._is_probing = False
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        if self._state == CircuitBreakerState.OPEN and time.monotonic() - self._opened_at >= self._open_in_seconds:
+            self._state = CircuitBreakerState.HALF_OPEN
+
+        return self._state
+
+    async def call[TResult](self, func: Callable[[], Awaitable[TResult]]) -> TResult:
+        is_probe = self._acquire()
+        started_at = time.monotonic()
+
+        try:
+            result = await func()
+
+        except asyncio.CancelledError:
+            self._record(started_at=started_at, is_failure=False, is_probe=is_probe)
+            raise
+
+        except Exception as e:
+            self._record(started_at=started_at, is_failure=self._is_failure(e), is_probe=is_probe)
+            raise
+
+        self._record(started_at=started_at, is_failure=False, is_probe=is_probe)
+
+        return result
+
+    def _acquire(self) -> bool:
+        state = self.state
+
+        if state == CircuitBreakerState.CLOSED:
+            return False
+
+        # A single probe call is let through once the open interval is over
+        if state == CircuitBreakerState.HALF_OPEN and not self._is_probing:
+            self._is_probing = True
+            return True
+
+        raise CircuitBreakerOpenError
+
+    def _record(self, *, started_at: float, is_failure: bool, is_probe: bool) -> None:
+        finished_at = time.monotonic()
+        is_slow = finished_at - started_at >= self._slow_call_duration_in_seconds
+
+        if is_probe:
+            self._is_probing = False
+
+            if is_failure or is_slow:
+                self._open(opened_at=finished_at)
+            else:
+                self._close()
+
+            return
+
+        if self._state != CircuitBreakerState.CLOSED:
+            return
+
+        self._calls.append(CircuitBreakerCall(
+            finished_at=finished_at,
+            is_failure=is_failure,
+            is_slow=is_slow,
+        ))
+
+        while self._calls and self._calls[0].finished_at <= finished_at - self._window_in_seconds:
+            self._calls.popleft()
+
+        calls_count = len(self._calls)
+
+        if calls_count < self._min_calls:
+            return
+
+        failure_rate = sum(call.is_failure for call in self._calls) / calls_count
+        slow_call_rate = sum(call.is_slow for call in self._calls) / calls_count
+
+        if failure_rate >= self._failure_rate_threshold or slow_call_rate >= self._slow_call_rate_threshold:
+            self._open(opened_at=finished_at)
+
+    def _open(self, *, opened_at: float) -> None:
+        self._state = CircuitBreakerState.OPEN
+        self._opened_at = opened_at
+        self._calls.clear()
+
+    def _close(self) -> None:
+        self._state = CircuitBreakerState.CLOSED
+        self._calls.clear()
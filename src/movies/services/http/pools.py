@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from types import TracebackType
+from typing import Any
+
+import httpx
+
+from ...core.config import HttpClientConfig
+from ...core.metrics import (
+    UPSTREAM_POOL_TIMEOUTS,
+    UPSTREAM_POOL_WAIT_DURATION,
+    UPSTREAM_REQUEST_DURATION,
+)
+
+
+@dataclasses.dataclass(kw_only=True)
+class HttpPoolMetrics:
+    max_connections: int
+    active_requests_count: int = 0
+    waiting_requests_count: int = 0
+
+    @property
+    def requests_per_connection(self) -> float:
+        # HTTP/2 multiplexes several requests over one connection, so this is not the share of connections in use
+        return (self.active_requests_count - self.waiting_requests_count) / self.max_connections
+
+
+class HttpPoolMetricsTransport(httpx.AsyncBaseTransport):
+    _transport: httpx.AsyncBaseTransport
+    _target: str
+    _metrics: HttpPoolMetrics
+
+    def __init__(self, *, transport: httpx.AsyncBaseTransport, target: str, metrics: HttpPoolMetrics) -> None:
+        self._transport = transport
+        self._target = target
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        is_waiting = True
+        request_trace = request.extensions.get('trace')
+
+        def stop_waiting() -> None:
+            nonlocal is_waiting
+
+            if is_waiting:
+                is_waiting = False
+                self._metrics.waiting_requests_count -= 1
+                self._record_wait_time(time.monotonic() - started_at)
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            # The first connection level event means that the pool has handed out a connection
+            if event_name.startswith('connection.') or event_name.endswith('.send_request_headers.started'):
+                stop_waiting()
+
+            if request_trace is not None:
+                await request_trace(event_name, info)
+
+        request.extensions['trace'] = trace
+
+        self._metrics.active_requests_count += 1
+        self._metrics.waiting_requests_count += 1
+
+        try:
+            response = await self._transport.handle_async_request(request)
+
+        except BaseException as e:
+            if isinstance(e, httpx.PoolTimeout):
+                UPSTREAM_POOL_TIMEOUTS.labels(self._target).inc()
+
+            stop_waiting()
+            self._release()
+            self._record_duration(time.monotonic() - started_at, status='error')
+            raise
+
+        stop_waiting()
+        self._record_duration(time.monotonic() - started_at, status=str(response.status_code))
+
+        # An async transport always returns an async stream, the response type only does not say so
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+
+        # The connection stays checked out of the pool until the response body is closed
+        response.stream = HttpPoolMetricsStream(stream=response.stream, on_close=self._release)
+
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _record_wait_time(self, wait_time: float) -> None:
+        UPSTREAM_POOL_WAIT_DURATION.labels(self._target).observe(wait_time)
+
+    def _record_duration(self, duration: float, *, status: str) -> None:
+        UPSTREAM_REQUEST_DURATION.labels(self._target, status).observe(duration)
+
+    def _release(self) -> None:
+        self._metrics.active_requests_count -= 1
+
+
+class HttpPoolMetricsStream(httpx.AsyncByteStream):
+    _stream: httpx.AsyncByteStream
+    _on_close: Callable[[], None] | None
+
+    def __init__(self, *, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class HttpClientRegistry:
+    _clients: dict[str, httpx.AsyncClient]
+    _metrics: dict[str, HttpPoolMetrics]
+
+    def __init__(self, *, pools: Mapping[str, HttpClientConfig]) -> None:
+        self._clients = {}
+        self._metrics = {}
+
+        for name, pool_config in pools.items():
+            metrics = HttpPoolMetrics(max_connections=pool_config.pool_max_connections)
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=pool_config.pool_max_connections,
+                    max_keepalive_connections=pool_config.pool_max_keepalive_connections,
+                    keepalive_expiry=pool_config.pool_keepalive_expiry_in_seconds,
+                ),
+                http2=pool_config.http2,
+            )
+
+            self._clients[name] = httpx.AsyncClient(
+                transport=HttpPoolMetricsTransport(transport=transport, target=name, metrics=metrics),
+                timeout=httpx.Timeout(
+                    pool_config.timeout_in_seconds,
+                    connect=pool_config.connect_timeout_in_seconds,
+                    pool=pool_config.pool_timeout_in_seconds,
+                ),
+            )
+            self._metrics[name] = metrics
+
+    def get_client(self, name: str) -> httpx.AsyncClient:
+        return self._clients[name]
+
+    def get_metrics(self) -> dict[str, HttpPoolMetrics]:
+        return dict(self._metrics)
+
+    async def aclose(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+
+    async def __aenter__(self) -> HttpClientRegistry:
+        return self
+
+    async def __aexit__(self,
+                        exc_type: type[BaseException] | None,
+                        exc_value: BaseException | None,
+                        traceback: TracebackType | None) -> None:
+        await self.aclose()
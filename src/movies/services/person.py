@@ -3,12 +3,9 @@ from __future__ import annotations
 import uuid
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Request, Depends
 
-from .search import (
-    AbstractSearchService,
-    SearchServiceDep,
-)
+from .search import AbstractSearchService
 from ..models import Person
 
 
@@ -49,8 +46,8 @@ class PersonService:
         return Person(**data)
 
 
-async def get_person_service(search_service: SearchServiceDep) -> PersonService:
-    return PersonService(search_service=search_service)
+async def get_person_service(request: Request) -> PersonService:
+    return request.state.person_service
 
 
 PersonServiceDep = Annotated[PersonService, Depends(get_person_service)]
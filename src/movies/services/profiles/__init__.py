@@ -1,9 +1,14 @@
+from .breaker import create_profiles_circuit_breaker
+from .client import ProfilesServiceClient
+from .exceptions import ProfilesServiceUnavailable
 from .models import (
     FilmRating,
     FilmReviews,
+    FilmUsers,
     Review,
 )
 from .service import (
     AbstractProfilesService,
+    ProfilesService,
     ProfilesServiceDep,
 )
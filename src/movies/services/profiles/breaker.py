@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import httpx
+from fastapi import status
+
+from ..http import CircuitBreaker
+from ...core import settings
+
+
+def create_profiles_circuit_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        window_in_seconds=settings.profiles.circuit_breaker_window_in_seconds,
+        min_calls=settings.profiles.circuit_breaker_min_calls,
+        failure_rate_threshold=settings.profiles.circuit_breaker_failure_rate,
+        slow_call_duration_in_seconds=settings.profiles.circuit_breaker_slow_call_in_seconds,
+        slow_call_rate_threshold=settings.profiles.circuit_breaker_slow_call_rate,
+        open_in_seconds=settings.profiles.circuit_breaker_open_in_seconds,
+        is_failure=is_profiles_failure,
+    )
+
+
+def is_profiles_failure(e: Exception) -> bool:
+    # A missing permission is a regular answer of a healthy service, any other error status is a failure
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code != status.HTTP_403_FORBIDDEN
+
+    return True
@@ -1,51 +1,37 @@
 from __future__ import annotations
 
 import uuid
-from typing import Annotated
 
 import httpx
-from fastapi import Depends
 
-from .models import (
-    FilmRating,
-    FilmReviews,
+from .models import FilmUsers
+from ..auth import create_token_headers
+from ..http import (
+    CircuitBreaker,
+    HttpClient,
 )
-from ..auth import (
-    TokenDep,
-    TokenHttpClient,
-)
-from ..http import HttpClient
 from ...core import settings
-from ...dependencies import HTTPXClientDep
 
 
 class ProfilesServiceClient:
     _http_client: HttpClient
+    _circuit_breaker: CircuitBreaker
 
-    def __init__(self, *, httpx_client: httpx.AsyncClient, token: str) -> None:
-        self._http_client = TokenHttpClient(
+    def __init__(self, *, httpx_client: httpx.AsyncClient, circuit_breaker: CircuitBreaker) -> None:
+        self._http_client = HttpClient(
             httpx_client=httpx_client,
             base_url=settings.profiles.api_v1_url,
-            token=token,
-        )
-
-    async def get_film_rating(self, *, film_id: uuid.UUID) -> FilmRating:
-        response = await self._http_client.get(
-            settings.profiles.get_film_rating_url(film_id=film_id),
         )
+        self._circuit_breaker = circuit_breaker
 
-        return FilmRating.model_validate(response.json())
+    async def get_film_summary(self, *, film_id: uuid.UUID, token: str | None) -> FilmUsers:
+        # A malformed body is a failure of the service as well, so it is validated within the breaker call
+        return await self._circuit_breaker.call(lambda: self._get_film_summary(film_id=film_id, token=token))
 
-    async def get_film_reviews(self, *, film_id: uuid.UUID) -> FilmReviews:
+    async def _get_film_summary(self, *, film_id: uuid.UUID, token: str | None) -> FilmUsers:
         response = await self._http_client.get(
-            settings.profiles.get_film_reviews_url(film_id=film_id),
+            settings.profiles.get_film_summary_url(film_id=film_id),
+            headers=create_token_headers(token),
         )
 
-        return FilmReviews.model_validate(response.json())
-
-
-async def get_profiles_service_client(httpx_client: HTTPXClientDep, token: TokenDep) -> ProfilesServiceClient:
-    return ProfilesServiceClient(httpx_client=httpx_client, token=token)
-
-
-ProfilesServiceClientDep = Annotated[ProfilesServiceClient, Depends(get_profiles_service_client)]
+        return FilmUsers.model_validate(response.json())
@@ -7,6 +7,11 @@ import uuid
 from pydantic import BaseModel
 
 
+class FilmUsers(BaseModel):
+    rating: FilmRating | None
+    reviews: FilmReviews | None
+
+
 class FilmRating(BaseModel):
     rating: decimal.Decimal | None
 
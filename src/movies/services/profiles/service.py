@@ -1,48 +1,109 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import logging
 import uuid
 from typing import Annotated, Any
 
 import httpx
-from fastapi import HTTPException, Depends, status
-
-from .client import (
-    ProfilesServiceClient,
-    ProfilesServiceClientDep,
-)
-from .models import (
-    FilmRating,
-    FilmReviews,
+from fastapi import Request, Depends, status
+
+from .client import ProfilesServiceClient
+from .exceptions import ProfilesServiceUnavailable
+from .models import FilmUsers
+from ..cache import (
+    AbstractCache,
+    AbstractCacheService,
+    CacheUnavailableError,
+    SingleFlight,
+    get_cache_codec,
 )
+from ..http import CircuitBreakerOpenError
+from ...core import settings
+from ...core.deadline import get_remaining_time
 
+logger = logging.getLogger(__name__)
 
-class AbstractProfilesService(abc.ABC):
-    @abc.abstractmethod
-    async def get_film_rating(self, *, film_id: uuid.UUID) -> FilmRating | None: ...
 
+class AbstractProfilesService(abc.ABC):
     @abc.abstractmethod
-    async def get_film_reviews(self, *, film_id: uuid.UUID) -> FilmReviews | None: ...
+    async def get_film_users(self, *, film_id: uuid.UUID, token: str | None) -> FilmUsers | None: ...
 
 
 class ProfilesService(AbstractProfilesService):
     _profiles_service_client: ProfilesServiceClient
-
-    def __init__(self, *, profiles_service_client: ProfilesServiceClient) -> None:
+    _cache: AbstractCache
+    _single_flight: SingleFlight
+
+    def __init__(self,
+                 *,
+                 profiles_service_client: ProfilesServiceClient,
+                 cache_service: AbstractCacheService,
+                 single_flight: SingleFlight) -> None:
         self._profiles_service_client = profiles_service_client
+        self._cache = cache_service.get_cache(key_prefix='profiles-film-users', key_version='1.0')
+        self._single_flight = single_flight
 
-    async def get_film_rating(self, *, film_id: uuid.UUID) -> FilmRating | None:
-        return await GetFilmRatingRequest(
-            profiles_service_client=self._profiles_service_client,
-            film_id=film_id,
-        ).send_request()
+    async def get_film_users(self, *, film_id: uuid.UUID, token: str | None) -> FilmUsers | None:
+        film_users = await self._get_cached_film_users(film_id=film_id)
+
+        if film_users is not None:
+            return film_users
+
+        try:
+            async with asyncio.timeout(get_remaining_time(settings.profiles.film_users_budget_in_seconds)):
+                # The request keeps running after the budget is exceeded, so its result still gets cached
+                film_users = await self._single_flight.do(
+                    f'profiles-film-users:{film_id}',
+                    lambda: self._fetch_film_users(film_id=film_id, token=token),
+                )
+
+        except (TimeoutError, ProfilesServiceUnavailable):
+            # The film is returned without user data rather than making the client wait or fail
+            return None
+
+        if film_users is None:
+            return FilmUsers(rating=None, reviews=None)
+
+        return film_users
 
-    async def get_film_reviews(self, *, film_id: uuid.UUID) -> FilmReviews | None:
-        return await GetFilmReviewsRequest(
+    async def _get_cached_film_users(self, *, film_id: uuid.UUID) -> FilmUsers | None:
+        if not settings.profiles.film_users_cache_enabled:
+            return None
+
+        try:
+            film_users_data = await self._cache.get(str(film_id))
+
+        except CacheUnavailableError as e:
+            logger.warning('Profiles cache is unavailable: %r', e.__cause__)
+            return None
+
+        if film_users_data is None:
+            return None
+
+        return FilmUsers.model_validate(get_cache_codec().decode(film_users_data))
+
+    async def _fetch_film_users(self, *, film_id: uuid.UUID, token: str | None) -> FilmUsers | None:
+        film_users = await GetFilmSummaryRequest(
             profiles_service_client=self._profiles_service_client,
             film_id=film_id,
+            token=token,
         ).send_request()
 
+        if film_users is not None and settings.profiles.film_users_cache_enabled:
+            try:
+                await self._cache.set(
+                    str(film_id),
+                    get_cache_codec().encode(film_users.model_dump(mode='json')),
+                    timeout=settings.profiles.film_users_cache_expire_in_seconds,
+                )
+
+            except CacheUnavailableError as e:
+                logger.warning('Profiles cache is unavailable: %r', e.__cause__)
+
+        return film_users
+
 
 class ProfilesServiceRequest[TResponse](abc.ABC):
     _profiles_service_client: ProfilesServiceClient
@@ -58,40 +119,32 @@ class ProfilesServiceRequest[TResponse](abc.ABC):
             if e.response.status_code == status.HTTP_403_FORBIDDEN:
                 return None
 
-            raise
+            raise ProfilesServiceUnavailable from e
 
-        except httpx.HTTPError:
-            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        # A body that is not JSON or does not match the models raises a ValueError
+        except (httpx.HTTPError, ValueError, CircuitBreakerOpenError) as e:
+            raise ProfilesServiceUnavailable from e
 
     @abc.abstractmethod
     async def _send_request(self) -> TResponse:
         ...
 
 
-class GetFilmRatingRequest(ProfilesServiceRequest[FilmRating]):
-    _film_id: uuid.UUID
-
-    def __init__(self, *, film_id: uuid.UUID, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
-        self._film_id = film_id
-
-    async def _send_request(self) -> FilmRating:
-        return await self._profiles_service_client.get_film_rating(film_id=self._film_id)
-
-
-class GetFilmReviewsRequest(ProfilesServiceRequest[FilmReviews]):
+class GetFilmSummaryRequest(ProfilesServiceRequest[FilmUsers]):
     _film_id: uuid.UUID
+    _token: str | None
 
-    def __init__(self, *, film_id: uuid.UUID, **kwargs: Any) -> None:
+    def __init__(self, *, film_id: uuid.UUID, token: str | None, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._film_id = film_id
+        self._token = token
 
-    async def _send_request(self) -> FilmReviews:
-        return await self._profiles_service_client.get_film_reviews(film_id=self._film_id)
+    async def _send_request(self) -> FilmUsers:
+        return await self._profiles_service_client.get_film_summary(film_id=self._film_id, token=self._token)
 
 
-async def get_profiles_service(profiles_service_client: ProfilesServiceClientDep) -> AbstractProfilesService:
-    return ProfilesService(profiles_service_client=profiles_service_client)
+async def get_profiles_service(request: Request) -> AbstractProfilesService:
+    return request.state.profiles_service
 
 
 ProfilesServiceDep = Annotated[AbstractProfilesService, Depends(get_profiles_service)]
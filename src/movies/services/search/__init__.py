@@ -1,4 +1,9 @@
+from .backends import InvalidPageCursorError
 from .service import (
     AbstractSearchService,
+    SearchService,
     SearchServiceDep,
+    SEARCH_CACHE_KEY_PREFIX,
+    SEARCH_CACHE_KEY_VERSION,
+    collect_search_cache_tags,
 )
@@ -4,6 +4,7 @@ from .base import (
     AbstractCompiledQuery,
     AbstractGetQuery,
     AbstractSearchQuery,
+    AbstractPageQuery,
+    InvalidPageCursorError,
     AbstractQueryFactory,
 )
-from .dependencies import SearchBackendDep
@@ -6,5 +6,8 @@ from .query import (
     AbstractCompiledGetQuery,
     AbstractSearchQuery,
     AbstractCompiledSearchQuery,
+    AbstractPageQuery,
+    AbstractCompiledPageQuery,
+    InvalidPageCursorError,
     AbstractQueryFactory,
 )
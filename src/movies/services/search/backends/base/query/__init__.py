@@ -6,4 +6,7 @@ from .query import (
     AbstractCompiledGetQuery,
     AbstractSearchQuery,
     AbstractCompiledSearchQuery,
+    AbstractPageQuery,
+    AbstractCompiledPageQuery,
+    InvalidPageCursorError,
 )
@@ -6,6 +6,7 @@ import uuid
 from .query import (
     AbstractGetQuery,
     AbstractSearchQuery,
+    AbstractPageQuery,
 )
 
 
@@ -14,7 +15,7 @@ class AbstractQueryFactory(abc.ABC):
     def get_film(self, *, film_id: uuid.UUID) -> AbstractGetQuery: ...
 
     @abc.abstractmethod
-    def films_by_person(self, *, person_id: uuid.UUID) -> AbstractSearchQuery: ...
+    def get_film_short(self, *, film_id: uuid.UUID) -> AbstractGetQuery: ...
 
     @abc.abstractmethod
     def films_list(self,
@@ -22,10 +23,16 @@ class AbstractQueryFactory(abc.ABC):
                    sort: dict,
                    page_number: int,
                    page_size: int,
-                   genre_id: uuid.UUID | None = None) -> AbstractSearchQuery: ...
+                   page_cursor: str | None = None,
+                   genre_id: uuid.UUID | None = None) -> AbstractPageQuery: ...
 
     @abc.abstractmethod
-    def search_films(self, *, query: str, page_number: int, page_size: int) -> AbstractSearchQuery: ...
+    def search_films(self,
+                     *,
+                     query: str,
+                     page_number: int,
+                     page_size: int,
+                     page_cursor: str | None = None) -> AbstractPageQuery: ...
 
     @abc.abstractmethod
     def get_genre(self, *, genre_id: uuid.UUID) -> AbstractGetQuery: ...
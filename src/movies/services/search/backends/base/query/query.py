@@ -14,6 +14,13 @@ class AbstractCompiledQuery[TResult](Parameterizable):
     @abc.abstractmethod
     async def execute(self) -> TResult: ...
 
+    # Cached negative entries hold no result even for queries that never return None
+    @abc.abstractmethod
+    def get_cache_tags(self, result: TResult | None) -> list[str]: ...
+
+    def is_cacheable(self) -> bool:
+        return True
+
 
 class AbstractGetQuery(AbstractQuery[dict | None]):
     @abc.abstractmethod
@@ -31,3 +38,16 @@ class AbstractSearchQuery(AbstractQuery[list[dict] | None]):
 
 class AbstractCompiledSearchQuery(AbstractCompiledQuery[list[dict] | None], abc.ABC):
     pass
+
+
+class AbstractPageQuery(AbstractQuery[dict | None]):
+    @abc.abstractmethod
+    def compile(self) -> AbstractCompiledPageQuery: ...
+
+
+class AbstractCompiledPageQuery(AbstractCompiledQuery[dict | None], abc.ABC):
+    pass
+
+
+class InvalidPageCursorError(Exception):
+    pass
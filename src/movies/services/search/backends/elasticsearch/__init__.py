@@ -1,4 +1,3 @@
-from .backend import (
-    ElasticsearchSearchBackend,
-    ElasticsearchSearchBackendDep,
-)
+from .batch import ElasticsearchBatcher
+from .backend import ElasticsearchSearchBackend
+from .query import create_document_cache_tag
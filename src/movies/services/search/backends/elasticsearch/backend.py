@@ -1,51 +1,76 @@
 from __future__ import annotations
 
-from typing import Annotated
+from collections.abc import Mapping
+from typing import Any
 
 import backoff
 import elasticsearch
-from fastapi import Depends
+from elastic_transport import ObjectApiResponse
 
+from .batch import ElasticsearchBatcher
 from .query import (
     CompiledElasticsearchGetQuery,
     CompiledElasticsearchSearchQuery,
+    CompiledElasticsearchPageQuery,
+    ElasticsearchPageCursor,
     ElasticsearchQueryFactory,
 )
 from ..base import AbstractSearchBackend
-from .....db import ElasticsearchClientDep
+from .....core import settings
+from .....core.deadline import get_remaining_time
+
+# Retries are bounded both by the settings and by the deadline of the request
+retry_elasticsearch = backoff.on_exception(
+    backoff.expo,
+    (
+        elasticsearch.exceptions.ConnectionError,
+        elasticsearch.exceptions.ConnectionTimeout,
+    ),
+    max_tries=lambda: settings.elasticsearch.retry_max_tries,
+    max_time=lambda: get_remaining_time(settings.elasticsearch.retry_max_time_in_seconds),
+    jitter=backoff.full_jitter,
+    factor=lambda: settings.elasticsearch.retry_base_wait_in_seconds,
+    max_value=lambda: settings.elasticsearch.retry_max_wait_in_seconds,
+)
 
 
 class ElasticsearchSearchBackend(AbstractSearchBackend):
     _elasticsearch_client: elasticsearch.AsyncElasticsearch
+    _batcher: ElasticsearchBatcher | None
     _query_factory: ElasticsearchQueryFactory
 
-    def __init__(self, *, elasticsearch_client: elasticsearch.AsyncElasticsearch) -> None:
+    def __init__(self,
+                 *,
+                 elasticsearch_client: elasticsearch.AsyncElasticsearch,
+                 batcher: ElasticsearchBatcher | None = None) -> None:
         self._elasticsearch_client = elasticsearch_client
+        self._batcher = batcher
         self._query_factory = ElasticsearchQueryFactory(backend=self)
 
     def create_query(self) -> ElasticsearchQueryFactory:
         return self._query_factory
 
-    @backoff.on_exception(backoff.expo, (
-            elasticsearch.exceptions.ConnectionError,
-            elasticsearch.exceptions.ConnectionTimeout,
-    ))
+    @retry_elasticsearch
     async def get(self, query: CompiledElasticsearchGetQuery) -> dict | None:
+        if self._batcher is not None:
+            return await self._batcher.get(index=query.index, id=query.id, source_fields=query.source_fields)
+
         try:
-            response = await self._elasticsearch_client.get(index=query.index, id=query.id)
+            response = await self._elasticsearch_client.get(
+                index=query.index,
+                id=query.id,
+                source=query.source_fields,
+            )
         except elasticsearch.NotFoundError:
             return None
 
         return response['_source']
 
-    @backoff.on_exception(backoff.expo, (
-            elasticsearch.exceptions.ConnectionError,
-            elasticsearch.exceptions.ConnectionTimeout,
-    ))
+    @retry_elasticsearch
     async def search(self, query: CompiledElasticsearchSearchQuery) -> list[dict] | None:
-        try:
-            response = await self._elasticsearch_client.search(index=query.index, body=query.body)
-        except elasticsearch.NotFoundError:
+        response = await self._search(index=query.index, body=query.body)
+
+        if response is None:
             return None
 
         results = response['hits']['hits']
@@ -55,9 +80,107 @@ class ElasticsearchSearchBackend(AbstractSearchBackend):
 
         return [result['_source'] for result in results]
 
+    @retry_elasticsearch
+    async def search_page(self, query: CompiledElasticsearchPageQuery) -> dict | None:
+        pit_id: str | None = None
+        page_cursor = query.page_cursor
+
+        if page_cursor is None:
+            search_response = await self._search(index=query.index, body=query.body)
+
+            if search_response is None:
+                return None
+
+            results = search_response['hits']['hits']
+        else:
+            try:
+                search_after_response = await self._search_after(query, page_cursor=page_cursor)
+            except elasticsearch.NotFoundError:
+                return None
+
+            pit_id = search_after_response['pit_id']
+            results = search_after_response['hits']['hits']
+
+        next_page_cursor: str | None = None
+
+        if len(results) == query.body['size']:
+            next_page_cursor = ElasticsearchPageCursor(
+                query_hash=query.query_hash,
+                search_after=results[-1]['sort'],
+                pit_id=pit_id,
+            ).encode()
+        elif pit_id is not None:
+            await self._close_point_in_time(pit_id)
+
+        if not results:
+            return None
+
+        return {
+            'results': [result['_source'] for result in results],
+            'next_page_cursor': next_page_cursor,
+        }
+
+    async def _search(self, *, index: str, body: dict) -> Mapping[str, Any] | None:
+        # Concurrent searches are sent together in one _msearch request
+        if self._batcher is not None:
+            return await self._batcher.search(index=index, body=body)
+
+        try:
+            response = await self._elasticsearch_client.search(index=index, body=body)
+        except elasticsearch.NotFoundError:
+            return None
+
+        return response.body
 
-async def get_search_backend(elasticsearch_client: ElasticsearchClientDep) -> ElasticsearchSearchBackend:
-    return ElasticsearchSearchBackend(elasticsearch_client=elasticsearch_client)
+    async def _search_after(self,
+                            query: CompiledElasticsearchPageQuery,
+                            *,
+                            page_cursor: ElasticsearchPageCursor) -> ObjectApiResponse:
+        if page_cursor.pit_id is not None:
+            try:
+                return await self._search_point_in_time(query, page_cursor=page_cursor, pit_id=page_cursor.pit_id)
 
+            except elasticsearch.NotFoundError:
+                # An expired point in time is replaced, the sort values still hold the position
+                pass
 
-ElasticsearchSearchBackendDep = Annotated[ElasticsearchSearchBackend, Depends(get_search_backend)]
+        response = await self._elasticsearch_client.open_point_in_time(
+            index=query.index,
+            keep_alive=settings.elasticsearch.point_in_time_keep_alive,
+        )
+        pit_id = response['id']
+
+        try:
+            return await self._search_point_in_time(query, page_cursor=page_cursor, pit_id=pit_id)
+
+        except Exception:
+            # The page is retried with a point in time of its own, nobody else would close this one
+            await self._close_point_in_time(pit_id)
+            raise
+
+    async def _search_point_in_time(self,
+                                    query: CompiledElasticsearchPageQuery,
+                                    *,
+                                    page_cursor: ElasticsearchPageCursor,
+                                    pit_id: str) -> ObjectApiResponse:
+        return await self._elasticsearch_client.search(body={
+            **query.body,
+            'pit': {
+                'id': pit_id,
+                'keep_alive': settings.elasticsearch.point_in_time_keep_alive,
+            },
+            'search_after': page_cursor.search_after,
+            'track_total_hits': False,
+        })
+
+    async def _close_point_in_time(self, pit_id: str) -> None:
+        try:
+            await self._elasticsearch_client.close_point_in_time(id=pit_id)
+
+        except (
+                elasticsearch.NotFoundError,
+                elasticsearch.ConnectionError,
+                elasticsearch.ConnectionTimeout,
+        ):
+            # A point in time that cannot be closed expires on its own
+            pass
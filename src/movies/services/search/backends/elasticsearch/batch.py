@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+import elasticsearch
+
+
+class ElasticsearchBatchError(Exception):
+    error: Mapping[str, Any]
+
+    def __init__(self, error: Mapping[str, Any]) -> None:
+        super().__init__(error.get('reason') or error.get('type'))
+        self.error = error
+
+
+@dataclasses.dataclass(kw_only=True)
+class MicroBatchItem[TRequest, TResult]:
+    request: TRequest
+    future: asyncio.Future[TResult]
+
+
+class MicroBatch[TRequest, TResult]:
+    _send: Callable[[list[TRequest]], Awaitable[list[TResult | Exception]]]
+    _window_in_seconds: float
+    _max_size: int
+
+    _items: list[MicroBatchItem[TRequest, TResult]]
+    _flush_handle: asyncio.TimerHandle | None
+    _tasks: set[asyncio.Task]
+
+    def __init__(self,
+                 *,
+                 send: Callable[[list[TRequest]], Awaitable[list[TResult | Exception]]],
+                 window_in_seconds: float,
+                 max_size: int) -> None:
+        self._send = send
+        self._window_in_seconds = window_in_seconds
+        self._max_size = max_size
+
+        self._items = []
+        self._flush_handle = None
+        self._tasks = set()
+
+    async def submit(self, request: TRequest) -> TResult:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[TResult] = loop.create_future()
+        self._items.append(MicroBatchItem(request=request, future=future))
+
+        if len(self._items) >= self._max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window_in_seconds, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        items, self._items = self._items, []
+
+        if not items:
+            return
+
+        task = asyncio.create_task(self._send_items(items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_items(self, items: list[MicroBatchItem[TRequest, TResult]]) -> None:
+        try:
+            results = await self._send([item.request for item in items])
+
+        # A failed batch request fails every call in it, so that each caller retries on its own
+        except Exception as e:
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+
+            return
+
+        for item, result in zip(items, results):
+            # The caller may have been cancelled while the batch was in flight
+            if item.future.done():
+                continue
+
+            if isinstance(result, Exception):
+                item.future.set_exception(result)
+            else:
+                item.future.set_result(result)
+
+
+class ElasticsearchBatcher:
+    _elasticsearch_client: elasticsearch.AsyncElasticsearch
+    _gets: MicroBatch[tuple[str, str, list[str] | None], dict | None]
+    _searches: MicroBatch[tuple[str, dict], Mapping[str, Any] | None]
+
+    def __init__(self,
+                 *,
+                 elasticsearch_client: elasticsearch.AsyncElasticsearch,
+                 window_in_seconds: float,
+                 max_size: int) -> None:
+        self._elasticsearch_client = elasticsearch_client
+        self._gets = MicroBatch(send=self._mget, window_in_seconds=window_in_seconds, max_size=max_size)
+        self._searches = MicroBatch(send=self._msearch, window_in_seconds=window_in_seconds, max_size=max_size)
+
+    async def get(self, *, index: str, id: str, source_fields: list[str] | None = None) -> dict | None:
+        return await self._gets.submit((index, id, source_fields))
+
+    async def search(self, *, index: str, body: dict) -> Mapping[str, Any] | None:
+        return await self._searches.submit((index, body))
+
+    async def _mget(self, requests: list[tuple[str, str, list[str] | None]]) -> list[dict | None | Exception]:
+        docs: list[dict] = []
+
+        for index, id, source_fields in requests:
+            doc: dict = {
+                '_index': index,
+                '_id': id,
+            }
+
+            if source_fields is not None:
+                doc['_source'] = source_fields
+
+            docs.append(doc)
+
+        response = await self._elasticsearch_client.mget(docs=docs)
+
+        return [self._get_document_result(document) for document in response['docs']]
+
+    async def _msearch(self, requests: list[tuple[str, dict]]) -> list[Mapping[str, Any] | None | Exception]:
+        searches: list[dict] = []
+
+        for index, body in requests:
+            searches.append({'index': index})
+            searches.append(body)
+
+        response = await self._elasticsearch_client.msearch(searches=searches)
+
+        return [self._get_search_result(search_response) for search_response in response['responses']]
+
+    def _get_document_result(self, document: Mapping[str, Any]) -> dict | None | Exception:
+        error = document.get('error')
+
+        if error is not None:
+            if error.get('type') == 'index_not_found_exception':
+                return None
+
+            return ElasticsearchBatchError(error)
+
+        if not document.get('found'):
+            return None
+
+        return document['_source']
+
+    def _get_search_result(self, search_response: Mapping[str, Any]) -> Mapping[str, Any] | None | Exception:
+        error = search_response.get('error')
+
+        if error is not None:
+            if search_response.get('status') == 404:
+                return None
+
+            return ElasticsearchBatchError(error)
+
+        return search_response
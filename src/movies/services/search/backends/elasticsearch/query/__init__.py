@@ -4,4 +4,9 @@ from .query import (
     CompiledElasticsearchGetQuery,
     ElasticsearchSearchQuery,
     CompiledElasticsearchSearchQuery,
+    ElasticsearchPageQuery,
+    CompiledElasticsearchPageQuery,
+    ElasticsearchPageCursor,
+    create_document_cache_tag,
+    create_index_cache_tag,
 )
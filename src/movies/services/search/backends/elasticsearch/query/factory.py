@@ -10,11 +10,12 @@ from .indices import (
 )
 from .query import (
     ElasticsearchGetQuery,
-    ElasticsearchSearchQuery,
+    ElasticsearchPageQuery,
 )
 from ...base import (
     AbstractGetQuery,
     AbstractSearchQuery,
+    AbstractPageQuery,
     AbstractQueryFactory,
 )
 
@@ -31,29 +32,37 @@ class ElasticsearchQueryFactory(AbstractQueryFactory):
     def get_film(self, *, film_id: uuid.UUID) -> ElasticsearchGetQuery:
         return films.GetFilmQuery(backend=self._backend, film_id=film_id)
 
-    def films_by_person(self, *, person_id: uuid.UUID) -> ElasticsearchSearchQuery:
-        return films.FilmsByPersonQuery(backend=self._backend, person_id=person_id)
+    def get_film_short(self, *, film_id: uuid.UUID) -> ElasticsearchGetQuery:
+        return films.GetFilmShortQuery(backend=self._backend, film_id=film_id)
 
     def films_list(self,
                    *,
                    sort: dict,
                    page_number: int,
                    page_size: int,
-                   genre_id: uuid.UUID | None = None) -> ElasticsearchSearchQuery:
+                   page_cursor: str | None = None,
+                   genre_id: uuid.UUID | None = None) -> ElasticsearchPageQuery:
         return films.FilmsListQuery(
             backend=self._backend,
             sort=sort,
             page_number=page_number,
             page_size=page_size,
+            page_cursor=page_cursor,
             genre_id=genre_id,
         )
 
-    def search_films(self, *, query: str, page_number: int, page_size: int) -> AbstractSearchQuery:
+    def search_films(self,
+                     *,
+                     query: str,
+                     page_number: int,
+                     page_size: int,
+                     page_cursor: str | None = None) -> AbstractPageQuery:
         return films.SearchFilmsQuery(
             backend=self._backend,
             query=query,
             page_number=page_number,
             page_size=page_size,
+            page_cursor=page_cursor,
         )
 
     def get_genre(self, *, genre_id: uuid.UUID) -> AbstractGetQuery:
@@ -6,13 +6,15 @@ from typing import TYPE_CHECKING
 
 from ..query import (
     ElasticsearchGetQuery,
-    ElasticsearchSearchQuery,
+    ElasticsearchPageQuery,
 )
 from .......core.config import settings
 
 if TYPE_CHECKING:
     from ...backend import ElasticsearchSearchBackend
 
+FILM_SHORT_SOURCE_FIELDS = ['id', 'title', 'rating']
+
 
 class GetFilmQuery(ElasticsearchGetQuery):
     _film_id: uuid.UUID
@@ -28,61 +30,17 @@ class GetFilmQuery(ElasticsearchGetQuery):
         return str(self._film_id)
 
 
-class BaseSearchFilmsQuery(ElasticsearchSearchQuery, abc.ABC):
-    def get_index(self) -> str:
-        return settings.elasticsearch.index_name_films
-
-
-class FilmsByPersonQuery(BaseSearchFilmsQuery):
-    _person_id: uuid.UUID
+class GetFilmShortQuery(GetFilmQuery):
+    def get_source_fields(self) -> list[str]:
+        return FILM_SHORT_SOURCE_FIELDS
 
-    def __init__(self, *, backend: ElasticsearchSearchBackend, person_id: uuid.UUID) -> None:
-        super().__init__(backend=backend)
-        self._person_id = person_id
 
-    def get_body(self) -> dict:
-        return {
-            'query': {
-                'bool': {
-                    'should': [
-                        {
-                            'nested': {
-                                'path': 'actors',
-                                'query': {
-                                    'term': {
-                                        'actors.id': str(self._person_id),
-                                    },
-                                },
-                            },
-                        },
-                        {
-                            'nested': {
-                                'path': 'directors',
-                                'query': {
-                                    'term': {
-                                        'directors.id': str(self._person_id),
-                                    },
-                                },
-                            },
-                        },
-                        {
-                            'nested': {
-                                'path': 'writers',
-                                'query': {
-                                    'term': {
-                                        'writers.id': str(self._person_id),
-                                    },
-                                },
-                            },
-                        },
-                    ],
-                    'minimum_should_match': 1,
-                },
-            },
-        }
+class BasePageFilmsQuery(ElasticsearchPageQuery, abc.ABC):
+    def get_index(self) -> str:
+        return settings.elasticsearch.index_name_films
 
 
-class FilmsListQuery(BaseSearchFilmsQuery):
+class FilmsListQuery(BasePageFilmsQuery):
     _sort: dict
     _page_number: int
     _page_size: int
@@ -94,20 +52,33 @@ class FilmsListQuery(BaseSearchFilmsQuery):
                  sort: dict,
                  page_number: int,
                  page_size: int,
+                 page_cursor: str | None = None,
                  genre_id: uuid.UUID | None = None) -> None:
-        super().__init__(backend=backend)
+        super().__init__(backend=backend, page_cursor=page_cursor)
         self._sort = sort
         self._page_number = page_number
         self._page_size = page_size
         self._genre_id = genre_id
 
     def get_body(self) -> dict:
-        body = {
-            'sort': {
+        sort = [
+            {
                 self._sort['field']: {
                     'order': self._sort['order'],
                 },
             },
+        ]
+
+        # Cursors need a total order, so ties are broken by the unique document id
+        if self._sort['field'] != 'id':
+            sort.append({
+                'id': {
+                    'order': 'asc',
+                },
+            })
+
+        body = {
+            'sort': sort,
             'size': self._page_size,
             'from': (self._page_number - 1) * self._page_size,
         }
@@ -126,8 +97,11 @@ class FilmsListQuery(BaseSearchFilmsQuery):
 
         return body
 
+    def get_source_fields(self) -> list[str]:
+        return FILM_SHORT_SOURCE_FIELDS
+
 
-class SearchFilmsQuery(BaseSearchFilmsQuery):
+class SearchFilmsQuery(BasePageFilmsQuery):
     _query: str
     _page_number: int
     _page_size: int
@@ -137,8 +111,9 @@ class SearchFilmsQuery(BaseSearchFilmsQuery):
                  backend: ElasticsearchSearchBackend,
                  query: str,
                  page_number: int,
-                 page_size: int) -> None:
-        super().__init__(backend=backend)
+                 page_size: int,
+                 page_cursor: str | None = None) -> None:
+        super().__init__(backend=backend, page_cursor=page_cursor)
         self._query = query
         self._page_number = page_number
         self._page_size = page_size
@@ -150,6 +125,17 @@ class SearchFilmsQuery(BaseSearchFilmsQuery):
                     'title': self._query,
                 },
             },
+            'sort': [
+                '_score',
+                {
+                    'id': {
+                        'order': 'asc',
+                    },
+                },
+            ],
             'size': self._page_size,
             'from': (self._page_number - 1) * self._page_size,
         }
+
+    def get_source_fields(self) -> list[str]:
+        return FILM_SHORT_SOURCE_FIELDS
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import abc
+import base64
+import dataclasses
+import hashlib
+import json
 from typing import TYPE_CHECKING
 
 from ...base import (
@@ -8,6 +12,9 @@ from ...base import (
     AbstractCompiledGetQuery,
     AbstractSearchQuery,
     AbstractCompiledSearchQuery,
+    AbstractPageQuery,
+    AbstractCompiledPageQuery,
+    InvalidPageCursorError,
 )
 
 if TYPE_CHECKING:
@@ -25,6 +32,7 @@ class ElasticsearchGetQuery(AbstractGetQuery):
             backend=self._backend,
             index=self.get_index(),
             id=self.get_id(),
+            source_fields=self.get_source_fields(),
         )
 
     @abc.abstractmethod
@@ -33,20 +41,26 @@ class ElasticsearchGetQuery(AbstractGetQuery):
     @abc.abstractmethod
     def get_id(self) -> str: ...
 
+    def get_source_fields(self) -> list[str] | None:
+        return None
+
 
 class CompiledElasticsearchGetQuery(AbstractCompiledGetQuery):
     _backend: ElasticsearchSearchBackend
     _index: str
     _id: str
+    _source_fields: list[str] | None
 
     def __init__(self,
                  *,
                  backend: ElasticsearchSearchBackend,
                  index: str,
-                 id: str) -> None:
+                 id: str,
+                 source_fields: list[str] | None = None) -> None:
         self._backend = backend
         self._index = index
         self._id = id
+        self._source_fields = source_fields
 
     @property
     def index(self) -> str:
@@ -56,6 +70,10 @@ class CompiledElasticsearchGetQuery(AbstractCompiledGetQuery):
     def id(self) -> str:
         return self._id
 
+    @property
+    def source_fields(self) -> list[str] | None:
+        return self._source_fields
+
     async def execute(self) -> dict | None:
         return await self._backend.get(self)
 
@@ -63,12 +81,22 @@ class CompiledElasticsearchGetQuery(AbstractCompiledGetQuery):
         return f'get-{self._index}'
 
     def get_cache_params(self) -> dict:
-        return {
+        cache_params: dict = {
             'command': 'get',
             'index': self._index,
             'id': self._id,
         }
 
+        # Full documents keep the cache keys they had before projections were supported
+        if self._source_fields is not None:
+            cache_params['_source'] = self._source_fields
+
+        return cache_params
+
+    def get_cache_tags(self, result: dict | None) -> list[str]:
+        # Missing documents are tagged as well, so that indexing them evicts the negative entry
+        return [create_document_cache_tag(index=self._index, id=self._id)]
+
 
 class ElasticsearchSearchQuery(AbstractSearchQuery):
     _backend: ElasticsearchSearchBackend
@@ -80,7 +108,7 @@ class ElasticsearchSearchQuery(AbstractSearchQuery):
         return CompiledElasticsearchSearchQuery(
             backend=self._backend,
             index=self.get_index(),
-            body=self.get_body(),
+            body=create_source_body(self.get_body(), source_fields=self.get_source_fields()),
         )
 
     @abc.abstractmethod
@@ -89,6 +117,9 @@ class ElasticsearchSearchQuery(AbstractSearchQuery):
     @abc.abstractmethod
     def get_body(self) -> dict: ...
 
+    def get_source_fields(self) -> list[str] | None:
+        return None
+
 
 class CompiledElasticsearchSearchQuery(AbstractCompiledSearchQuery):
     _backend: ElasticsearchSearchBackend
@@ -124,3 +155,175 @@ class CompiledElasticsearchSearchQuery(AbstractCompiledSearchQuery):
             'index': self._index,
             'body': self._body,
         }
+
+    def get_cache_tags(self, result: list[dict] | None) -> list[str]:
+        # A newly indexed document can join any search, so every search is tagged with its index
+        cache_tags = [create_index_cache_tag(index=self._index)]
+
+        if result is not None:
+            cache_tags.extend(
+                create_document_cache_tag(index=self._index, id=document['id'])
+                for document in result
+                if 'id' in document
+            )
+
+        return cache_tags
+
+
+class ElasticsearchPageQuery(AbstractPageQuery):
+    _backend: ElasticsearchSearchBackend
+    _page_cursor: str | None
+
+    def __init__(self, *, backend: ElasticsearchSearchBackend, page_cursor: str | None = None) -> None:
+        self._backend = backend
+        self._page_cursor = page_cursor
+
+    def compile(self) -> CompiledElasticsearchPageQuery:
+        body = create_source_body(self.get_body(), source_fields=self.get_source_fields())
+        query_hash = create_query_hash(body)
+        page_cursor: ElasticsearchPageCursor | None = None
+
+        if self._page_cursor is not None:
+            page_cursor = ElasticsearchPageCursor.decode(self._page_cursor)
+
+            # A cursor can only continue the query it was issued for
+            if page_cursor.query_hash != query_hash:
+                raise InvalidPageCursorError
+
+            body = {key: value for key, value in body.items() if key != 'from'}
+
+        return CompiledElasticsearchPageQuery(
+            backend=self._backend,
+            index=self.get_index(),
+            body=body,
+            query_hash=query_hash,
+            page_cursor=page_cursor,
+        )
+
+    @abc.abstractmethod
+    def get_index(self) -> str: ...
+
+    @abc.abstractmethod
+    def get_body(self) -> dict: ...
+
+    def get_source_fields(self) -> list[str] | None:
+        return None
+
+
+class CompiledElasticsearchPageQuery(AbstractCompiledPageQuery):
+    _backend: ElasticsearchSearchBackend
+    _index: str
+    _body: dict
+    _query_hash: str
+    _page_cursor: ElasticsearchPageCursor | None
+
+    def __init__(self,
+                 *,
+                 backend: ElasticsearchSearchBackend,
+                 index: str,
+                 body: dict,
+                 query_hash: str,
+                 page_cursor: ElasticsearchPageCursor | None = None) -> None:
+        self._backend = backend
+        self._index = index
+        self._body = body
+        self._query_hash = query_hash
+        self._page_cursor = page_cursor
+
+    @property
+    def index(self) -> str:
+        return self._index
+
+    @property
+    def body(self) -> dict:
+        return self._body
+
+    @property
+    def query_hash(self) -> str:
+        return self._query_hash
+
+    @property
+    def page_cursor(self) -> ElasticsearchPageCursor | None:
+        return self._page_cursor
+
+    async def execute(self) -> dict | None:
+        return await self._backend.search_page(self)
+
+    def get_cache_prefix(self) -> str:
+        return f'page-{self._index}'
+
+    def get_cache_params(self) -> dict:
+        return {
+            'command': 'page',
+            'index': self._index,
+            'body': self._body,
+        }
+
+    def get_cache_tags(self, result: dict | None) -> list[str]:
+        cache_tags = [create_index_cache_tag(index=self._index)]
+
+        if result is not None:
+            cache_tags.extend(
+                create_document_cache_tag(index=self._index, id=document['id'])
+                for document in result['results']
+                if 'id' in document
+            )
+
+        return cache_tags
+
+    def is_cacheable(self) -> bool:
+        # Pages behind a cursor are read from a point in time that belongs to a single client
+        return self._page_cursor is None
+
+
+@dataclasses.dataclass(kw_only=True)
+class ElasticsearchPageCursor:
+    query_hash: str
+    search_after: list
+    pit_id: str | None = None
+
+    def encode(self) -> str:
+        data = json.dumps(dataclasses.asdict(self), separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, page_cursor: str) -> ElasticsearchPageCursor:
+        try:
+            data = base64.urlsafe_b64decode(page_cursor + '=' * (-len(page_cursor) % 4))
+            cursor_dict = json.loads(data)
+
+            return cls(
+                query_hash=str(cursor_dict['query_hash']),
+                search_after=list(cursor_dict['search_after']),
+                pit_id=cursor_dict.get('pit_id'),
+            )
+
+        except (KeyError, TypeError, ValueError) as e:
+            raise InvalidPageCursorError from e
+
+
+def create_source_body(body: dict, *, source_fields: list[str] | None) -> dict:
+    if source_fields is None:
+        return body
+
+    return {
+        **body,
+        '_source': source_fields,
+    }
+
+
+def create_query_hash(body: dict) -> str:
+    query_body = {key: value for key, value in body.items() if key != 'from'}
+    query_data = json.dumps(query_body, sort_keys=True, separators=(',', ':')).encode()
+
+    return hashlib.sha256(query_data).hexdigest()[:16]
+
+
+# The ETL service evicts these tags when it indexes documents, it builds the same tag keys in
+# compose/etl/etl/cache/invalidators.py, so both have to be changed together
+def create_document_cache_tag(*, index: str, id: str) -> str:
+    return f'document-{index}-{id}'
+
+
+def create_index_cache_tag(*, index: str) -> str:
+    return f'index-{index}'
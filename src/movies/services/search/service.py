@@ -1,25 +1,49 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import contextlib
+import contextvars
+import logging
+from collections.abc import Iterator
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Request, Depends
 
 from .backends import (
     AbstractSearchBackend,
-    SearchBackendDep,
     AbstractQuery,
     AbstractCompiledQuery,
     AbstractGetQuery,
     AbstractSearchQuery,
+    AbstractPageQuery,
     AbstractQueryFactory,
 )
 from ..cache import (
     AbstractCache,
     AbstractCacheService,
-    CacheServiceDep,
+    CacheUnavailableError,
     ParameterizedCache,
+    SingleFlight,
+    get_cache_codec,
 )
+from ...core import settings
+from ...core.deadline import (
+    DeadlineExceededError,
+    detach_deadline,
+    get_remaining_time,
+)
+from ...core.metrics import (
+    ELASTICSEARCH_QUERY_DURATION,
+    SEARCH_CACHE_REQUESTS,
+)
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_KEY_PREFIX = 'search'
+SEARCH_CACHE_KEY_VERSION = '5.0'
+
+search_cache_tags: contextvars.ContextVar[set[str] | None] = contextvars.ContextVar('search_cache_tags', default=None)
 
 
 class AbstractSearchService(abc.ABC):
@@ -32,14 +56,29 @@ class AbstractSearchService(abc.ABC):
     @abc.abstractmethod
     async def search(self, *, query: AbstractSearchQuery) -> list[dict] | None: ...
 
+    @abc.abstractmethod
+    async def search_page(self, *, query: AbstractPageQuery) -> dict | None: ...
+
+    @abc.abstractmethod
+    async def invalidate(self, *, tag: str) -> None: ...
+
 
 class SearchService(AbstractSearchService):
     _backend: AbstractSearchBackend
     _cache: AbstractCache
+    _single_flight: SingleFlight
 
-    def __init__(self, *, backend: AbstractSearchBackend, cache_service: AbstractCacheService) -> None:
+    def __init__(self,
+                 *,
+                 backend: AbstractSearchBackend,
+                 cache_service: AbstractCacheService,
+                 single_flight: SingleFlight) -> None:
         self._backend = backend
-        self._cache = cache_service.get_cache(key_prefix='search')
+        self._cache = cache_service.get_cache(
+            key_prefix=SEARCH_CACHE_KEY_PREFIX,
+            key_version=SEARCH_CACHE_KEY_VERSION,
+        )
+        self._single_flight = single_flight
 
     def create_query(self) -> AbstractQueryFactory:
         return self._backend.create_query()
@@ -50,27 +89,159 @@ class SearchService(AbstractSearchService):
     async def search(self, *, query: AbstractSearchQuery) -> list[dict] | None:
         return await self._execute_query(query=query)
 
+    async def search_page(self, *, query: AbstractPageQuery) -> dict | None:
+        return await self._execute_query(query=query)
+
+    async def invalidate(self, *, tag: str) -> None:
+        await self._cache.invalidate(tag)
+
     async def _execute_query[TResult](self, *, query: AbstractQuery[TResult]) -> TResult | None:
-        cache = ParameterizedCache[AbstractCompiledQuery[TResult], TResult](cache=self._cache)
         compiled_query = query.compile()
-        result = await cache.get(params=compiled_query)
 
-        if result is not None:
-            return result
+        try:
+            async with asyncio.timeout(get_remaining_time()):
+                result = await self._load_query(compiled_query=compiled_query, query_name=type(query).__name__)
+
+        except TimeoutError as e:
+            raise DeadlineExceededError from e
 
-        result = await compiled_query.execute()
+        cache_tags = search_cache_tags.get()
 
-        if result is None:
-            return None
+        if cache_tags is not None:
+            cache_tags.update(compiled_query.get_cache_tags(result))
+
+        return result
 
-        await cache.set(params=compiled_query, value=result)
+    async def _load_query[TResult](self,
+                                   *,
+                                   compiled_query: AbstractCompiledQuery[TResult],
+                                   query_name: str) -> TResult | None:
+        cache = ParameterizedCache[AbstractCompiledQuery[TResult], TResult](
+            cache=self._cache,
+            codec=get_cache_codec(),
+            soft_expire_in_seconds=settings.redis.cache_soft_expire_in_seconds,
+            negative_expire_in_seconds=settings.redis.cache_negative_expire_in_seconds,
+        )
+
+        cache_prefix = compiled_query.get_cache_prefix()
+
+        if not compiled_query.is_cacheable():
+            SEARCH_CACHE_REQUESTS.labels(cache_prefix, 'bypass').inc()
+            return await self._execute_compiled_query(compiled_query=compiled_query, query_name=query_name)
+
+        cache_key = cache.get_key(params=compiled_query)
+
+        try:
+            cache_entry = await cache.get(params=compiled_query)
+
+        except CacheUnavailableError as e:
+            # Redis being down must not take the search down with it, queries go straight to the backend
+            logger.warning('Search cache is unavailable: %r', e.__cause__)
+            SEARCH_CACHE_REQUESTS.labels(cache_prefix, 'unavailable').inc()
+            return await self._execute_compiled_query(compiled_query=compiled_query, query_name=query_name)
+
+        if cache_entry is not None:
+            if cache_entry.is_stale:
+                SEARCH_CACHE_REQUESTS.labels(cache_prefix, 'stale').inc()
+                self._single_flight.schedule(
+                    f'search-refresh:{cache_key}',
+                    lambda: self._refresh_query(cache=cache, compiled_query=compiled_query, query_name=query_name),
+                )
+            else:
+                SEARCH_CACHE_REQUESTS.labels(cache_prefix, 'hit').inc()
+
+            return cache_entry.value
+
+        SEARCH_CACHE_REQUESTS.labels(cache_prefix, 'miss').inc()
+
+        return await self._single_flight.do(
+            f'search:{cache_key}',
+            lambda: self._recompute_query(cache=cache, compiled_query=compiled_query, query_name=query_name),
+        )
+
+    async def _recompute_query[TResult](self,
+                                        *,
+                                        cache: ParameterizedCache[AbstractCompiledQuery[TResult], TResult],
+                                        compiled_query: AbstractCompiledQuery[TResult],
+                                        query_name: str) -> TResult | None:
+        if not settings.redis.cache_lock_enabled:
+            return await self._fetch_query(cache=cache, compiled_query=compiled_query, query_name=query_name)
+
+        try:
+            async with cache.lock(params=compiled_query):
+                # Another replica may have recomputed the value while we were waiting for the lock
+                cache_entry = await cache.get(params=compiled_query)
+
+                if cache_entry is not None:
+                    return cache_entry.value
+
+                return await self._fetch_query(cache=cache, compiled_query=compiled_query, query_name=query_name)
+
+        except CacheUnavailableError as e:
+            logger.warning('Search cache lock is unavailable: %r', e.__cause__)
+            return await self._execute_compiled_query(compiled_query=compiled_query, query_name=query_name)
+
+    async def _refresh_query[TResult](self,
+                                      *,
+                                      cache: ParameterizedCache[AbstractCompiledQuery[TResult], TResult],
+                                      compiled_query: AbstractCompiledQuery[TResult],
+                                      query_name: str) -> None:
+        detach_deadline()
+
+        try:
+            if not settings.redis.cache_lock_enabled:
+                await self._fetch_query(cache=cache, compiled_query=compiled_query, query_name=query_name)
+                return
+
+            async with cache.lock(params=compiled_query, wait=False) as is_acquired:
+                # The stale value keeps being served while another replica refreshes it
+                if is_acquired:
+                    await self._fetch_query(cache=cache, compiled_query=compiled_query, query_name=query_name)
+
+        except Exception as e:
+            logger.exception(e)
+
+    async def _fetch_query[TResult](self,
+                                    *,
+                                    cache: ParameterizedCache[AbstractCompiledQuery[TResult], TResult],
+                                    compiled_query: AbstractCompiledQuery[TResult],
+                                    query_name: str) -> TResult | None:
+        result = await self._execute_compiled_query(compiled_query=compiled_query, query_name=query_name)
+        cache_tags = compiled_query.get_cache_tags(result)
+
+        try:
+            if result is None:
+                await cache.set_negative(params=compiled_query, tags=cache_tags)
+            else:
+                await cache.set(params=compiled_query, value=result, tags=cache_tags)
+
+        except CacheUnavailableError as e:
+            logger.warning('Search cache is unavailable: %r', e.__cause__)
 
         return result
 
+    async def _execute_compiled_query[TResult](self,
+                                               *,
+                                               compiled_query: AbstractCompiledQuery[TResult],
+                                               query_name: str) -> TResult:
+        with ELASTICSEARCH_QUERY_DURATION.labels(query_name).time():
+            return await compiled_query.execute()
+
+
+@contextlib.contextmanager
+def collect_search_cache_tags() -> Iterator[set[str]]:
+    cache_tags: set[str] = set()
+    token = search_cache_tags.set(cache_tags)
+
+    try:
+        yield cache_tags
+
+    finally:
+        search_cache_tags.reset(token)
+
 
-async def get_search_service(backend: SearchBackendDep,
-                             cache_service: CacheServiceDep) -> AbstractSearchService:
-    return SearchService(backend=backend, cache_service=cache_service)
+async def get_search_service(request: Request) -> AbstractSearchService:
+    return request.state.search_service
 
 
 SearchServiceDep = Annotated[AbstractSearchService, Depends(get_search_service)]
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import cast
+
+import elasticsearch
+import fakeredis
+import pytest
+import pytest_asyncio
+
+from movies.services.cache import SingleFlight
+from movies.services.cache.backends.redis import RedisCacheService
+from movies.services.search import SearchService
+from movies.services.search.backends.elasticsearch import (
+    ElasticsearchBatcher,
+    ElasticsearchSearchBackend,
+)
+
+
+class FakeElasticsearchClient:
+    documents: dict[str, dict[str, dict]]
+    mget_docs: list[dict]
+    latency_in_seconds: float
+    search_errors: list[Exception]
+    points_in_time: dict[str, str]
+    closed_points_in_time: list[str]
+
+    def __init__(self) -> None:
+        self.documents = {}
+        self.mget_docs = []
+        self.latency_in_seconds = 0.01
+        self.search_errors = []
+        self.points_in_time = {}
+        self.closed_points_in_time = []
+
+    async def mget(self, *, docs: list[dict]) -> dict:
+        self.mget_docs.extend(docs)
+        await asyncio.sleep(self.latency_in_seconds)
+
+        return {
+            'docs': [self._get(index=doc['_index'], id=doc['_id']) for doc in docs],
+        }
+
+    async def msearch(self, *, searches: list[dict]) -> dict:
+        await asyncio.sleep(self.latency_in_seconds)
+
+        return {
+            'responses': [
+                self._search(index=header['index'], body=body)
+                for header, body in zip(searches[::2], searches[1::2])
+            ],
+        }
+
+    async def open_point_in_time(self, *, index: str, keep_alive: str) -> dict:
+        pit_id = f'pit-{len(self.points_in_time)}'
+        self.points_in_time[pit_id] = index
+
+        return {'id': pit_id}
+
+    async def close_point_in_time(self, *, id: str) -> dict:
+        self.closed_points_in_time.append(id)
+
+        return {'succeeded': True}
+
+    async def search(self, *, body: dict) -> dict:
+        await asyncio.sleep(self.latency_in_seconds)
+
+        if self.search_errors:
+            raise self.search_errors.pop(0)
+
+        pit_id = body['pit']['id']
+        response = self._search(index=self.points_in_time[pit_id], body={**body, 'from': body['search_after'][0] + 1})
+
+        return {**response, 'pit_id': pit_id}
+
+    def _get(self, *, index: str, id: str) -> dict:
+        document = self.documents.get(index, {}).get(id)
+
+        if document is None:
+            return {'_index': index, '_id': id, 'found': False}
+
+        return {'_index': index, '_id': id, 'found': True, '_source': document}
+
+    def _search(self, *, index: str, body: dict) -> dict:
+        # Documents are returned in the order they were indexed, the query itself is ignored
+        offset = body.get('from', 0)
+        documents = list(self.documents.get(index, {}).values())[offset:offset + body['size']]
+
+        return {
+            'hits': {
+                'hits': [
+                    {'_source': document, 'sort': [offset + position]}
+                    for position, document in enumerate(documents)
+                ],
+            },
+        }
+
+
+@pytest_asyncio.fixture
+async def redis_client() -> AsyncGenerator[fakeredis.FakeAsyncRedis]:
+    redis_client = fakeredis.FakeAsyncRedis()
+
+    yield redis_client
+
+    await redis_client.aclose()
+
+
+@pytest.fixture
+def elasticsearch_client() -> FakeElasticsearchClient:
+    return FakeElasticsearchClient()
+
+
+@pytest_asyncio.fixture
+async def search_service(redis_client: fakeredis.FakeAsyncRedis,
+                         elasticsearch_client: FakeElasticsearchClient) -> AsyncGenerator[SearchService]:
+    client = cast(elasticsearch.AsyncElasticsearch, elasticsearch_client)
+    backend = ElasticsearchSearchBackend(
+        elasticsearch_client=client,
+        batcher=ElasticsearchBatcher(elasticsearch_client=client, window_in_seconds=0.001, max_size=100),
+    )
+
+    yield SearchService(
+        backend=backend,
+        cache_service=RedisCacheService(redis_client=redis_client),
+        single_flight=SingleFlight(),
+    )
+
+    # Background refreshes must not outlive the Redis client they write to
+    await wait_for_background_tasks()
+
+
+async def wait_for_background_tasks() -> None:
+    tasks = asyncio.all_tasks() - {asyncio.current_task()}
+    await asyncio.gather(*tasks, return_exceptions=True)
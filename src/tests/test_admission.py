@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from movies.api.admission import AdmissionLimiter, AdmissionRejectedError
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected() -> None:
+    limiter = AdmissionLimiter(max_concurrency=1, max_queue_size=1, queue_timeout_in_seconds=1)
+
+    async def wait_for_admission() -> None:
+        async with limiter.admit():
+            pass
+
+    async with limiter.admit():
+        waiting_task = asyncio.create_task(wait_for_admission())
+        await asyncio.sleep(0)
+        assert limiter.waiting_count == 1
+
+        with pytest.raises(AdmissionRejectedError):
+            await wait_for_admission()
+
+    await waiting_task
+
+    assert limiter.active_count == 0
+    assert limiter.waiting_count == 0
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_is_rejected() -> None:
+    limiter = AdmissionLimiter(max_concurrency=1, max_queue_size=1, queue_timeout_in_seconds=0.01)
+
+    async with limiter.admit():
+        with pytest.raises(AdmissionRejectedError):
+            async with limiter.admit():
+                pass
+
+        assert limiter.waiting_count == 0
+
+    assert limiter.active_count == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_is_handed_to_oldest_waiter() -> None:
+    limiter = AdmissionLimiter(max_concurrency=1, max_queue_size=2, queue_timeout_in_seconds=1)
+    admitted: list[int] = []
+
+    async def admit(number: int) -> None:
+        async with limiter.admit():
+            admitted.append(number)
+            await asyncio.sleep(0)
+
+    async with limiter.admit():
+        tasks = [asyncio.create_task(admit(number)) for number in range(2)]
+        await asyncio.sleep(0)
+        assert limiter.waiting_count == 2
+
+    # The released slot is handed over, a new request cannot overtake the waiting ones
+    assert limiter.active_count == 1
+    await admit(2)
+    await asyncio.gather(*tasks)
+
+    assert admitted == [0, 1, 2]
+    assert limiter.active_count == 0
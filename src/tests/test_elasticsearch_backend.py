@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import uuid
+
+import elasticsearch
+import pytest
+
+from movies.services.search import SearchService
+
+from .conftest import FakeElasticsearchClient
+
+INDEX_NAME_FILM = 'films'
+
+
+@pytest.mark.asyncio
+async def test_failed_page_closes_its_point_in_time(search_service: SearchService,
+                                                    elasticsearch_client: FakeElasticsearchClient) -> None:
+    films = [{'id': str(uuid.uuid4()), 'title': f'The Star {i}'} for i in range(3)]
+    elasticsearch_client.documents[INDEX_NAME_FILM] = {film['id']: film for film in films}
+
+    query_factory = search_service.create_query()
+    sort = {'field': 'id', 'order': 'asc'}
+
+    first_page = await search_service.search_page(
+        query=query_factory.films_list(sort=sort, page_number=1, page_size=2),
+    )
+    assert first_page is not None
+    assert first_page['next_page_cursor'] is not None
+
+    # The first attempt fails after opening a point in time, the retry opens one of its own
+    elasticsearch_client.search_errors.append(elasticsearch.ConnectionError('Connection refused'))
+
+    last_page = await search_service.search_page(
+        query=query_factory.films_list(
+            sort=sort,
+            page_number=1,
+            page_size=2,
+            page_cursor=first_page['next_page_cursor'],
+        ),
+    )
+    assert last_page is not None
+    assert last_page['results'] == films[2:]
+
+    assert list(elasticsearch_client.points_in_time) == ['pit-0', 'pit-1']
+    assert elasticsearch_client.closed_points_in_time == ['pit-0', 'pit-1']
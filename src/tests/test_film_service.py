@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from movies.core import settings
+from movies.services import FilmService
+from movies.services.search import SearchService
+from movies.services.search.backends import AbstractGetQuery
+
+from .conftest import FakeElasticsearchClient
+
+INDEX_NAME_FILM = 'films'
+INDEX_NAME_PERSON = 'persons'
+
+
+@pytest.mark.asyncio
+async def test_person_films_are_read_with_bounded_concurrency(monkeypatch: pytest.MonkeyPatch,
+                                                              search_service: SearchService,
+                                                              elasticsearch_client: FakeElasticsearchClient) -> None:
+    monkeypatch.setattr(settings.elasticsearch, 'person_films_concurrency', 4)
+
+    films = [{'id': str(uuid.uuid4()), 'title': f'The Star {i}'} for i in range(10)]
+    person_id = uuid.uuid4()
+    person = {
+        'id': str(person_id),
+        'full_name': 'George Lucas',
+        'films': [{'id': film['id'], 'roles': ['director']} for film in films],
+    }
+    elasticsearch_client.documents[INDEX_NAME_FILM] = {film['id']: film for film in films}
+    elasticsearch_client.documents[INDEX_NAME_PERSON] = {str(person_id): person}
+
+    get = search_service.get
+    active_gets_count = 0
+    max_active_gets_count = 0
+
+    async def tracked_get(*, query: AbstractGetQuery) -> dict | None:
+        nonlocal active_gets_count, max_active_gets_count
+
+        active_gets_count += 1
+        max_active_gets_count = max(max_active_gets_count, active_gets_count)
+
+        try:
+            return await get(query=query)
+
+        finally:
+            active_gets_count -= 1
+
+    monkeypatch.setattr(search_service, 'get', tracked_get)
+
+    person_films = await FilmService(search_service=search_service).get_list_by_person(person_id)
+
+    assert [film['id'] for film in person_films] == [film['id'] for film in films]
+    assert max_active_gets_count == 4
+    # Every film is fetched from Elasticsearch once, the bounded lookups are still batched
+    film_mget_docs = [doc for doc in elasticsearch_client.mget_docs if doc['_index'] == INDEX_NAME_FILM]
+    assert len(film_mget_docs) == len(films)
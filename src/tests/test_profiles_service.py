@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import uuid
+
+import fakeredis
+import httpx
+import pytest
+
+from movies.services.cache import SingleFlight
+from movies.services.cache.backends.redis import RedisCacheService
+from movies.services.http import CircuitBreakerState
+from movies.services.profiles import (
+    FilmUsers,
+    ProfilesService,
+    ProfilesServiceClient,
+    create_profiles_circuit_breaker,
+)
+
+
+@pytest.mark.parametrize(
+    'response',
+    [
+        httpx.Response(500),
+        httpx.Response(401),
+        httpx.Response(200, json={'rating': 'invalid'}),
+        httpx.Response(200, text='<html></html>'),
+    ],
+)
+@pytest.mark.asyncio
+async def test_film_users_are_skipped_on_failure(redis_client: fakeredis.FakeAsyncRedis,
+                                                 response: httpx.Response) -> None:
+    circuit_breaker = create_profiles_circuit_breaker()
+    profiles_service = ProfilesService(
+        profiles_service_client=ProfilesServiceClient(
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: response)),
+            circuit_breaker=circuit_breaker,
+        ),
+        cache_service=RedisCacheService(redis_client=redis_client),
+        single_flight=SingleFlight(),
+    )
+
+    # The film is served without user data, and every failed call counts towards opening the breaker
+    for _ in range(20):
+        assert await profiles_service.get_film_users(film_id=uuid.uuid4(), token=None) is None
+
+    assert circuit_breaker.state == CircuitBreakerState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_film_users_are_empty_without_permission(redis_client: fakeredis.FakeAsyncRedis) -> None:
+    circuit_breaker = create_profiles_circuit_breaker()
+    profiles_service = ProfilesService(
+        profiles_service_client=ProfilesServiceClient(
+            httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(403))),
+            circuit_breaker=circuit_breaker,
+        ),
+        cache_service=RedisCacheService(redis_client=redis_client),
+        single_flight=SingleFlight(),
+    )
+
+    film_users = await profiles_service.get_film_users(film_id=uuid.uuid4(), token=None)
+
+    assert film_users == FilmUsers(rating=None, reviews=None)
+    assert circuit_breaker.state == CircuitBreakerState.CLOSED
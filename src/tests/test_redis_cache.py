@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from movies.services.cache.backends.redis import RedisCache, create_redis_circuit_breaker
+from movies.services.http import CircuitBreakerState
+
+
+@pytest.mark.asyncio
+async def test_contended_lock_does_not_open_breaker(redis_client: fakeredis.FakeAsyncRedis) -> None:
+    circuit_breaker = create_redis_circuit_breaker()
+    cache = RedisCache(redis_client=redis_client, circuit_breaker=circuit_breaker, key_prefix='test')
+
+    async with cache.lock('film') as is_acquired:
+        assert is_acquired
+
+        # Every waiter gives up after the lock wait, which is longer than a single Redis command may take
+        contended_locks = [cache.lock('film') for _ in range(20)]
+        results = await asyncio.gather(*(lock.acquire() for lock in contended_locks))
+
+        assert not any(results)
+
+    assert circuit_breaker.state == CircuitBreakerState.CLOSED
+
+    async with cache.lock('film') as is_acquired:
+        assert is_acquired
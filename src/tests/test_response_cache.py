@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import fakeredis
+import pytest
+from fastapi import Request, Response
+
+from movies.api.v1.cache import ResponseCache
+from movies.services.cache.backends.redis import RedisCacheService
+
+
+def create_response_cache(redis_client: fakeredis.FakeAsyncRedis) -> ResponseCache:
+    request = Request({
+        'type': 'http',
+        'method': 'GET',
+        'path': '/api/v1/films/',
+        'query_string': b'',
+        'headers': [],
+    })
+
+    return ResponseCache(
+        request=request,
+        cache_service=RedisCacheService(redis_client=redis_client),
+        permission_class='user',
+    )
+
+
+@pytest.mark.asyncio
+async def test_response_is_cached_with_etag(redis_client: fakeredis.FakeAsyncRedis) -> None:
+    response = await create_response_cache(redis_client).set(Response(content=b'[]'), tags=[])
+
+    assert response.headers['ETag']
+
+    cached_response = await create_response_cache(redis_client).get()
+
+    assert cached_response is not None
+    assert cached_response.body == b'[]'
+    assert cached_response.headers['ETag'] == response.headers['ETag']
+
+
+@pytest.mark.asyncio
+async def test_skipped_response_is_not_cached(redis_client: fakeredis.FakeAsyncRedis) -> None:
+    # Degraded responses, such as a film without the users of an unavailable profiles service, are skipped
+    response_cache = create_response_cache(redis_client)
+    response_cache.skip()
+    response = Response(content=b'[]')
+
+    assert await response_cache.set(response, tags=[]) is response
+    assert 'ETag' not in response.headers
+    assert await create_response_cache(redis_client).get() is None
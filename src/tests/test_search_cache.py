@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import fakeredis
+import pytest
+
+from movies.core import settings
+from movies.services.search import SearchService
+from movies.services.search.backends.elasticsearch.query import create_index_cache_tag
+
+from .conftest import FakeElasticsearchClient
+
+INDEX_NAME_FILM = 'films'
+
+
+def create_film(film_id: uuid.UUID) -> dict:
+    return {
+        'id': str(film_id),
+        'title': 'The Star',
+        'imdb_rating': 8.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced(search_service: SearchService,
+                                               elasticsearch_client: FakeElasticsearchClient) -> None:
+    film_id = uuid.uuid4()
+    elasticsearch_client.documents[INDEX_NAME_FILM] = {str(film_id): create_film(film_id)}
+    query = search_service.create_query().get_film(film_id=film_id)
+
+    results = await asyncio.gather(*(search_service.get(query=query) for _ in range(10)))
+
+    assert results == [create_film(film_id)] * 10
+    assert len(elasticsearch_client.mget_docs) == 1
+
+    # The coalesced result is cached, so the next request does not reach Elasticsearch at all
+    assert await search_service.get(query=query) == create_film(film_id)
+    assert len(elasticsearch_client.mget_docs) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_value_is_served_while_refreshed(search_service: SearchService,
+                                                     elasticsearch_client: FakeElasticsearchClient,
+                                                     monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.redis, 'cache_soft_expire_in_seconds', 0)
+
+    film_id = uuid.uuid4()
+    film = create_film(film_id)
+    elasticsearch_client.documents[INDEX_NAME_FILM] = {str(film_id): film}
+    query = search_service.create_query().get_film(film_id=film_id)
+
+    assert await search_service.get(query=query) == film
+
+    updated_film = {**film, 'title': 'The Star Returns'}
+    elasticsearch_client.documents[INDEX_NAME_FILM][str(film_id)] = updated_film
+
+    # The stale value is returned at once, the refresh runs in the background
+    assert await search_service.get(query=query) == film
+
+    async with asyncio.timeout(1):
+        while await search_service.get(query=query) != updated_film:
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_negative_entry_expires(search_service: SearchService,
+                                      redis_client: fakeredis.FakeAsyncRedis,
+                                      elasticsearch_client: FakeElasticsearchClient,
+                                      monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings.redis, 'cache_negative_expire_in_seconds', 1)
+
+    film_id = uuid.uuid4()
+    query = search_service.create_query().get_film(film_id=film_id)
+
+    assert await search_service.get(query=query) is None
+
+    cache_keys = await redis_client.keys('search:*:get-films-*')
+    assert len(cache_keys) == 1
+    assert 0 < await redis_client.ttl(cache_keys[0]) <= 1
+
+    # The film is indexed after the miss, but the negative entry keeps being served until it expires
+    elasticsearch_client.documents[INDEX_NAME_FILM] = {str(film_id): create_film(film_id)}
+
+    assert await search_service.get(query=query) is None
+    assert len(elasticsearch_client.mget_docs) == 1
+
+    await asyncio.sleep(1.1)
+
+    assert await search_service.get(query=query) == create_film(film_id)
+    assert len(elasticsearch_client.mget_docs) == 2
+
+
+@pytest.mark.asyncio
+async def test_indexing_evicts_pages_of_the_index(search_service: SearchService,
+                                                  elasticsearch_client: FakeElasticsearchClient) -> None:
+    film_ids = [uuid.uuid4(), uuid.uuid4()]
+    elasticsearch_client.documents[INDEX_NAME_FILM] = {str(film_ids[0]): create_film(film_ids[0])}
+    query = search_service.create_query().films_list(sort={'field': 'id', 'order': 'asc'}, page_number=1, page_size=10)
+
+    page = await search_service.search_page(query=query)
+    assert page is not None
+    assert page['results'] == [create_film(film_ids[0])]
+
+    # The new film is not in any cached page, so only the index tag can evict them
+    elasticsearch_client.documents[INDEX_NAME_FILM][str(film_ids[1])] = create_film(film_ids[1])
+    await search_service.invalidate(tag=create_index_cache_tag(index=INDEX_NAME_FILM))
+
+    page = await search_service.search_page(query=query)
+    assert page is not None
+    assert page['results'] == [create_film(film_id) for film_id in film_ids]
@@ -76,6 +76,7 @@ class Settings(BaseSettings):
 
     movies_url: str = 'http://localhost:8000'
     auth_service_url: str = 'http://localhost:8000'
+    profiles_service_url: str = 'http://localhost:8000'
 
     @property
     def movies_api_url(self) -> str:
@@ -93,5 +94,13 @@ class Settings(BaseSettings):
     def auth_api_v1_url(self) -> str:
         return urljoin(self.auth_api_url, 'v1/')
 
+    @property
+    def profiles_api_url(self) -> str:
+        return urljoin(self.profiles_service_url, '/profiles/api/')
+
+    @property
+    def profiles_api_v1_url(self) -> str:
+        return urljoin(self.profiles_api_url, 'v1/')
+
 
 settings = Settings()
@@ -19,6 +19,8 @@ from ....utils.elasticsearch.models import (
     FilmDirector,
     FilmActor,
     FilmWriter,
+    Person,
+    PersonFilmRelation,
 )
 from ....utils.redis import RedisCache
 
@@ -26,6 +28,7 @@ from ....utils.redis import RedisCache
 class BasePersonFilmsTestCase:
     _redis_cache: RedisCache
     _films_index: ElasticsearchIndex[Film]
+    _persons_index: ElasticsearchIndex[Person]
     _aiohttp_session: aiohttp.ClientSession
     _headers: dict
     _films_count: int
@@ -34,10 +37,12 @@ class BasePersonFilmsTestCase:
                  *,
                  redis_cache: RedisCache,
                  films_index: ElasticsearchIndex[Film],
+                 persons_index: ElasticsearchIndex[Person],
                  aiohttp_session: aiohttp.ClientSession,
                  headers: dict,
                  films_count: int = 3) -> None:
         self._films_index = films_index
+        self._persons_index = persons_index
         self._aiohttp_session = aiohttp_session
         self._headers = headers
         self._redis_cache = redis_cache
@@ -46,9 +51,11 @@ class BasePersonFilmsTestCase:
     async def run(self) -> None:
         films = list(self.create_films())
         await self.save_films_to_elasticsearch(films=films)
+        await self.save_persons_to_elasticsearch(persons=list(self.create_persons(films=films)))
         await self._run_tests(films=films)
 
         await self._films_index.delete_index()
+        await self._persons_index.delete_index()
         await self._run_tests(films=films)
 
         await self._redis_cache.clear()
@@ -102,6 +109,31 @@ class BasePersonFilmsTestCase:
 
         await self._films_index.load_documents(documents=films)
 
+    def create_persons(self, *, films: Iterable[Film]) -> Iterable[Person]:
+        # Person documents list their films, the same way the ETL service builds them
+        persons: dict[uuid.UUID, Person] = {}
+
+        for film in films:
+            for role, film_persons_list in cast(Iterable[tuple[str, Iterable[FilmPerson]]], [
+                ('director', film.directors),
+                ('actor', film.actors),
+                ('writer', film.writers),
+            ]):
+                for film_person in film_persons_list:
+                    person = persons.setdefault(film_person.id, Person(
+                        id=film_person.id,
+                        full_name=film_person.full_name,
+                    ))
+                    person.films.append(PersonFilmRelation(id=film.id, roles=[role]))
+
+        return persons.values()
+
+    async def save_persons_to_elasticsearch(self, *, persons: list[Person]) -> None:
+        if not persons:
+            return
+
+        await self._persons_index.load_documents(documents=persons)
+
     def get_film_person(self, *, films: Iterable[Film], role: str) -> FilmPerson | None:
         for film in films:
             film_persons_list: Sequence[FilmPerson]
@@ -206,10 +238,12 @@ async def test_person_films_list_empty(
         auth_headers,
 ) -> None:
     films_index = await create_elasticsearch_index(index_name='films')
+    persons_index = await create_elasticsearch_index(index_name='persons')
 
     await PersonFilmsListEmptyTestCase(
         redis_cache=redis_cache,
         films_index=films_index,
+        persons_index=persons_index,
         aiohttp_session=aiohttp_session,
         headers=auth_headers,
     ).run()
@@ -223,10 +257,12 @@ async def test_person_films(
         auth_headers,
 ) -> None:
     films_index = await create_elasticsearch_index(index_name='films')
+    persons_index = await create_elasticsearch_index(index_name='persons')
 
     await PersonFilmsTestCase(
         redis_cache=redis_cache,
         films_index=films_index,
+        persons_index=persons_index,
         aiohttp_session=aiohttp_session,
         headers=auth_headers,
     ).run()
@@ -240,10 +276,12 @@ async def test_person_films_not_found(
         auth_headers,
 ) -> None:
     films_index = await create_elasticsearch_index(index_name='films')
+    persons_index = await create_elasticsearch_index(index_name='persons')
 
     await PersonFilmsNotFoundTestCase(
         redis_cache=redis_cache,
         films_index=films_index,
+        persons_index=persons_index,
         aiohttp_session=aiohttp_session,
         headers=auth_headers,
     ).run()
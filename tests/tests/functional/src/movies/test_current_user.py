@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import http
+import json
+import time
+import uuid
+from urllib.parse import urljoin
+
+import pytest
+import redis.asyncio as redis
+
+from ...settings import settings
+
+INDEX_NAME_FILM = 'films'
+CURRENT_USER_CACHE_KEY_PREFIX = 'current-user:1.0'
+
+
+def create_current_user_cache_key(token: str) -> str:
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    return f'{CURRENT_USER_CACHE_KEY_PREFIX}:{token_hash}'
+
+
+def create_unsigned_token() -> str:
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip('=')
+
+    header = encode({'alg': 'HS256', 'typ': 'JWT'})
+    payload = encode({'sub': str(uuid.uuid4()), 'exp': int(time.time()) + 3600})
+
+    return f'{header}.{payload}.invalid-signature'
+
+
+def create_headers(token: str) -> dict:
+    return {
+        'accept': 'application/json',
+        'Authorization': f'Bearer {token}',
+        'X-Request-Id': str(uuid.uuid4()),
+    }
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_current_user_cached_lookup_skips_auth(create_elasticsearch_index,
+                                                     aiohttp_session,
+                                                     redis_client: redis.Redis) -> None:
+    await create_elasticsearch_index(index_name=INDEX_NAME_FILM)
+
+    # The auth service rejects this token, so only a cached lookup can let it through
+    token = create_unsigned_token()
+    films_url = urljoin(settings.movies_api_v1_url, 'films/')
+
+    async with aiohttp_session.get(films_url, headers=create_headers(token)) as response:
+        assert response.status == http.HTTPStatus.UNAUTHORIZED
+
+    current_user_data: dict = {
+        'id': str(uuid.uuid4()),
+        'login': 'cached-user',
+        'email': None,
+        'is_superuser': False,
+        'permissions': [],
+    }
+    await redis_client.set(create_current_user_cache_key(token), json.dumps(current_user_data), ex=60)
+
+    async with aiohttp_session.get(films_url, headers=create_headers(token)) as response:
+        assert response.status == http.HTTPStatus.OK
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_current_user_cache_logout(create_elasticsearch_index,
+                                         aiohttp_session,
+                                         redis_client: redis.Redis) -> None:
+    await create_elasticsearch_index(index_name=INDEX_NAME_FILM)
+
+    login_url = urljoin(settings.auth_api_v1_url, 'jwt/login/')
+    login_data = {
+        'grant_type': 'password',
+        'username': settings.auth_superuser.login,
+        'password': settings.auth_superuser.password,
+    }
+
+    async with aiohttp_session.post(login_url, data=login_data) as response:
+        assert response.status == http.HTTPStatus.OK
+        response_data = await response.json()
+
+    access_token = response_data['access_token']
+    cache_key = create_current_user_cache_key(access_token)
+    films_url = urljoin(settings.movies_api_v1_url, 'films/')
+
+    async with aiohttp_session.get(films_url, headers=create_headers(access_token)) as response:
+        assert response.status == http.HTTPStatus.OK
+
+    assert await redis_client.exists(cache_key)
+
+    logout_url = urljoin(settings.auth_api_v1_url, 'jwt/logout/')
+
+    async with aiohttp_session.post(logout_url, headers=create_headers(access_token)) as response:
+        assert response.status == http.HTTPStatus.NO_CONTENT
+
+    # Revocation events are delivered to the movies service asynchronously, the entry must be evicted on delivery
+    async with asyncio.timeout(5):
+        while await redis_client.exists(cache_key):
+            await asyncio.sleep(0.05)
+
+    async with aiohttp_session.get(films_url, headers=create_headers(access_token)) as response:
+        assert response.status == http.HTTPStatus.UNAUTHORIZED
@@ -268,3 +268,59 @@ async def test_get_by_id_from_redis(
         data = await response.json()
 
         assert data['uuid'] == expected['uuid']
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_list_page_cursor(
+        create_elasticsearch_index,
+        aiohttp_session,
+        auth_headers,
+):
+    films = [
+        Film(
+            title=f'The star. Episode {i}',
+            description=f'Description {i}',
+            rating=round(random.uniform(1.0, 10.0), 1),
+        )
+        for i in range(15)
+    ]
+
+    elastic = await create_elasticsearch_index(index_name=INDEX_NAME_FILM)
+    await elastic.load_documents(documents=films)
+
+    url = urljoin(settings.movies_api_v1_url, 'films/')
+    params = {'page_size': 10}
+
+    async with aiohttp_session.get(url, params=params, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.OK
+        first_page = await response.json()
+        page_cursor = response.headers.get('X-Next-Page-Cursor')
+
+    assert len(first_page) == 10
+    assert page_cursor
+
+    cursor_params = {**params, 'page_cursor': page_cursor}
+
+    async with aiohttp_session.get(url, params=cursor_params, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.OK
+        last_page = await response.json()
+
+        # The last page is shorter than the page size, so there is nothing after it
+        assert 'X-Next-Page-Cursor' not in response.headers
+
+    film_ids = {film['uuid'] for film in first_page + last_page}
+    assert film_ids == {str(film.id) for film in films}
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_list_invalid_page_cursor(
+        create_elasticsearch_index,
+        aiohttp_session,
+        auth_headers,
+):
+    await create_elasticsearch_index(index_name=INDEX_NAME_FILM)
+
+    url = urljoin(settings.movies_api_v1_url, 'films/')
+
+    async with aiohttp_session.get(url, params={'page_cursor': 'invalid'}, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.BAD_REQUEST
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import http
+from urllib.parse import urljoin
+
+import pytest
+
+from ...settings import settings
+from ...utils.elasticsearch.models import Film
+
+INDEX_NAME_FILM = 'films'
+
+
+def create_films(count: int) -> list[Film]:
+    return [
+        Film(
+            title=f'The star. Episode {i}',
+            description=f'Description {i}',
+            rating=5.0,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_list_etag(
+        create_elasticsearch_index,
+        aiohttp_session,
+        auth_headers,
+):
+    elastic = await create_elasticsearch_index(index_name=INDEX_NAME_FILM)
+    await elastic.load_documents(documents=create_films(5))
+
+    url = urljoin(settings.movies_api_v1_url, 'films/')
+
+    async with aiohttp_session.get(url, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.OK
+        etag = response.headers.get('ETag')
+        data = await response.json()
+
+    assert etag
+    assert len(data) == 5
+
+    # The cached response carries the same validator as the rendered one
+    async with aiohttp_session.get(url, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.OK
+        assert response.headers.get('ETag') == etag
+        assert await response.json() == data
+
+    for if_none_match in (etag, f'W/{etag}', f'"other", {etag}', '*'):
+        async with aiohttp_session.get(url, headers={**auth_headers, 'If-None-Match': if_none_match}) as response:
+            assert response.status == http.HTTPStatus.NOT_MODIFIED
+            assert response.headers.get('ETag') == etag
+            assert await response.read() == b''
+
+    async with aiohttp_session.get(url, headers={**auth_headers, 'If-None-Match': '"other"'}) as response:
+        assert response.status == http.HTTPStatus.OK
+        assert await response.json() == data
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_get_list_page_cursor_is_not_cached(
+        create_elasticsearch_index,
+        aiohttp_session,
+        auth_headers,
+):
+    elastic = await create_elasticsearch_index(index_name=INDEX_NAME_FILM)
+    await elastic.load_documents(documents=create_films(15))
+
+    url = urljoin(settings.movies_api_v1_url, 'films/')
+    params = {'page_size': 10}
+
+    async with aiohttp_session.get(url, params=params, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.OK
+        assert response.headers.get('ETag')
+        page_cursor = response.headers['X-Next-Page-Cursor']
+
+    cursor_params = {**params, 'page_cursor': page_cursor}
+
+    # Cursor pages belong to the point in time of a single client, so they get neither an entry nor a validator
+    for _ in range(2):
+        async with aiohttp_session.get(url, params=cursor_params, headers=auth_headers) as response:
+            assert response.status == http.HTTPStatus.OK
+            assert 'ETag' not in response.headers
+            assert len(await response.json()) == 5
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import decimal
+import http
+import uuid
+from urllib.parse import urljoin
+
+import aiohttp
+import pytest
+
+from ...settings import settings
+
+
+async def create_profile(aiohttp_session: aiohttp.ClientSession, *, headers: dict, user_id: uuid.UUID) -> None:
+    url = urljoin(settings.profiles_api_v1_url, f'profiles/user/{user_id}')
+    data = {
+        'last_name': 'Smith',
+        'first_name': 'John',
+    }
+
+    async with aiohttp_session.post(url, headers=headers, json=data) as response:
+        assert response.status == http.HTTPStatus.CREATED
+
+
+async def create_rating(aiohttp_session: aiohttp.ClientSession,
+                        *,
+                        headers: dict,
+                        user_id: uuid.UUID,
+                        film_id: uuid.UUID,
+                        rating: str) -> None:
+    url = urljoin(settings.profiles_api_v1_url, f'ratings/user/{user_id}/film/{film_id}')
+
+    async with aiohttp_session.post(url, headers=headers, json={'rating': rating}) as response:
+        assert response.status == http.HTTPStatus.CREATED
+
+
+async def create_review(aiohttp_session: aiohttp.ClientSession,
+                        *,
+                        headers: dict,
+                        user_id: uuid.UUID,
+                        film_id: uuid.UUID,
+                        rating: str | None) -> None:
+    url = urljoin(settings.profiles_api_v1_url, f'reviews/user/{user_id}/film/{film_id}')
+    data = {
+        'summary': 'Summary',
+        'content': 'Content',
+        'rating': rating,
+    }
+
+    async with aiohttp_session.post(url, headers=headers, json=data) as response:
+        assert response.status == http.HTTPStatus.CREATED
+
+
+def parse_rating(rating: str | float | None) -> decimal.Decimal | None:
+    return None if rating is None else decimal.Decimal(str(rating))
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_film_summary(aiohttp_session: aiohttp.ClientSession, auth_headers: dict) -> None:
+    film_id = uuid.uuid4()
+    user_ids = [uuid.uuid4(), uuid.uuid4()]
+
+    for user_id, rating, review_rating in zip(user_ids, ['8', '5'], ['7', None]):
+        await create_profile(aiohttp_session, headers=auth_headers, user_id=user_id)
+        await create_rating(aiohttp_session, headers=auth_headers, user_id=user_id, film_id=film_id, rating=rating)
+        await create_review(
+            aiohttp_session,
+            headers=auth_headers,
+            user_id=user_id,
+            film_id=film_id,
+            rating=review_rating,
+        )
+
+    url = urljoin(settings.profiles_api_v1_url, f'films/{film_id}/summary')
+
+    async with aiohttp_session.get(url, headers=auth_headers, params={'page_size': 1}) as response:
+        assert response.status == http.HTTPStatus.OK
+        response_data = await response.json()
+
+    # The aggregates cover every rating and review of the film, not only the requested page of reviews
+    assert parse_rating(response_data['rating']['rating']) == decimal.Decimal('6.5')
+    assert parse_rating(response_data['reviews']['rating']) == decimal.Decimal('7.0')
+    assert len(response_data['reviews']['reviews']) == 1
+    assert response_data['reviews']['reviews'][0]['film_id'] == str(film_id)
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_film_summary_without_reviews(aiohttp_session: aiohttp.ClientSession, auth_headers: dict) -> None:
+    url = urljoin(settings.profiles_api_v1_url, f'films/{uuid.uuid4()}/summary')
+
+    async with aiohttp_session.get(url, headers=auth_headers) as response:
+        assert response.status == http.HTTPStatus.OK
+        response_data = await response.json()
+
+    assert response_data == {
+        'rating': {'rating': None},
+        'reviews': {'reviews': [], 'rating': None},
+    }